@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""
+EcoChain Guardian - ML Inference Latency Benchmark
+
+Checks that TreeEngine matches the sklearn scoring pipeline and isolation
+forest, then compares single-row and batch latency of both paths.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from ecochain.analysis_module.ml_scoring import MLSustainabilityScorer
+from ecochain.analysis_module.tree_engine import TreeEngine
+
+TRAINING_SIZE = 5000
+PARITY_SIZE = 20000
+LATENCY_ROWS = 2000
+BATCH_SIZE = 10000
+
+
+def percentiles(samples):
+    """p50 and p99 of a list of durations, in microseconds"""
+    samples = sorted(samples)
+    return samples[len(samples) // 2] * 1e6, samples[int(len(samples) * 0.99)] * 1e6
+
+
+def time_rows(fn, rows):
+    """Time fn on each row separately"""
+    fn(rows[0])
+    samples = []
+    for row in rows:
+        start = time.perf_counter()
+        fn(row)
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def best_of(fn, repeats=3):
+    """Shortest of several runs of fn, in seconds"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def check_parity(scorer, engine, X):
+    """Assert that the engine agrees with sklearn on every row"""
+    scores, anomaly_scores, is_anomaly = engine.score_batch(X)
+    expected_scores = scorer.scoring_pipeline.predict(X)
+    expected_anomaly = scorer.anomaly_detector.score_samples(X)
+    expected_flags = scorer.anomaly_detector.predict(X) == -1
+
+    np.testing.assert_allclose(scores, expected_scores, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(anomaly_scores, expected_anomaly, rtol=1e-12, atol=1e-12)
+    assert np.array_equal(is_anomaly, expected_flags)
+
+    for x, score, anomaly_score, flag in zip(X[:1000], scores, anomaly_scores, is_anomaly):
+        row = engine.score_row(x)
+        assert np.isclose(row[0], score, rtol=1e-12) and np.isclose(row[1], anomaly_score, rtol=1e-12)
+        assert row[2] == flag
+
+    print(f"parity: {len(X)} rows, max score error {np.abs(scores - expected_scores).max():.1e}, "
+          f"{int(is_anomaly.sum())} anomalies flagged identically")
+
+
+def main():
+    """Run the parity check and the benchmark"""
+    scorer = MLSustainabilityScorer(n_jobs=None)
+    scorer.train(scorer.generate_training_data(TRAINING_SIZE, seed=1))
+
+    start = time.perf_counter()
+    engine = TreeEngine.from_models(scorer.scoring_pipeline, scorer.anomaly_detector)
+    build = time.perf_counter() - start
+
+    X = scorer.generate_training_data(PARITY_SIZE, seed=2).features
+    # Include rows outside the training distribution
+    X[::7] *= 3
+    check_parity(scorer, engine, X)
+
+    rows = X[:LATENCY_ROWS]
+
+    def sklearn_row(x):
+        features = x.reshape(1, -1)
+        scorer.scoring_pipeline.predict(features)
+        scorer.anomaly_detector.score_samples(features)
+        scorer.anomaly_detector.predict(features)
+
+    en50, en99 = time_rows(engine.score_row, rows)
+    sk50, sk99 = time_rows(sklearn_row, rows[:200])
+
+    batch = X[:BATCH_SIZE]
+    sk_batch = best_of(lambda: (scorer.scoring_pipeline.predict(batch), scorer.anomaly_detector.score_samples(batch)))
+    en_batch = best_of(lambda: engine.score_batch(batch))
+
+    print(f"engine build: {build * 1e3:.1f} ms")
+    print(f"{'single row':<16}{'p50 (us)':>12}{'p99 (us)':>12}")
+    print(f"{'sklearn':<16}{sk50:>12.1f}{sk99:>12.1f}")
+    print(f"{'TreeEngine':<16}{en50:>12.1f}{en99:>12.1f}")
+    print(f"batch of {BATCH_SIZE}: sklearn {sk_batch * 1e3:.1f} ms, TreeEngine {en_batch * 1e3:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+"""
+EcoChain Guardian - Oracle Signature Verification Benchmark
+
+Measures raw batch verification throughput, in process and on a process
+pool, and the cost of OracleNetwork.submit_response when responses arrive
+at 1,000 per second with inline and background verification.
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ecochain.oracles.data_provider import DataProvider
+from ecochain.oracles.oracle_network import OracleNetwork
+from ecochain.oracles.verification import sign_response, verify_batch
+
+RATE = 1000  # Responses per second
+DURATION = 3.0  # Seconds of paced submissions
+PROVIDERS = 10
+POOL_WORKERS = 4
+
+
+class BenchProvider(DataProvider):
+    """Provider that is never notified; responses are submitted directly"""
+
+    def fetch_data(self, data_type, parameters):
+        return 0.0
+
+
+def make_payload(i):
+    """A response payload shaped like an energy mix"""
+    return {"coal": 30.0 + i % 7, "gas": 25.0, "wind": 10.0 + i % 3, "solar": 5.0, "hydro": 30.0 - i % 7}
+
+
+def bench_raw(count=20000):
+    """Print verification throughput for a single process and a process pool"""
+    items = []
+    for i in range(count):
+        data = make_payload(i)
+        key = f"key-{i % PROVIDERS}"
+        items.append((f"req-{i}", data, sign_response(f"req-{i}", data, key), key))
+
+    start = time.perf_counter()
+    assert all(verify_batch(items))
+    single = count / (time.perf_counter() - start)
+
+    with ProcessPoolExecutor(max_workers=POOL_WORKERS) as pool:
+        chunk = -(-count // POOL_WORKERS)
+        chunks = [items[i:i + chunk] for i in range(0, count, chunk)]
+        list(pool.map(verify_batch, chunks))  # warm up the workers
+        start = time.perf_counter()
+        results = [r for part in pool.map(verify_batch, chunks) for r in part]
+        pooled = count / (time.perf_counter() - start)
+    assert all(results)
+
+    print(f"raw verify_batch, 1 process:       {single:>10,.0f} responses/s")
+    print(f"raw verify_batch, {POOL_WORKERS} processes:     {pooled:>10,.0f} responses/s")
+
+
+def bench_network(mode, workers=0):
+    """Submit paced responses to a network and report submission latency"""
+    network = OracleNetwork({
+        "verification_mode": mode,
+        "verification_workers": workers,
+        "require_signatures": True,
+        "retention_max_requests": 10 ** 7
+    })
+    providers = [
+        BenchProvider(f"bench-{i}", ["unused"], {"private_key": f"key-{i}"})
+        for i in range(PROVIDERS)
+    ]
+    for provider in providers:
+        network.register_provider(provider)
+
+    total = int(RATE * DURATION)
+    request_ids = [
+        network.submit_request("bench", {}, "bench", min_providers=PROVIDERS, min_reputation=0.0)
+        for _ in range(total // PROVIDERS)
+    ]
+    responses = []
+    for n, request_id in enumerate(request_ids):
+        for provider in providers:
+            data = make_payload(n)
+            responses.append((request_id, provider.provider_id, data,
+                              sign_response(request_id, data, provider.private_key)))
+
+    latencies = []
+    start = time.perf_counter()
+    for i, response in enumerate(responses):
+        # Pace submissions to RATE per second
+        delay = start + i / RATE - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        t = time.perf_counter()
+        network.submit_response(*response)
+        latencies.append(time.perf_counter() - t)
+    submitted = time.perf_counter()
+
+    # Wait for background verification to catch up
+    while any(network.get_request_status(r)["status"] == "PENDING" for r in request_ids[-10:]):
+        time.sleep(0.005)
+    drained = time.perf_counter()
+
+    finalized = sum(1 for r in request_ids if network.get_request_status(r)["status"] == "FINALIZED")
+    network.shutdown()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    label = f"{mode}" + (f" ({workers} processes)" if workers else "")
+    print(f"{label:<28}{p50:>10.1f}{p99:>10.1f}{(drained - submitted) * 1e3:>12.1f}"
+          f"{finalized:>8}/{len(request_ids)}")
+
+
+def main():
+    """Run the benchmarks"""
+    logging.disable(logging.WARNING)
+    bench_raw()
+    print()
+    print(f"{RATE} responses/s for {DURATION:.0f}s")
+    print(f"{'verification':<28}{'p50 (us)':>10}{'p99 (us)':>10}{'drain (ms)':>12}{'finalized':>13}")
+    bench_network("inline")
+    bench_network("background")
+    bench_network("background", POOL_WORKERS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+"""
+EcoChain Guardian - Sustainability Scoring Benchmark
+
+Checks that SustainabilityScorer.score_batch matches score_operation
+bit for bit, then compares their runtime over a fleet of operations.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from ecochain.analysis_module.sustainability_scorer import BATCH_COLUMNS, SustainabilityScorer
+
+FLEET_SIZE = 200000
+PARITY_SIZE = 20000
+
+
+def make_fleet(count, seed=42):
+    """Generate columnar inputs covering every location and tier"""
+    rng = np.random.default_rng(seed)
+    scorer = SustainabilityScorer()
+    locations = list(scorer.location_factors) + ["Unknown"]
+    return {
+        "renewable_energy_percentage": rng.uniform(0, 100, count),
+        "energy_efficiency_rating": rng.uniform(0, 1, count),
+        "carbon_footprint_tons_per_day": rng.uniform(0, 300, count),
+        "carbon_offset_percentage": rng.uniform(0, 100, count),
+        "sustainability_initiatives": rng.integers(0, 8, count),
+        "location": rng.choice(locations, count).tolist()
+    }
+
+
+def score_scalar(scorer, fleet, count):
+    """Score each row through score_operation"""
+    results = []
+    for i in range(count):
+        carbon_data = {key: fleet[key][i].item() for key in BATCH_COLUMNS[:-1]}
+        results.append(scorer.score_operation({"id": i, "location": fleet["location"][i]}, carbon_data))
+    return results
+
+
+def check_parity(scorer, fleet):
+    """Assert that batch and per-operation scoring agree exactly"""
+    expected = score_scalar(scorer, fleet, PARITY_SIZE)
+    batch = scorer.score_batch({k: v[:PARITY_SIZE] for k, v in fleet.items()}, list(range(PARITY_SIZE)))
+    actual = batch.to_records()
+
+    for want, got in zip(expected, actual):
+        assert float(want["sustainability_score"]).hex() == float(got["sustainability_score"]).hex(), (want, got)
+        assert want["sustainability_tier"] == got["sustainability_tier"], (want, got)
+        for key, value in want["component_scores"].items():
+            assert float(value).hex() == float(got["component_scores"][key]).hex(), (key, want, got)
+        assert want["improvement_suggestions"] == got["improvement_suggestions"], (want, got)
+
+    tiers = sorted(set(batch.tiers.tolist()))
+    print(f"parity: {PARITY_SIZE} operations identical across tiers {', '.join(tiers)}")
+
+
+def main():
+    """Run the parity check and the benchmark"""
+    scorer = SustainabilityScorer()
+    fleet = make_fleet(FLEET_SIZE)
+
+    check_parity(scorer, fleet)
+
+    start = time.perf_counter()
+    score_scalar(scorer, fleet, FLEET_SIZE)
+    scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = scorer.score_batch(fleet)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch.to_records(include_suggestions=False)
+    records = time.perf_counter() - start
+
+    print(f"{FLEET_SIZE} operations")
+    print(f"  score_operation loop:     {scalar * 1e3:>9.1f} ms")
+    print(f"  score_batch:              {vectorized * 1e3:>9.1f} ms ({scalar / vectorized:.0f}x)")
+    print(f"  to_records (no suggest.): {records * 1e3:>9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,7 @@ from datetime import datetime
 
 from ecochain.data_module.data_collector import DataCollector
 from ecochain.analysis_module.sustainability_scorer import SustainabilityScorer
+from ecochain.analysis_module.ml_scoring import MLSustainabilityScorer
 from ecochain.reward_module.eco_token import EcoToken
 
 logger = logging.getLogger(__name__)
@@ -52,7 +53,14 @@ class EcoAgent:
         
         # Initialize components
         self.data_collector = DataCollector(config_path)
-        self.sustainability_scorer = SustainabilityScorer()
+        if self.config.get('use_ml_model', False):
+            self.sustainability_scorer = MLSustainabilityScorer(
+                self.config.get('ml_model_path'),
+                batch_chunk_size=self.config.get('scoring_batch_size', 10000),
+                fast_inference=self.config.get('ml_fast_inference', False)
+            )
+        else:
+            self.sustainability_scorer = SustainabilityScorer()
         self.eco_token = EcoToken(config_path)
     
     def run(self, single_iteration: bool = False) -> None:
@@ -112,7 +120,7 @@ class EcoAgent:
                 carbon_data = self.data_collector.get_carbon_data(operation["id"])
                 carbon_data_list.append(carbon_data)
             
-            # 3. Score each operation's sustainability
+            # 3. Score all operations' sustainability in one batch
             scores = self.sustainability_scorer.score_multiple_operations(
                 mining_operations, carbon_data_list
             )
@@ -0,0 +1,383 @@
+"""
+Holt-Winters Forecasting Module
+
+This module implements additive Holt-Winters exponential smoothing with a
+damped trend, ETS(A,Ad,A) in state-space form, for daily sustainability
+scores with weekly seasonality. Smoothing parameters are fitted per series
+by a deterministic two-stage grid search, and prediction intervals follow
+the analytical forecast variance of the model, so they widen with the
+horizon.
+
+Fits are kept in a ``HoltWintersCache`` keyed by operation ID together with
+a fingerprint of the history they were fitted on. When a series' history
+has only grown since its fit, the cached parameters are reused and the
+model state is extended over the new days instead of refitting.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from itertools import product
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+logger = logging.getLogger(__name__)
+
+# Coarse search grid: alpha, then beta and gamma as fractions of their upper
+# bounds (beta < alpha, gamma < 1 - alpha), and the trend damping phi
+ALPHA_GRID = (0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.9)
+BETA_FRACTIONS = (0.0, 0.05, 0.15, 0.4)
+GAMMA_FRACTIONS = (0.0, 0.05, 0.15, 0.4)
+PHI_GRID = (0.8, 0.9, 0.98)
+
+# Multipliers applied around the best coarse point in the refinement pass
+REFINE_STEPS = (0.7, 0.85, 1.0, 1.15, 1.3)
+
+
+@dataclass
+class HoltWintersFit:
+    """Fitted parameters and end-of-history state of one series."""
+    alpha: float
+    beta: float
+    gamma: float
+    phi: float
+    level: float
+    trend: float
+    seasonals: List[float]  # seasonals[i] applies i + 1 days after the last observation
+    sse: float  # Sum of squared one-step errors over the history
+    n: int  # Number of daily values the state covers
+    start_day: str  # First day of the daily history (YYYY-MM-DD)
+    fingerprint: str  # Fingerprint of those n daily values
+    fitted_n: int  # Number of daily values when the parameters were fitted
+
+    @property
+    def sigma2(self) -> float:
+        """Variance of the one-step forecast errors."""
+        return self.sse / max(self.n - 4, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the fit to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HoltWintersFit":
+        """Create a fit from ``to_dict`` output."""
+        return cls(**data)
+
+
+def daily_series(dates: Any, scores: Any) -> Tuple[pd.Timestamp, np.ndarray]:
+    """
+    Convert irregular observations to one value per day.
+
+    Days with several observations use their mean and missing days are
+    linearly interpolated.
+
+    Args:
+        dates: Observation timestamps.
+        scores: Observation values.
+
+    Returns:
+        Tuple of (first day, daily values).
+    """
+    days = pd.DatetimeIndex(dates).normalize()
+    daily = pd.Series(np.asarray(scores, dtype=np.float64)).groupby(days).mean()
+    daily = daily.reindex(pd.date_range(daily.index[0], daily.index[-1], freq='D')).interpolate()
+    return daily.index[0], daily.to_numpy()
+
+
+def fingerprint(start_day: pd.Timestamp, values: np.ndarray) -> str:
+    """Fingerprint a daily history by its first day and values."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(start_day.strftime('%Y-%m-%d').encode())
+    digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def _initial_state(y: np.ndarray, period: int) -> Tuple[float, float, np.ndarray]:
+    """Heuristic initial level, trend and seasonals from the first two periods."""
+    if len(y) >= 2 * period:
+        first, second = y[:period].mean(), y[period:2 * period].mean()
+        return first, (second - first) / period, y[:period] - first
+    return y[0], 0.0, np.zeros(period)
+
+
+def _run_filter(y: np.ndarray, period: int, alpha: Any, beta: Any, gamma: Any, phi: Any,
+                level: Any, trend: Any, seasonals: np.ndarray) -> Tuple[Any, Any, Any, np.ndarray]:
+    """
+    Run the ETS(A,Ad,A) recursions over observations.
+
+    Parameters and states may be arrays of shape (k,), with seasonals of
+    shape (k, period), to evaluate k parameter sets in one pass.
+
+    Args:
+        y: Observations.
+        period: Seasonal period.
+        alpha, beta, gamma, phi: Smoothing parameters and trend damping.
+        level, trend: Initial level and trend.
+        seasonals: Initial seasonals; index i applies to the i-th observation of a cycle.
+
+    Returns:
+        Tuple of (sum of squared errors, level, trend, seasonals), with the
+        seasonals rotated so that index 0 applies to the next day.
+    """
+    seasonals = np.array(seasonals, dtype=np.float64)
+    sse = np.zeros(np.shape(level))
+    for t, observation in enumerate(y):
+        slot = t % period
+        damped = phi * trend
+        error = observation - (level + damped + seasonals[..., slot])
+        sse = sse + error * error
+        level = level + damped + alpha * error
+        trend = damped + beta * error
+        seasonals[..., slot] += gamma * error
+    return sse, level, trend, np.roll(seasonals, -(len(y) % period), axis=-1)
+
+
+def _search(y: np.ndarray, period: int, candidates: np.ndarray) -> np.ndarray:
+    """Return the (alpha, beta, gamma, phi) row of ``candidates`` with the lowest SSE."""
+    level, trend, seasonals = _initial_state(y, period)
+    alpha, beta, gamma, phi = candidates.T
+    count = len(candidates)
+    sse, _, _, _ = _run_filter(
+        y, period, alpha, beta, gamma, phi,
+        np.full(count, level), np.full(count, trend), np.tile(seasonals, (count, 1))
+    )
+    # First minimum, so ties resolve the same way on every run
+    return candidates[int(np.argmin(sse))]
+
+
+def _grid(alphas: Any, beta_fractions: Any, gamma_fractions: Any, phis: Any) -> np.ndarray:
+    """Expand fractional grids into (alpha, beta, gamma, phi) rows."""
+    rows = [
+        (alpha, alpha * b, (1 - alpha) * g, phi)
+        for alpha, b, g, phi in product(alphas, beta_fractions, gamma_fractions, phis)
+    ]
+    return np.array(rows, dtype=np.float64)
+
+
+def _refine(value: float, lower: float) -> np.ndarray:
+    """Candidate values around a coarse optimum, always including ``lower``."""
+    around = np.maximum(value, 0.02) * np.array(REFINE_STEPS)
+    return np.unique(np.clip(np.append(around, lower), lower, 0.999))
+
+
+def fit(dates: Any, scores: Any, period: int = 7) -> HoltWintersFit:
+    """
+    Fit a damped additive Holt-Winters model to a series.
+
+    The parameters minimizing the one-step squared error are found with a
+    coarse grid followed by a finer grid around the best point. Both passes
+    are deterministic, so the same history always gives the same fit.
+    Series shorter than two seasonal periods are fitted without seasonality.
+
+    Args:
+        dates: Observation timestamps.
+        scores: Observation values.
+        period: Seasonal period in days.
+
+    Returns:
+        The fit, with the model state at the end of the history.
+    """
+    start_day, y = daily_series(dates, scores)
+    seasonal = len(y) >= 2 * period
+    gamma_fractions = GAMMA_FRACTIONS if seasonal else (0.0,)
+
+    alpha, beta, gamma, phi = _search(y, period, _grid(ALPHA_GRID, BETA_FRACTIONS, gamma_fractions, PHI_GRID))
+
+    # Refine around the coarse optimum, staying inside the admissible region
+    alpha, beta, gamma, phi = _search(y, period, _grid(
+        _refine(alpha, 0.001),
+        _refine(beta / alpha, 0.0),
+        _refine(gamma / (1 - alpha), 0.0) if seasonal else (0.0,),
+        np.unique(np.clip(phi + np.array([-0.04, -0.02, 0.0, 0.01]), 0.8, 0.995))
+    ))
+
+    level, trend, seasonals = _initial_state(y, period)
+    sse, level, trend, seasonals = _run_filter(y, period, alpha, beta, gamma, phi, level, trend, seasonals)
+
+    return HoltWintersFit(
+        alpha=float(alpha), beta=float(beta), gamma=float(gamma), phi=float(phi),
+        level=float(level), trend=float(trend), seasonals=seasonals.tolist(),
+        sse=float(sse), n=len(y), start_day=start_day.strftime('%Y-%m-%d'),
+        fingerprint=fingerprint(start_day, y), fitted_n=len(y)
+    )
+
+
+def extend(model: HoltWintersFit, y: np.ndarray, start_day: pd.Timestamp) -> HoltWintersFit:
+    """
+    Advance a fit over new daily values without refitting its parameters.
+
+    Args:
+        model: Fit whose state covers ``y[:model.n]``.
+        y: The full daily history.
+        start_day: First day of ``y``.
+
+    Returns:
+        A fit with the same parameters and the state at the end of ``y``.
+    """
+    new = y[model.n:]
+    sse, level, trend, seasonals = _run_filter(
+        new, len(model.seasonals), model.alpha, model.beta, model.gamma, model.phi,
+        model.level, model.trend, model.seasonals
+    )
+    return HoltWintersFit(
+        alpha=model.alpha, beta=model.beta, gamma=model.gamma, phi=model.phi,
+        level=float(level), trend=float(trend), seasonals=seasonals.tolist(),
+        sse=model.sse + float(sse), n=len(y), start_day=model.start_day,
+        fingerprint=fingerprint(start_day, y), fitted_n=model.fitted_n
+    )
+
+
+def forecast(model: HoltWintersFit, horizon_days: int,
+             confidence: float = 0.95) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Forecast from a fit with prediction intervals.
+
+    The h-step forecast variance is sigma^2 * (1 + sum of c_j^2 for j < h),
+    with c_j = alpha + beta * (phi + ... + phi^j) + gamma when j is a whole
+    number of seasons and without the gamma term otherwise.
+
+    Args:
+        model: The fit.
+        horizon_days: Number of days to forecast.
+        confidence: Coverage of the prediction intervals.
+
+    Returns:
+        Tuple of (forecast, lower bound, upper bound) arrays, clamped to 0-100.
+    """
+    period = len(model.seasonals)
+    steps = np.arange(1, horizon_days + 1)
+    damped_sums = np.cumsum(model.phi ** steps)
+    mean = model.level + damped_sums * model.trend + np.asarray(model.seasonals)[(steps - 1) % period]
+
+    c = model.alpha + model.beta * damped_sums[:-1] + model.gamma * (steps[:-1] % period == 0)
+    variance = model.sigma2 * (1 + np.concatenate([[0.0], np.cumsum(c * c)]))
+    margin = stats.norm.ppf((1 + confidence) / 2) * np.sqrt(variance)
+
+    return (
+        np.clip(mean, 0, 100),
+        np.clip(mean - margin, 0, 100),
+        np.clip(mean + margin, 0, 100)
+    )
+
+
+def fit_or_extend(dates: Any, scores: Any, cached: Optional[HoltWintersFit] = None,
+                  period: int = 7, refit_interval: Optional[int] = 30) -> Tuple[HoltWintersFit, str]:
+    """
+    Bring a series' fit up to date, reusing a cached fit where possible.
+
+    A cached fit is reused as is when the history is unchanged, and
+    extended when the history only gained days at the end, unless
+    ``refit_interval`` days have been added since it was fitted. Any change
+    to earlier history triggers a refit.
+
+    Args:
+        dates: Observation timestamps.
+        scores: Observation values.
+        cached: Previous fit of the series, if any.
+        period: Seasonal period in days.
+        refit_interval: Days of new data after which parameters are refitted, None to never refit.
+
+    Returns:
+        Tuple of (fit, action), where action is "cached", "extended" or "fitted".
+    """
+    if cached is not None and len(cached.seasonals) == period:
+        start_day, y = daily_series(dates, scores)
+        if (cached.start_day == start_day.strftime('%Y-%m-%d') and len(y) >= cached.n
+                and fingerprint(start_day, y[:cached.n]) == cached.fingerprint):
+            if len(y) == cached.n:
+                return cached, "cached"
+            if refit_interval is None or len(y) - cached.fitted_n < refit_interval:
+                return extend(cached, y, start_day), "extended"
+
+    return fit(dates, scores, period), "fitted"
+
+
+class HoltWintersCache:
+    """
+    Fitted Holt-Winters models by operation ID.
+
+    Each entry records the fingerprint of the history it covers, which
+    ``fit_or_extend`` checks before reusing it. The cache can be persisted
+    as JSON so nightly runs pick up the previous night's fits; since JSON
+    keys are strings, operation IDs are keyed by ``str(operation_id)``.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Optional JSON file to load from and save to.
+        """
+        self.path = path
+        self._fits: Dict[str, HoltWintersFit] = {}
+        self._lock = threading.Lock()
+        self.stats = {"cached": 0, "extended": 0, "fitted": 0}
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def get(self, operation_id: Any) -> Optional[HoltWintersFit]:
+        """Get an operation's cached fit."""
+        with self._lock:
+            return self._fits.get(str(operation_id))
+
+    def put(self, operation_id: Any, model: HoltWintersFit, action: Optional[str] = None) -> None:
+        """
+        Store an operation's fit.
+
+        Args:
+            operation_id: ID of the operation.
+            model: The fit.
+            action: How the fit was obtained, counted in ``stats``.
+        """
+        with self._lock:
+            self._fits[str(operation_id)] = model
+            if action in self.stats:
+                self.stats[action] += 1
+
+    def __len__(self) -> int:
+        return len(self._fits)
+
+    def load(self, path: Optional[str] = None) -> None:
+        """Load fits from a JSON file written by ``save``."""
+        path = path or self.path
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            with self._lock:
+                self._fits.update({key: HoltWintersFit.from_dict(value) for key, value in data.items()})
+        except Exception as e:
+            logger.error(f"Error loading forecast cache from {path}: {str(e)}")
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """
+        Write the fits to a JSON file.
+
+        Args:
+            path: Destination, defaults to the cache's path.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        path = path or self.path
+        if not path:
+            return False
+        try:
+            with self._lock:
+                data = {key: value.to_dict() for key, value in self._fits.items()}
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving forecast cache to {path}: {str(e)}")
+            return False
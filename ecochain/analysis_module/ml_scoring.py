@@ -1,18 +1,50 @@
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass
+import copy
 import logging
 import pickle
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from sklearn.ensemble import RandomForestRegressor, IsolationForest
 from sklearn.preprocessing import StandardScaler
 from sklearn.pipeline import Pipeline
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
+from ecochain.analysis_module.model_artifact import (
+    PackedRegressor, export_models, is_artifact, load_models, write_artifact
+)
+from ecochain.analysis_module.tree_engine import TreeEngine
 
 logger = logging.getLogger(__name__)
 
+# Input value types scored as numbers, as accepted by prepare_features
+_REAL_TYPES = (int, float, np.integer, np.floating)
+
+@dataclass
+class TrainingData:
+    """
+    Training samples as a feature matrix and a target vector.
+    
+    ``to_records`` gives the list-of-dicts form used by earlier versions
+    of ``generate_training_data``.
+    """
+    features: np.ndarray  # shape (n, 6)
+    scores: np.ndarray    # shape (n,)
+    
+    def __len__(self) -> int:
+        return len(self.scores)
+    
+    def to_records(self) -> List[Dict]:
+        """Get the samples as a list of {'features', 'score'} dictionaries."""
+        return [
+            {'features': features, 'score': score}
+            for features, score in zip(self.features, self.scores.tolist())
+        ]
+
 class MLSustainabilityScorer:
     """
     Enhanced sustainability scorer using scikit-learn for more sophisticated 
@@ -25,12 +57,21 @@ class MLSustainabilityScorer:
     - Save/load trained models
     """
     
-    def __init__(self, model_path: Optional[str] = None):
+    def __init__(self, model_path: Optional[str] = None, batch_chunk_size: int = 10000,
+                 n_jobs: Optional[int] = -1, allow_pickle: bool = True, fast_inference: bool = False):
         """
         Initialize the ML sustainability scorer.
         
         Args:
             model_path: Optional path to load a pre-trained model.
+            batch_chunk_size: Number of rows per model call in ``score_operations_batch``.
+            n_jobs: Parallel jobs used while training (-1 for all cores, None for one).
+            allow_pickle: Whether legacy pickle models may be loaded. Pickle files
+                can run arbitrary code, so disable this for untrusted paths.
+            fast_inference: Whether single operations are scored through a
+                ``TreeEngine`` built from the trained forests instead of calling
+                sklearn. Batches always use sklearn, which is faster on large
+                matrices.
         """
         # Model parameters
         self.features = [
@@ -43,19 +84,7 @@ class MLSustainabilityScorer:
         ]
         
         # Initialize models
-        self.scoring_pipeline = Pipeline([
-            ('scaler', StandardScaler()),
-            ('model', RandomForestRegressor(
-                n_estimators=100, 
-                max_depth=10,
-                random_state=42
-            ))
-        ])
-        
-        self.anomaly_detector = IsolationForest(
-            contamination=0.05,  # Expecting 5% anomalies
-            random_state=42
-        )
+        self.scoring_pipeline, self.anomaly_detector = self._build_models()
         
         self.location_factors = {
             "Iceland": 0.95,  # Very green energy
@@ -70,11 +99,34 @@ class MLSustainabilityScorer:
         
         self.default_location_factor = 0.40
         self.is_model_trained = False
+        self.batch_chunk_size = batch_chunk_size
+        self.n_jobs = n_jobs
+        self.allow_pickle = allow_pickle
+        self.fast_inference = fast_inference
+        self._engine = None
         
         # Load pre-trained model if specified
         if model_path and os.path.exists(model_path):
             self._load_model(model_path)
     
+    def _build_models(self) -> Tuple[Pipeline, IsolationForest]:
+        """Create untrained scoring and anomaly detection models."""
+        scoring_pipeline = Pipeline([
+            ('scaler', StandardScaler()),
+            ('model', RandomForestRegressor(
+                n_estimators=100, 
+                max_depth=10,
+                random_state=42
+            ))
+        ])
+        
+        anomaly_detector = IsolationForest(
+            contamination=0.05,  # Expecting 5% anomalies
+            random_state=42
+        )
+        
+        return scoring_pipeline, anomaly_detector
+    
     def prepare_features(self, mining_data: Dict, carbon_data: Dict) -> np.ndarray:
         """
         Extract and prepare features for ML model input.
@@ -114,6 +166,60 @@ class MLSustainabilityScorer:
         
         return features
     
+    def prepare_features_batch(self, operations_data: List[Dict], carbon_data_list: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract and prepare features for many operations at once.
+        
+        Produces the same values as ``prepare_features`` row by row. Rows
+        whose inputs are not finite numbers are flagged as invalid so they
+        can take the per-operation path and its error handling.
+        
+        Args:
+            operations_data: List of dictionaries with mining operation data.
+            carbon_data_list: List of carbon footprint dictionaries aligned with ``operations_data``.
+            
+        Returns:
+            Tuple of (feature matrix of shape (n, 6), boolean mask of valid rows).
+        """
+        n = len(operations_data)
+        keys = self.features[:5]
+        
+        # Values that are not real numbers (strings, None, containers) become NaN
+        # and mark their row invalid
+        values = np.fromiter(
+            (
+                float(value) if isinstance(value, _REAL_TYPES) else np.nan
+                for carbon_data in carbon_data_list for value in (carbon_data.get(key, 0) for key in keys)
+            ),
+            dtype=float, count=n * len(keys)
+        ).reshape(n, len(keys))
+        valid = np.isfinite(values).all(axis=1)
+        values[~valid] = 0.0
+        
+        renewable_percentage, efficiency_rating, carbon_footprint, offset_percentage, initiatives = values.T
+        location_factor = np.fromiter(
+            (self.location_factors.get(op.get("location", ""), self.default_location_factor) for op in operations_data),
+            dtype=float, count=n
+        )
+        
+        # Normalize values to 0-1 range
+        normalized_initiatives = np.minimum(initiatives / 5.0, 1.0)  # Assuming max 5 initiatives
+        
+        # Sigmoid normalization for carbon footprint (lower is better)
+        max_footprint = 100.0
+        normalized_carbon = 1.0 / (1.0 + np.exp(-0.05 * (carbon_footprint - max_footprint/2)))
+        
+        features = np.column_stack([
+            renewable_percentage / 100.0,
+            efficiency_rating,
+            normalized_carbon,
+            offset_percentage / 100.0,
+            normalized_initiatives,
+            location_factor
+        ])
+        
+        return features, valid
+    
     def detect_anomalies(self, features_list: List[np.ndarray]) -> List[bool]:
         """
         Detect anomalies in mining operation data.
@@ -136,61 +242,162 @@ class MLSustainabilityScorer:
         # Convert to boolean (True for anomalies)
         return [pred == -1 for pred in predictions]
     
-    def train(self, training_data: List[Dict]) -> Dict:
+    def train(self, training_data: Union[TrainingData, Tuple[np.ndarray, np.ndarray], List[Dict]],
+              n_jobs: Optional[int] = None, incremental: bool = False, additional_estimators: int = 50,
+              parallel_stages: bool = True, test_size: float = 0.2) -> Dict:
         """
         Train the ML model on mining operation data.
         
+        The random forest and the isolation forest are fitted with ``n_jobs``
+        workers, and with ``parallel_stages`` the two fits run concurrently.
+        Models are reset to a single job after fitting so per-operation
+        scoring does not pay for thread start-up.
+        
+        With ``incremental`` and an already trained model, the forests keep
+        their existing trees and grow ``additional_estimators`` new ones on
+        the new data (warm start). The fitted scaler is reused so the new
+        trees see features on the same scale as the old ones.
+        Models are fitted as copies and only replace the current ones once
+        training succeeds, so a failed run leaves the trained model intact.
+        Models loaded from an artifact hold no sklearn estimators and
+        cannot be extended: incremental training returns an error for them,
+        while a full retrain replaces them.
+        
         Args:
-            training_data: List of dictionaries with training samples.
-                Each dict should contain 'features' and 'score'.
+            training_data: TrainingData, an (X, y) tuple of arrays, or a list
+                of dictionaries each containing 'features' and 'score'.
+            n_jobs: Parallel jobs for fitting; defaults to the scorer's ``n_jobs``.
+            incremental: Whether to grow the trained forests instead of refitting.
+            additional_estimators: Number of trees added per forest when incremental.
+            parallel_stages: Whether to fit the scorer and anomaly detector concurrently.
+            test_size: Fraction of the data held out for evaluation.
                 
         Returns:
-            Dictionary with training metrics.
+            Dictionary with training metrics, including ``wall_time`` and
+            per-stage ``timings`` in seconds.
         """
-        if not training_data:
+        if training_data is None or len(training_data) == 0:
             logger.warning("No training data provided.")
             return {"error": "No training data provided"}
         
+        started = time.perf_counter()
+        timings = {}
+        n_jobs = self.n_jobs if n_jobs is None else n_jobs
+        
+        if incremental and not self.is_model_trained:
+            logger.info("No trained model to extend, training from scratch.")
+            incremental = False
+        
+        if incremental and isinstance(self.scoring_pipeline, PackedRegressor):
+            # Models loaded from an artifact are inference-only
+            error = "Model loaded from an artifact cannot be extended; save models with format='pickle' to train them incrementally"
+            logger.error(error)
+            return {"error": error}
+        
         try:
             # Extract features and targets
-            X = np.array([sample['features'] for sample in training_data])
-            y = np.array([sample['score'] for sample in training_data])
+            stage = time.perf_counter()
+            if isinstance(training_data, TrainingData):
+                X, y = training_data.features, training_data.scores
+            elif isinstance(training_data, tuple):
+                X, y = (np.asarray(a) for a in training_data)
+            else:
+                X = np.array([sample['features'] for sample in training_data])
+                y = np.array([sample['score'] for sample in training_data])
             
             # Split data for training and validation
             X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
+                X, y, test_size=test_size, random_state=42
             )
+            timings["prepare"] = time.perf_counter() - stage
             
-            # Train scoring model
-            self.scoring_pipeline.fit(X_train, y_train)
-            
-            # Train anomaly detection model
-            self.anomaly_detector.fit(X)
+            # Fit copies of the current models when extending them, or fresh models
+            # otherwise, so the working models are only replaced after a successful fit
+            if incremental:
+                scoring_pipeline = copy.deepcopy(self.scoring_pipeline)
+                anomaly_detector = copy.deepcopy(self.anomaly_detector)
+            else:
+                scoring_pipeline, anomaly_detector = self._build_models()
+            
+            model = scoring_pipeline.named_steps['model']
+            scaler = scoring_pipeline.named_steps['scaler']
+            model.set_params(n_jobs=n_jobs, warm_start=incremental)
+            anomaly_detector.set_params(n_jobs=n_jobs, warm_start=incremental)
+            
+            if incremental:
+                model.set_params(n_estimators=model.n_estimators + additional_estimators)
+                anomaly_detector.set_params(
+                    n_estimators=anomaly_detector.n_estimators + additional_estimators
+                )
+            
+            def fit_scorer() -> float:
+                stage = time.perf_counter()
+                if incremental:
+                    model.fit(scaler.transform(X_train), y_train)
+                else:
+                    scoring_pipeline.fit(X_train, y_train)
+                return time.perf_counter() - stage
+            
+            def fit_anomaly_detector() -> float:
+                stage = time.perf_counter()
+                anomaly_detector.fit(X)
+                return time.perf_counter() - stage
+            
+            try:
+                # Train scoring and anomaly detection models
+                if parallel_stages:
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        anomaly_future = executor.submit(fit_anomaly_detector)
+                        timings["scoring_fit"] = fit_scorer()
+                        timings["anomaly_fit"] = anomaly_future.result()
+                else:
+                    timings["scoring_fit"] = fit_scorer()
+                    timings["anomaly_fit"] = fit_anomaly_detector()
+            finally:
+                model.set_params(n_jobs=None, warm_start=False)
+                anomaly_detector.set_params(n_jobs=None, warm_start=False)
             
             # Evaluate model
-            y_pred = self.scoring_pipeline.predict(X_test)
+            stage = time.perf_counter()
+            y_pred = scoring_pipeline.predict(X_test)
             mse = mean_squared_error(y_test, y_pred)
             r2 = r2_score(y_test, y_pred)
+            timings["evaluation"] = time.perf_counter() - stage
             
+            self.scoring_pipeline = scoring_pipeline
+            self.anomaly_detector = anomaly_detector
+            self._engine = None
             self.is_model_trained = True
             
             return {
                 "mse": mse,
                 "r2": r2,
-                "samples_count": len(training_data),
-                "training_date": datetime.now().isoformat()
+                "samples_count": len(y),
+                "training_date": datetime.now().isoformat(),
+                "incremental": incremental,
+                "n_estimators": model.n_estimators,
+                "n_jobs": n_jobs,
+                "wall_time": time.perf_counter() - started,
+                "timings": timings
             }
             
         except Exception as e:
             logger.error(f"Error training model: {str(e)}")
             return {"error": str(e)}
     
-    def save_model(self, model_path: str) -> bool:
+    def save_model(self, model_path: str, format: str = "artifact") -> bool:
         """
         Save the trained model to disk.
         
+        The default ``"artifact"`` format stores the scaler parameters and
+        flattened trees in a versioned file that loads by memory-mapping,
+        without unpickling (see ``model_artifact``). ``"pickle"`` writes the
+        legacy format with the sklearn objects themselves, which is needed
+        to extend the model later with incremental training.
+        
         Args:
             model_path: Path to save the model.
+            format: "artifact" or "pickle".
             
         Returns:
             True if successful, False otherwise.
@@ -200,16 +407,29 @@ class MLSustainabilityScorer:
             return False
         
         try:
-            os.makedirs(os.path.dirname(model_path), exist_ok=True)
-            
-            # Save both models in a dictionary
-            models = {
-                'scoring_pipeline': self.scoring_pipeline,
-                'anomaly_detector': self.anomaly_detector
-            }
-            
-            with open(model_path, 'wb') as f:
-                pickle.dump(models, f)
+            directory = os.path.dirname(model_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            if format == "artifact":
+                header, arrays = export_models(self.scoring_pipeline, self.anomaly_detector, self.features)
+                write_artifact(model_path, header, arrays)
+            elif format == "pickle":
+                if isinstance(self.scoring_pipeline, PackedRegressor):
+                    logger.warning("Model loaded from an artifact cannot be saved as pickle.")
+                    return False
+                
+                # Save both models in a dictionary
+                models = {
+                    'scoring_pipeline': self.scoring_pipeline,
+                    'anomaly_detector': self.anomaly_detector
+                }
+                
+                with open(model_path, 'wb') as f:
+                    pickle.dump(models, f)
+            else:
+                logger.warning(f"Unknown model format: {format}")
+                return False
             
             logger.info(f"Model saved to {model_path}")
             return True
@@ -222,6 +442,10 @@ class MLSustainabilityScorer:
         """
         Load a trained model from disk.
         
+        Artifacts are memory-mapped read-only, so worker processes loading
+        the same file share one copy of the trees. Legacy pickle files are
+        loaded only when ``allow_pickle`` is set.
+        
         Args:
             model_path: Path to the saved model.
             
@@ -229,12 +453,25 @@ class MLSustainabilityScorer:
             True if successful, False otherwise.
         """
         try:
-            with open(model_path, 'rb') as f:
-                models = pickle.load(f)
+            if is_artifact(model_path):
+                scoring_pipeline, anomaly_detector, header = load_models(model_path)
+                if header["features"] != self.features:
+                    raise ValueError(f"Model features {header['features']} do not match {self.features}")
+                
+                self.scoring_pipeline = scoring_pipeline
+                self.anomaly_detector = anomaly_detector
+            elif self.allow_pickle:
+                logger.info(f"Loading legacy pickle model from {model_path}")
+                with open(model_path, 'rb') as f:
+                    models = pickle.load(f)
+                
+                self.scoring_pipeline = models['scoring_pipeline']
+                self.anomaly_detector = models['anomaly_detector']
+            else:
+                raise ValueError(f"{model_path} is not a model artifact and pickle loading is disabled")
             
-            self.scoring_pipeline = models['scoring_pipeline']
-            self.anomaly_detector = models['anomaly_detector']
             self.is_model_trained = True
+            self._engine = None
             
             logger.info(f"Model loaded from {model_path}")
             return True
@@ -243,56 +480,64 @@ class MLSustainabilityScorer:
             logger.error(f"Error loading model: {str(e)}")
             return False
     
-    def generate_training_data(self, operations_count: int = 1000) -> List[Dict]:
+    def get_engine(self) -> Optional[TreeEngine]:
+        """
+        Get the fast inference engine for the trained model.
+        
+        The engine is built on first use after each train or load.
+        
+        Returns:
+            The engine, or None if fast inference is disabled or no model is trained.
+        """
+        if not (self.fast_inference and self.is_model_trained):
+            return None
+        if self._engine is None:
+            self._engine = TreeEngine.from_models(self.scoring_pipeline, self.anomaly_detector)
+        return self._engine
+    
+    def generate_training_data(self, operations_count: int = 1000, seed: Optional[int] = None,
+                               as_records: bool = False) -> Union[TrainingData, List[Dict]]:
         """
         Generate synthetic training data for the ML model.
         
+        All samples are drawn at once from a ``np.random.Generator``, so the
+        same seed always gives the same data.
+        
         Args:
             operations_count: Number of synthetic operations to generate.
+            seed: Optional seed for the random generator.
+            as_records: If True, return the list-of-dicts form instead of arrays.
             
         Returns:
-            List of dictionaries with synthetic training samples.
+            TrainingData with the feature matrix and scores, or a list of
+            dictionaries with 'features' and 'score' if ``as_records`` is set.
         """
-        training_data = []
-        
-        for i in range(operations_count):
-            # Generate synthetic features
-            renewable = np.random.uniform(0, 100)
-            efficiency = np.random.uniform(0, 1)
-            carbon = np.random.uniform(0, 100)
-            offset = np.random.uniform(0, 100)
-            initiatives = np.random.randint(0, 6)
-            location_factor = np.random.uniform(0.2, 0.95)
-            
-            # Normalize carbon footprint
-            max_footprint = 100.0
-            normalized_carbon = 1.0 / (1.0 + np.exp(-0.05 * (carbon - max_footprint/2)))
-            normalized_initiatives = min(initiatives / 5.0, 1.0)
-            
-            # Create feature vector
-            features = np.array([
-                renewable / 100.0,
-                efficiency,
-                normalized_carbon,
-                offset / 100.0,
-                normalized_initiatives,
-                location_factor
-            ])
-            
-            # Calculate synthetic score (similar to our original formula but with some noise)
-            weights = np.array([0.35, 0.25, -0.20, 0.10, 0.05, 0.05])
-            base_score = np.dot(features, weights)
-            # Add nonlinearity and noise
-            score = 100 * (base_score + 0.5) + np.random.normal(0, 5)
-            # Ensure score is in 0-100 range
-            score = max(0, min(100, score))
-            
-            training_data.append({
-                'features': features,
-                'score': score
-            })
+        rng = np.random.default_rng(seed)
+        n = operations_count
         
-        return training_data
+        # Generate synthetic features
+        features = np.empty((n, 6))
+        features[:, 0] = rng.uniform(0, 100, n) / 100.0                    # renewable percentage
+        features[:, 1] = rng.uniform(0, 1, n)                              # efficiency
+        max_footprint = 100.0
+        carbon = rng.uniform(0, 100, n)
+        features[:, 2] = 1.0 / (1.0 + np.exp(-0.05 * (carbon - max_footprint/2)))  # normalized carbon
+        del carbon
+        features[:, 3] = rng.uniform(0, 100, n) / 100.0                    # offset percentage
+        features[:, 4] = np.minimum(rng.integers(0, 6, n) / 5.0, 1.0)      # normalized initiatives
+        features[:, 5] = rng.uniform(0.2, 0.95, n)                         # location factor
+        
+        # Calculate synthetic score (similar to our original formula but with some noise)
+        weights = np.array([0.35, 0.25, -0.20, 0.10, 0.05, 0.05])
+        scores = features @ weights
+        scores += 0.5
+        scores *= 100
+        scores += rng.normal(0, 5, n)
+        # Ensure score is in 0-100 range
+        np.clip(scores, 0, 100, out=scores)
+        
+        training_data = TrainingData(features=features, scores=scores)
+        return training_data.to_records() if as_records else training_data
     
     def score_operation(self, mining_data: Dict, carbon_data: Dict) -> Dict:
         """
@@ -311,11 +556,15 @@ class MLSustainabilityScorer:
             
             # Score using ML model if trained, otherwise use rule-based approach
             if self.is_model_trained:
-                score = float(self.scoring_pipeline.predict(features)[0])
-                
-                # Detect if this is an anomaly
-                is_anomaly = self.anomaly_detector.predict(features)[0] == -1
-                anomaly_score = self.anomaly_detector.score_samples(features)[0]
+                engine = self.get_engine()
+                if engine is not None:
+                    score, anomaly_score, is_anomaly = engine.score_row(features[0])
+                else:
+                    score = float(self.scoring_pipeline.predict(features)[0])
+                    
+                    # Detect if this is an anomaly
+                    is_anomaly = self.anomaly_detector.predict(features)[0] == -1
+                    anomaly_score = self.anomaly_detector.score_samples(features)[0]
                 
                 # Clamp score to 0-100 range
                 score = max(0, min(100, score))
@@ -354,497 +603,104 @@ class MLSustainabilityScorer:
                 "error": str(e)
             }
     
-    def _rule_based_scoring(self, mining_data: Dict, carbon_data: Dict, features: np.ndarray) -> Dict:
-        """
-        Fallback rule-based scoring when ML model is not trained.
-        
-        Args:
-            mining_data: Dictionary with mining operation data.
-            carbon_data: Dictionary with carbon footprint data.
-            features: Extracted feature array.
-            
-        Returns:
-            Dictionary with score results.
-        """
-        # Extract feature components
-        renewable_score = features[0][0]
-        efficiency_score = features[0][1]
-        carbon_score = 1.0 - features[0][2]  # Invert as lower carbon is better
-        offset_score = features[0][3]
-        initiatives_score = features[0][4]
-        location_factor = features[0][5]
-        
-        # Weights from original model
-        weights = {
-            "renewable_energy_percentage": 0.35,
-            "energy_efficiency_rating": 0.25,
-            "carbon_footprint": 0.20,
-            "carbon_offset_percentage": 0.10,
-            "sustainability_initiatives": 0.05,
-            "location_factor": 0.05
-        }
-        
-        # Calculate weighted score
-        weighted_score = (
-            weights["renewable_energy_percentage"] * renewable_score +
-            weights["energy_efficiency_rating"] * efficiency_score +
-            weights["carbon_footprint"] * carbon_score +
-            weights["carbon_offset_percentage"] * offset_score +
-            weights["sustainability_initiatives"] * initiatives_score +
-            weights["location_factor"] * location_factor
-        )
-        
-        # Carbon penalty for high emitters
-        carbon_penalty = np.exp(features[0][2] * 0.01) - 1
-        
-        # Apply penalty and ensure score is in 0-100 range
-        final_score = max(0, min(100, (weighted_score - carbon_penalty) * 100))
-        
-        # Determine sustainability tier
-        tier = self._determine_tier(final_score)
-        
-        return {
-            "operation_id": mining_data.get("id", "unknown"),
-            "sustainability_score": final_score,
-            "sustainability_tier": tier,
-            "component_scores": {
-                "renewable_energy": renewable_score * 100,
-                "energy_efficiency": efficiency_score * 100,
-                "carbon_footprint": carbon_score * 100,
-                "carbon_offset": offset_score * 100,
-                "sustainability_initiatives": initiatives_score * 100,
-                "location_factor": location_factor * 100
-            },
-            "improvement_suggestions": self._generate_suggestions(features[0]),
-            "scoring_method": "rule_based"
-        }
-    
-    def _determine_tier(self, score: float) -> str:
+    def score_operations_batch(self, operations_data: List[Dict], carbon_data_list: List[Dict],
+                               chunk_size: Optional[int] = None) -> List[Dict]:
         """
-        Determine sustainability tier based on the score.
+        Score many mining operations with one model call per chunk.
         
-        Args:
-            score: Sustainability score (0-100).
-            
-        Returns:
-            String indicating the sustainability tier.
-        """
-        if score >= 90:
-            return "Platinum"
-        elif score >= 75:
-            return "Gold"
-        elif score >= 60:
-            return "Silver"
-        elif score >= 45:
-            return "Bronze"
-        elif score >= 30:
-            return "Standard"
-        else:
-            return "Needs Improvement"
-    
-    def _generate_suggestions(self, features: np.ndarray) -> List[str]:
-        """
-        Generate improvement suggestions based on feature values.
+        Builds a single feature matrix and runs the scoring pipeline and the
+        anomaly detector once per chunk of rows. Anomaly flags are derived
+        from the same ``score_samples`` pass as the anomaly scores, exactly
+        as ``IsolationForest.predict`` does. Results match ``score_operation``.
         
         Args:
-            features: Feature vector with normalized values.
+            operations_data: List of dictionaries with mining operation data.
+            carbon_data_list: List of carbon footprint dictionaries aligned with ``operations_data``.
+            chunk_size: Rows per model call; defaults to ``batch_chunk_size``.
             
         Returns:
-            List of improvement suggestions.
-        """
-        suggestions = []
-        
-        renewable_score = features[0]
-        efficiency_score = features[1]
-        carbon_score = features[2]  # This is normalized carbon (higher is worse)
-        offset_score = features[3]
-        initiatives_score = features[4]
-        
-        if renewable_score < 0.5:
-            suggestions.append(
-                "Increase renewable energy usage through direct purchases, "
-                "RECs, or on-site generation."
-            )
-        
-        if efficiency_score < 0.6:
-            suggestions.append(
-                "Upgrade to more energy-efficient mining hardware or optimize "
-                "cooling systems for better efficiency."
-            )
-        
-        if carbon_score > 0.5:  # Remember higher normalized carbon is worse
-            suggestions.append(
-                "Reduce carbon footprint by optimizing operations or "
-                "relocating to areas with cleaner energy."
-            )
-        
-        if offset_score < 0.3:
-            suggestions.append(
-                "Implement carbon offset programs to balance unavoidable emissions "
-                "through verified carbon credit purchases."
-            )
-        
-        if initiatives_score < 0.4:
-            suggestions.append(
-                "Develop and implement sustainability initiatives like waste heat recovery, "
-                "facility optimization, or renewable energy partnerships."
-            )
-            
-        return suggestions 
-import pandas as pd
-from typing import Dict, List, Optional, Tuple
-import logging
-import pickle
-import os
-from datetime import datetime
-from sklearn.ensemble import RandomForestRegressor, IsolationForest
-from sklearn.preprocessing import StandardScaler
-from sklearn.pipeline import Pipeline
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
-
-logger = logging.getLogger(__name__)
-
-class MLSustainabilityScorer:
-    """
-    Enhanced sustainability scorer using scikit-learn for more sophisticated 
-    scoring and anomaly detection for mining operations.
-    
-    Features:
-    - Train on real or synthetic mining operation data
-    - Use RandomForest for sustainability scoring
-    - Use IsolationForest for anomaly detection
-    - Save/load trained models
-    """
-    
-    def __init__(self, model_path: Optional[str] = None):
-        """
-        Initialize the ML sustainability scorer.
-        
-        Args:
-            model_path: Optional path to load a pre-trained model.
+            List of dictionaries containing sustainability scores, one per operation.
         """
-        # Model parameters
-        self.features = [
-            'renewable_energy_percentage',
-            'energy_efficiency_rating',
-            'carbon_footprint_tons_per_day',
-            'carbon_offset_percentage',
-            'sustainability_initiatives',
-            'location_factor'
-        ]
-        
-        # Initialize models
-        self.scoring_pipeline = Pipeline([
-            ('scaler', StandardScaler()),
-            ('model', RandomForestRegressor(
-                n_estimators=100, 
-                max_depth=10,
-                random_state=42
-            ))
-        ])
-        
-        self.anomaly_detector = IsolationForest(
-            contamination=0.05,  # Expecting 5% anomalies
-            random_state=42
-        )
-        
-        self.location_factors = {
-            "Iceland": 0.95,  # Very green energy
-            "Norway": 0.90,   # Mostly hydro
-            "Sweden": 0.85,   # Significant renewables
-            "Canada": 0.70,   # Mixed but good hydro
-            "USA": 0.50,      # Very mixed
-            "Russia": 0.30,   # Fossil fuel heavy
-            "Kazakhstan": 0.25, # Coal heavy
-            "China": 0.20     # Coal dominant
-        }
-        
-        self.default_location_factor = 0.40
-        self.is_model_trained = False
-        
-        # Load pre-trained model if specified
-        if model_path and os.path.exists(model_path):
-            self._load_model(model_path)
-    
-    def prepare_features(self, mining_data: Dict, carbon_data: Dict) -> np.ndarray:
-        """
-        Extract and prepare features for ML model input.
-        
-        Args:
-            mining_data: Dictionary with mining operation data.
-            carbon_data: Dictionary with carbon footprint data.
-            
-        Returns:
-            Numpy array with features for ML model.
-        """
-        # Extract basic features
-        renewable_percentage = carbon_data.get("renewable_energy_percentage", 0)
-        efficiency_rating = carbon_data.get("energy_efficiency_rating", 0)
-        carbon_footprint = carbon_data.get("carbon_footprint_tons_per_day", 0)
-        offset_percentage = carbon_data.get("carbon_offset_percentage", 0)
-        initiatives = carbon_data.get("sustainability_initiatives", 0)
-        location = mining_data.get("location", "")
-        location_factor = self.location_factors.get(location, self.default_location_factor)
-        
-        # Normalize values to 0-1 range
-        normalized_initiatives = min(initiatives / 5.0, 1.0)  # Assuming max 5 initiatives
-        
-        # Sigmoid normalization for carbon footprint (lower is better)
-        max_footprint = 100.0
-        normalized_carbon = 1.0 / (1.0 + np.exp(-0.05 * (carbon_footprint - max_footprint/2)))
-        
-        # Create feature array
-        features = np.array([
-            renewable_percentage / 100.0,  # Normalize to 0-1
-            efficiency_rating,             # Already 0-1
-            normalized_carbon,             # Normalized to 0-1
-            offset_percentage / 100.0,     # Normalize to 0-1
-            normalized_initiatives,        # Normalized to 0-1
-            location_factor                # Already 0-1
-        ]).reshape(1, -1)
-        
-        return features
-    
-    def detect_anomalies(self, features_list: List[np.ndarray]) -> List[bool]:
-        """
-        Detect anomalies in mining operation data.
-        
-        Args:
-            features_list: List of feature arrays.
-            
-        Returns:
-            List of boolean values where True indicates an anomaly.
-        """
-        if not features_list:
+        if not operations_data:
             return []
         
-        # Stack features for batch prediction
-        features_array = np.vstack(features_list)
+        features, valid = self.prepare_features_batch(operations_data, carbon_data_list)
+        results: List[Optional[Dict]] = [None] * len(operations_data)
         
-        # Predict anomalies (-1 for anomalies, 1 for normal)
-        predictions = self.anomaly_detector.predict(features_array)
+        # Rows with unusable inputs keep the per-operation path and its error handling
+        for i in np.flatnonzero(~valid):
+            results[i] = self.score_operation(operations_data[i], carbon_data_list[i])
         
-        # Convert to boolean (True for anomalies)
-        return [pred == -1 for pred in predictions]
-    
-    def train(self, training_data: List[Dict]) -> Dict:
-        """
-        Train the ML model on mining operation data.
-        
-        Args:
-            training_data: List of dictionaries with training samples.
-                Each dict should contain 'features' and 'score'.
-                
-        Returns:
-            Dictionary with training metrics.
-        """
-        if not training_data:
-            logger.warning("No training data provided.")
-            return {"error": "No training data provided"}
+        rows = np.flatnonzero(valid)
         
-        try:
-            # Extract features and targets
-            X = np.array([sample['features'] for sample in training_data])
-            y = np.array([sample['score'] for sample in training_data])
-            
-            # Split data for training and validation
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
-            )
-            
-            # Train scoring model
-            self.scoring_pipeline.fit(X_train, y_train)
-            
-            # Train anomaly detection model
-            self.anomaly_detector.fit(X)
-            
-            # Evaluate model
-            y_pred = self.scoring_pipeline.predict(X_test)
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
-            
-            self.is_model_trained = True
-            
-            return {
-                "mse": mse,
-                "r2": r2,
-                "samples_count": len(training_data),
-                "training_date": datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            logger.error(f"Error training model: {str(e)}")
-            return {"error": str(e)}
-    
-    def save_model(self, model_path: str) -> bool:
-        """
-        Save the trained model to disk.
-        
-        Args:
-            model_path: Path to save the model.
-            
-        Returns:
-            True if successful, False otherwise.
-        """
         if not self.is_model_trained:
-            logger.warning("Model not trained yet, cannot save.")
-            return False
-        
-        try:
-            os.makedirs(os.path.dirname(model_path), exist_ok=True)
-            
-            # Save both models in a dictionary
-            models = {
-                'scoring_pipeline': self.scoring_pipeline,
-                'anomaly_detector': self.anomaly_detector
-            }
-            
-            with open(model_path, 'wb') as f:
-                pickle.dump(models, f)
-            
-            logger.info(f"Model saved to {model_path}")
-            return True
+            for i in rows:
+                results[i] = self._rule_based_scoring(operations_data[i], carbon_data_list[i], features[i:i + 1])
+            return results
+        
+        chunk_size = chunk_size or self.batch_chunk_size
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            X = features[chunk]
+            
+            try:
+                scores = self.scoring_pipeline.predict(X)
+                anomaly_scores = self.anomaly_detector.score_samples(X)
+                
+                # IsolationForest.predict flags rows whose decision function is negative
+                is_anomaly = (anomaly_scores - self.anomaly_detector.offset_) < 0
+            except Exception as e:
+                logger.error(f"Error scoring batch of {len(chunk)} operations: {str(e)}")
+                for i in chunk:
+                    results[i] = {
+                        "operation_id": operations_data[i].get("id", "unknown"),
+                        "sustainability_score": 0,
+                        "sustainability_tier": "ERROR",
+                        "error": str(e)
+                    }
+                continue
+            
+            for i, score, anomaly, anomaly_score in zip(chunk, scores.tolist(), is_anomaly.tolist(), anomaly_scores.tolist()):
+                # Clamp score to 0-100 range
+                score = max(0, min(100, score))
+                
+                results[i] = {
+                    "operation_id": operations_data[i].get("id", "unknown"),
+                    "sustainability_score": score,
+                    "sustainability_tier": self._determine_tier(score),
+                    "is_anomaly": anomaly,
+                    "anomaly_score": anomaly_score,
+                    "scoring_method": "ml_model",
+                    "improvement_suggestions": (
+                        ["Verify reported data as unusual patterns were detected."]
+                        if anomaly else self._generate_suggestions(features[i])
+                    )
+                }
         
-        except Exception as e:
-            logger.error(f"Error saving model: {str(e)}")
-            return False
+        return results
     
-    def _load_model(self, model_path: str) -> bool:
-        """
-        Load a trained model from disk.
-        
-        Args:
-            model_path: Path to the saved model.
-            
-        Returns:
-            True if successful, False otherwise.
+    def score_multiple_operations(self, operations_data: List[Dict], carbon_data_list: List[Dict]) -> List[Dict]:
         """
-        try:
-            with open(model_path, 'rb') as f:
-                models = pickle.load(f)
-            
-            self.scoring_pipeline = models['scoring_pipeline']
-            self.anomaly_detector = models['anomaly_detector']
-            self.is_model_trained = True
-            
-            logger.info(f"Model loaded from {model_path}")
-            return True
+        Score multiple mining operations, matching carbon data by operation ID.
         
-        except Exception as e:
-            logger.error(f"Error loading model: {str(e)}")
-            return False
-    
-    def generate_training_data(self, operations_count: int = 1000) -> List[Dict]:
-        """
-        Generate synthetic training data for the ML model.
+        Mirrors ``SustainabilityScorer.score_multiple_operations`` so either
+        scorer can be used interchangeably, and scores through
+        ``score_operations_batch``.
         
         Args:
-            operations_count: Number of synthetic operations to generate.
+            operations_data: List of dictionaries with mining operation data.
+            carbon_data_list: List of dictionaries with carbon footprint data.
             
         Returns:
-            List of dictionaries with synthetic training samples.
+            List of dictionaries containing sustainability scores.
         """
-        training_data = []
-        
-        for i in range(operations_count):
-            # Generate synthetic features
-            renewable = np.random.uniform(0, 100)
-            efficiency = np.random.uniform(0, 1)
-            carbon = np.random.uniform(0, 100)
-            offset = np.random.uniform(0, 100)
-            initiatives = np.random.randint(0, 6)
-            location_factor = np.random.uniform(0.2, 0.95)
-            
-            # Normalize carbon footprint
-            max_footprint = 100.0
-            normalized_carbon = 1.0 / (1.0 + np.exp(-0.05 * (carbon - max_footprint/2)))
-            normalized_initiatives = min(initiatives / 5.0, 1.0)
-            
-            # Create feature vector
-            features = np.array([
-                renewable / 100.0,
-                efficiency,
-                normalized_carbon,
-                offset / 100.0,
-                normalized_initiatives,
-                location_factor
-            ])
-            
-            # Calculate synthetic score (similar to our original formula but with some noise)
-            weights = np.array([0.35, 0.25, -0.20, 0.10, 0.05, 0.05])
-            base_score = np.dot(features, weights)
-            # Add nonlinearity and noise
-            score = 100 * (base_score + 0.5) + np.random.normal(0, 5)
-            # Ensure score is in 0-100 range
-            score = max(0, min(100, score))
-            
-            training_data.append({
-                'features': features,
-                'score': score
-            })
-        
-        return training_data
-    
-    def score_operation(self, mining_data: Dict, carbon_data: Dict) -> Dict:
-        """
-        Score a mining operation using the trained ML model or fallback to rules-based scoring.
-        
-        Args:
-            mining_data: Dictionary with mining operation data.
-            carbon_data: Dictionary with carbon footprint data.
-            
-        Returns:
-            Dictionary containing the sustainability score and additional information.
-        """
-        try:
-            # Prepare features
-            features = self.prepare_features(mining_data, carbon_data)
-            
-            # Score using ML model if trained, otherwise use rule-based approach
-            if self.is_model_trained:
-                score = float(self.scoring_pipeline.predict(features)[0])
-                
-                # Detect if this is an anomaly
-                is_anomaly = self.anomaly_detector.predict(features)[0] == -1
-                anomaly_score = self.anomaly_detector.score_samples(features)[0]
-                
-                # Clamp score to 0-100 range
-                score = max(0, min(100, score))
-                
-                # Determine sustainability tier
-                tier = self._determine_tier(score)
-                
-                result = {
-                    "operation_id": mining_data.get("id", "unknown"),
-                    "sustainability_score": score,
-                    "sustainability_tier": tier,
-                    "is_anomaly": is_anomaly,
-                    "anomaly_score": anomaly_score,
-                    "scoring_method": "ml_model"
-                }
-                
-                # Add suggestions if not an anomaly
-                if not is_anomaly:
-                    result["improvement_suggestions"] = self._generate_suggestions(features[0])
-                else:
-                    result["improvement_suggestions"] = [
-                        "Verify reported data as unusual patterns were detected."
-                    ]
-                
-                return result
-            else:
-                # Fallback to rule-based scoring
-                return self._rule_based_scoring(mining_data, carbon_data, features)
+        carbon_data_map = {
+            carbon_data["operation_id"]: carbon_data
+            for carbon_data in carbon_data_list
+        }
+        carbon_rows = [carbon_data_map.get(op_data.get("id", ""), {}) for op_data in operations_data]
         
-        except Exception as e:
-            logger.error(f"Error scoring operation: {str(e)}")
-            return {
-                "operation_id": mining_data.get("id", "unknown"),
-                "sustainability_score": 0,
-                "sustainability_tier": "ERROR",
-                "error": str(e)
-            }
+        return self.score_operations_batch(operations_data, carbon_rows)
     
     def _rule_based_scoring(self, mining_data: Dict, carbon_data: Dict, features: np.ndarray) -> Dict:
         """
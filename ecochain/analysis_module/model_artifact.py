@@ -0,0 +1,463 @@
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+import os
+import struct
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Model artifact layout:
+#   MAGIC | schema version (uint32) | header length (uint32) | JSON header | arrays
+# Every array starts on an ALIGNMENT-byte boundary, so the whole file can be
+# memory-mapped once and each array used in place without copying. Processes
+# that map the same file share its pages through the OS page cache.
+MAGIC = b"ECOMODEL"
+SCHEMA_VERSION = 1
+ALIGNMENT = 64
+_PREFIX = struct.Struct("<8sII")
+
+# Rows scored to check packed models against the sklearn models they came from
+_PROBE_ROWS = 256
+
+
+def is_artifact(path: str) -> bool:
+    """
+    Check whether a file is a model artifact.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        True if the file starts with the artifact magic bytes.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_artifact(path: str, header: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Write a model artifact atomically.
+
+    Args:
+        path: Destination path.
+        header: JSON-serializable metadata.
+        arrays: Named arrays to store.
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+
+    # Lay out the arrays after the header, which needs their offsets first
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+
+    header = dict(header, schema_version=SCHEMA_VERSION, arrays=layout)
+    header_bytes = json.dumps(header, sort_keys=True).encode('utf-8')
+    data_start = -(-(_PREFIX.size + len(header_bytes)) // ALIGNMENT) * ALIGNMENT
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, SCHEMA_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_artifact(path: str, mmap: bool = True) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Read a model artifact.
+
+    Args:
+        path: Path to the artifact.
+        mmap: Whether to memory-map the arrays read-only instead of reading them into memory.
+
+    Returns:
+        Tuple of (header, arrays).
+
+    Raises:
+        ValueError: If the file is not an artifact or uses a newer schema version.
+    """
+    with open(path, 'rb') as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f"{path} is not a model artifact")
+        magic, version, header_length = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a model artifact")
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"Unsupported model artifact schema version {version} (max {SCHEMA_VERSION})")
+        header = json.loads(f.read(header_length).decode('utf-8'))
+
+    data_start = -(-(_PREFIX.size + header_length) // ALIGNMENT) * ALIGNMENT
+    buffer = np.memmap(path, dtype=np.uint8, mode='r') if mmap else np.fromfile(path, dtype=np.uint8)
+
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        start = data_start + spec["offset"]
+        arrays[name] = buffer[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+
+    return header, arrays
+
+
+class PackedForest:
+    """
+    A tree ensemble flattened into shared node arrays.
+
+    Nodes of all trees are concatenated. Leaves loop back to themselves
+    with an infinite threshold, so evaluation simply takes ``max_depth``
+    steps from every root. Inputs are compared in float32, like sklearn.
+    """
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray,
+                 right: np.ndarray, value: np.ndarray, roots: np.ndarray, max_depth: int):
+        """
+        Initialize the forest.
+
+        Args:
+            feature: Feature index tested at each node.
+            threshold: Split threshold of each node (+inf at leaves).
+            left: Index of each node's left child (itself at leaves).
+            right: Index of each node's right child (itself at leaves).
+            value: Per-node output; only leaf values are used.
+            roots: Index of each tree's root node.
+            max_depth: Maximum depth over all trees.
+        """
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+
+    @classmethod
+    def from_trees(cls, trees: List[Any], values: List[np.ndarray],
+                   feature_maps: Optional[List[np.ndarray]] = None) -> "PackedForest":
+        """
+        Pack fitted sklearn trees.
+
+        Args:
+            trees: The ``tree_`` objects of the fitted estimators.
+            values: Per-node output for each tree.
+            feature_maps: Optional per-tree mapping from tree feature index to input column.
+
+        Returns:
+            The packed forest.
+        """
+        features, thresholds, lefts, rights, node_values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+
+        for i, (tree, value) in enumerate(zip(trees, values)):
+            nodes = np.arange(tree.node_count)
+            leaf = tree.children_left == -1
+
+            feature = np.where(leaf, 0, tree.feature)
+            if feature_maps is not None:
+                feature = np.where(leaf, 0, np.asarray(feature_maps[i])[feature])
+
+            features.append(feature.astype(np.int32))
+            thresholds.append(np.where(leaf, np.inf, tree.threshold))
+            lefts.append((np.where(leaf, nodes, tree.children_left) + offset).astype(np.int32))
+            rights.append((np.where(leaf, nodes, tree.children_right) + offset).astype(np.int32))
+            node_values.append(np.asarray(value, dtype=np.float64))
+            roots.append(offset)
+
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts),
+            right=np.concatenate(rights),
+            value=np.concatenate(node_values),
+            roots=np.asarray(roots, dtype=np.int32),
+            max_depth=int(max_depth)
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], prefix: str, max_depth: int) -> "PackedForest":
+        """Build a forest from artifact arrays stored under ``prefix``."""
+        return cls(
+            feature=arrays[f"{prefix}_feature"],
+            threshold=arrays[f"{prefix}_threshold"],
+            left=arrays[f"{prefix}_left"],
+            right=arrays[f"{prefix}_right"],
+            value=arrays[f"{prefix}_value"],
+            roots=arrays[f"{prefix}_roots"],
+            max_depth=max_depth
+        )
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        """Get the node arrays for storage under ``prefix``."""
+        return {
+            f"{prefix}_feature": self.feature,
+            f"{prefix}_threshold": self.threshold,
+            f"{prefix}_left": self.left,
+            f"{prefix}_right": self.right,
+            f"{prefix}_value": self.value,
+            f"{prefix}_roots": self.roots
+        }
+
+    def leaf_values(self, X: np.ndarray) -> np.ndarray:
+        """
+        Evaluate every tree on every row.
+
+        Args:
+            X: Input matrix of shape (n, features).
+
+        Returns:
+            Array of shape (n, trees) with the value of the leaf each row reaches.
+        """
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots)))
+
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        return self.value[nodes]
+
+
+class PackedRegressor:
+    """Packed replacement for the StandardScaler + RandomForestRegressor pipeline."""
+
+    def __init__(self, mean: np.ndarray, scale: np.ndarray, forest: PackedForest):
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.forest = forest
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predict scores for the rows of X, like ``Pipeline.predict``."""
+        X = (np.asarray(X, dtype=np.float64) - self.mean) / self.scale
+        return self.forest.leaf_values(X).mean(axis=1)
+
+
+class PackedIsolationForest:
+    """Packed replacement for a fitted IsolationForest."""
+
+    def __init__(self, forest: PackedForest, denominator: float, offset: float):
+        """
+        Initialize the detector.
+
+        Args:
+            forest: Forest whose leaf values are path lengths (path node count + average path length - 1).
+            denominator: Number of trees times the average path length of ``max_samples``.
+            offset: The fitted ``offset_`` of the IsolationForest.
+        """
+        self.forest = forest
+        self.denominator = denominator
+        self.offset_ = offset
+
+    def score_samples(self, X: np.ndarray) -> np.ndarray:
+        """Compute anomaly scores, like ``IsolationForest.score_samples``."""
+        depths = self.forest.leaf_values(X).sum(axis=1)
+        if self.denominator == 0:
+            return -np.ones_like(depths)
+        return -(2 ** (-depths / self.denominator))
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        """Compute the decision function, like ``IsolationForest.decision_function``."""
+        return self.score_samples(X) - self.offset_
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predict -1 for anomalies and 1 for normal rows, like ``IsolationForest.predict``."""
+        return np.where(self.decision_function(X) < 0, -1, 1)
+
+
+def _average_path_length(n_samples: Any) -> np.ndarray:
+    """
+    Average path length of an unsuccessful binary search tree search.
+
+    This is the normalization c(n) of the isolation forest paper (Liu et
+    al., 2008): 0 for n <= 1, 1 for n == 2, and otherwise
+    2 * (ln(n - 1) + Euler's constant) - 2 * (n - 1) / n.
+
+    Args:
+        n_samples: Sample counts.
+
+    Returns:
+        Array of average path lengths.
+    """
+    n = np.asarray(n_samples, dtype=np.float64)
+    result = np.zeros_like(n)
+    result[n == 2] = 1.0
+    large = n > 2
+    result[large] = 2.0 * (np.log(n[large] - 1.0) + np.euler_gamma) - 2.0 * (n[large] - 1.0) / n[large]
+    return result
+
+
+def _path_node_counts(tree: Any) -> np.ndarray:
+    """Get the number of nodes on the path from the root to every node of a fitted sklearn tree."""
+    depth = np.ones(tree.node_count)
+    for node in range(tree.node_count):
+        if tree.children_left[node] != -1:
+            depth[tree.children_left[node]] = depth[node] + 1
+            depth[tree.children_right[node]] = depth[node] + 1
+    return depth
+
+
+def _isolation_path_lengths(detector: Any) -> Tuple[List[np.ndarray], float]:
+    """
+    Get per-node path lengths and the score denominator of a fitted IsolationForest.
+
+    Only public attributes of the fitted detector and its trees are used.
+
+    Returns:
+        Tuple of (per-tree arrays of path node count + average path length - 1, denominator).
+    """
+    path_lengths = [
+        _path_node_counts(estimator.tree_) + _average_path_length(estimator.tree_.n_node_samples) - 1.0
+        for estimator in detector.estimators_
+    ]
+    denominator = len(detector.estimators_) * float(_average_path_length([detector.max_samples_])[0])
+    return path_lengths, denominator
+
+
+def _check_packed_models(scoring_pipeline: Any, anomaly_detector: Any,
+                         regressor: PackedRegressor, detector: PackedIsolationForest) -> None:
+    """
+    Check that packed models reproduce the sklearn models they were built from.
+
+    Packing relies on how sklearn lays out fitted trees and computes anomaly
+    scores, so a probe batch is scored both ways to catch a scikit-learn
+    version that behaves differently.
+
+    Raises:
+        ValueError: If the packed predictions differ from sklearn's.
+    """
+    rng = np.random.default_rng(0)
+    checks = []
+    if not isinstance(scoring_pipeline, PackedRegressor):
+        X = rng.uniform(-0.5, 1.5, (_PROBE_ROWS, scoring_pipeline.n_features_in_))
+        checks.append(("scoring model", regressor.predict(X), scoring_pipeline.predict(X)))
+    if not isinstance(anomaly_detector, PackedIsolationForest):
+        X = rng.uniform(-0.5, 1.5, (_PROBE_ROWS, anomaly_detector.n_features_in_))
+        checks.append(("anomaly detector", detector.score_samples(X), anomaly_detector.score_samples(X)))
+
+    for name, packed, expected in checks:
+        if not np.allclose(packed, expected, rtol=1e-9, atol=1e-12):
+            import sklearn
+            raise ValueError(
+                f"Packed {name} does not reproduce scikit-learn {sklearn.__version__}; "
+                f"save the model with format='pickle' instead"
+            )
+
+
+def pack_models(scoring_pipeline: Any, anomaly_detector: Any) -> Tuple[PackedRegressor, PackedIsolationForest]:
+    """
+    Convert fitted scoring and anomaly models to their packed form.
+
+    Args:
+        scoring_pipeline: Fitted StandardScaler + RandomForestRegressor pipeline, or a PackedRegressor.
+        anomaly_detector: Fitted IsolationForest, or a PackedIsolationForest.
+
+    Returns:
+        Tuple of (regressor, anomaly detector).
+
+    Raises:
+        ValueError: If the packed models do not reproduce the sklearn models.
+    """
+    if isinstance(scoring_pipeline, PackedRegressor):
+        regressor = scoring_pipeline
+    else:
+        scaler = scoring_pipeline.named_steps['scaler']
+        model = scoring_pipeline.named_steps['model']
+        regressor = PackedRegressor(
+            mean=scaler.mean_,
+            scale=scaler.scale_,
+            forest=PackedForest.from_trees(
+                [e.tree_ for e in model.estimators_],
+                [e.tree_.value[:, 0, 0] for e in model.estimators_]
+            )
+        )
+
+    if isinstance(anomaly_detector, PackedIsolationForest):
+        detector = anomaly_detector
+    else:
+        path_lengths, denominator = _isolation_path_lengths(anomaly_detector)
+        detector = PackedIsolationForest(
+            forest=PackedForest.from_trees(
+                [e.tree_ for e in anomaly_detector.estimators_],
+                path_lengths,
+                anomaly_detector.estimators_features_
+            ),
+            denominator=denominator,
+            offset=float(anomaly_detector.offset_)
+        )
+
+    _check_packed_models(scoring_pipeline, anomaly_detector, regressor, detector)
+    return regressor, detector
+
+
+def export_models(scoring_pipeline: Any, anomaly_detector: Any,
+                  features: List[str]) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Convert fitted scoring and anomaly models to an artifact header and arrays.
+
+    Args:
+        scoring_pipeline: Fitted StandardScaler + RandomForestRegressor pipeline, or a PackedRegressor.
+        anomaly_detector: Fitted IsolationForest, or a PackedIsolationForest.
+        features: Names of the input features.
+
+    Returns:
+        Tuple of (header, arrays) for ``write_artifact``.
+    """
+    regressor, detector = pack_models(scoring_pipeline, anomaly_detector)
+
+    header = {
+        "format": "ecochain-sustainability-model",
+        "created": datetime.now().isoformat(),
+        "features": list(features),
+        "scaler": {"mean": regressor.mean.tolist(), "scale": regressor.scale.tolist()},
+        "regressor": {"n_estimators": len(regressor.forest.roots), "max_depth": regressor.forest.max_depth},
+        "anomaly_detector": {
+            "n_estimators": len(detector.forest.roots),
+            "max_depth": detector.forest.max_depth,
+            "denominator": detector.denominator,
+            "offset": detector.offset_
+        }
+    }
+    arrays = dict(regressor.forest.to_arrays("regressor"), **detector.forest.to_arrays("anomaly"))
+    return header, arrays
+
+
+def load_models(path: str, mmap: bool = True) -> Tuple[PackedRegressor, PackedIsolationForest, Dict[str, Any]]:
+    """
+    Load packed scoring and anomaly models from an artifact.
+
+    Args:
+        path: Path to the artifact.
+        mmap: Whether to memory-map the tree arrays.
+
+    Returns:
+        Tuple of (regressor, anomaly detector, header).
+    """
+    header, arrays = read_artifact(path, mmap=mmap)
+
+    regressor = PackedRegressor(
+        mean=header["scaler"]["mean"],
+        scale=header["scaler"]["scale"],
+        forest=PackedForest.from_arrays(arrays, "regressor", header["regressor"]["max_depth"])
+    )
+    detector = PackedIsolationForest(
+        forest=PackedForest.from_arrays(arrays, "anomaly", header["anomaly_detector"]["max_depth"]),
+        denominator=header["anomaly_detector"]["denominator"],
+        offset=header["anomaly_detector"]["offset"]
+    )
+    return regressor, detector, header
@@ -8,15 +8,226 @@ and analyzes correlations between sustainability scores and market values.
 import logging
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+from datetime import datetime
 import json
 import os
 import math
-from scipy import stats
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from scipy import fft, stats
+
+from ecochain.analysis_module import holt_winters
+from ecochain.analysis_module.holt_winters import HoltWintersCache, HoltWintersFit
 
 logger = logging.getLogger(__name__)
 
+def _project_scores(start: np.ndarray, trend: np.ndarray, factors: np.ndarray) -> np.ndarray:
+    """
+    Roll damped-trend seasonal forecasts forward over the horizon.
+    
+    Each day adds the trend to the previous value, applies that day's
+    seasonal factor and clamps the result to 0-100. The clamp makes every
+    day depend on the one before, so the loop runs over forecast days with
+    all series advancing together.
+    
+    Args:
+        start: Last smoothed score of each series, shape (n,).
+        trend: Damped average trend of each series, shape (n,).
+        factors: Seasonal factor of each series and forecast day, shape (n, horizon).
+        
+    Returns:
+        Forecast values of shape (n, horizon).
+    """
+    values = np.empty(factors.shape)
+    current = np.asarray(start, dtype=np.float64)
+    for day in range(factors.shape[1]):
+        current = np.minimum(np.maximum((current + trend) * factors[:, day], 0), 100)
+        values[:, day] = current
+    return values
+
+def _forecast_frame(history: pd.DataFrame, horizon_days: int, params: Dict) -> pd.DataFrame:
+    """
+    Forecast every series of a cleaned long-format history table.
+    
+    Applies the model of ``PredictiveAnalytics.forecast_sustainability`` to
+    all series at once: per-series statistics come from groupby
+    aggregations and the horizon is generated as (series x day) arrays.
+    This is a module-level function so that it can run in a process pool.
+    
+    Args:
+        history: DataFrame with 'operation_id', naive datetime 'date' and float
+            'score' columns, sorted by operation ID and date.
+        horizon_days: Number of days to forecast ahead.
+        params: Forecast parameters (``PredictiveAnalytics.forecast_params``).
+        
+    Returns:
+        Long-format forecast DataFrame.
+    """
+    # Group on integer series codes; factorizing the IDs once is much cheaper
+    codes, series_ids = pd.factorize(history['operation_id'])
+    by_series = history.groupby(codes)
+    scores = by_series['score']
+    counts = scores.count().to_numpy()
+    
+    # Smoothed last score and damped average trend
+    alpha = 0.3  # Smoothing factor
+    last_score = scores.ewm(alpha=alpha).mean().groupby(level=0).last().to_numpy()
+    trend = scores.diff().fillna(0).groupby(codes).mean().to_numpy() * params["trend_damping"]
+    
+    # Seasonal factor per series and weekday, 1.0 where there is no history
+    factors = np.ones((len(series_ids), 7))
+    seasonal = counts >= params["seasonality_period"]
+    if seasonal.any():
+        weekday = history['date'].dt.weekday.to_numpy()
+        weekday_means = history['score'].groupby(codes * 7 + weekday).mean()
+        means = np.full(len(series_ids) * 7, np.nan)
+        means[weekday_means.index.to_numpy()] = weekday_means.to_numpy()
+        ratios = means.reshape(-1, 7) / scores.mean().to_numpy()[:, np.newaxis]
+        ratios[np.isnan(ratios)] = 1.0
+        factors[seasonal] = ratios[seasonal]
+    
+    # Forecast days and their weekdays (1970-01-01 was a Thursday)
+    last_day = by_series['date'].last().to_numpy().astype('datetime64[D]')
+    steps = np.arange(1, horizon_days + 1)
+    weekdays = (last_day.astype(np.int64)[:, np.newaxis] + 3 + steps) % 7
+    
+    values = _project_scores(last_score, trend, np.take_along_axis(factors, weekdays, axis=1))
+    
+    # Confidence intervals
+    std_dev = scores.std().replace(0, 1.0).fillna(1.0).to_numpy()
+    z_value = stats.norm.ppf((1 + params["confidence_interval"]) / 2)
+    margin = (z_value * std_dev)[:, np.newaxis]
+    
+    return pd.DataFrame({
+        'operation_id': np.repeat(series_ids.to_numpy(), horizon_days),
+        'date': (last_day[:, np.newaxis] + steps.astype('timedelta64[D]')).ravel(),
+        'forecasted_score': np.round(values, 2).ravel(),
+        'lower_bound': np.round(np.maximum(0, values - margin), 2).ravel(),
+        'upper_bound': np.round(np.minimum(100, values + margin), 2).ravel()
+    })
+
+def _lagged_correlations(
+    x: np.ndarray,
+    y: np.ndarray,
+    lags: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pearson correlation of ``x[t - lag]`` with ``y[t]`` for many lags at once.
+    
+    Both series are on the same regular grid with NaN where a value is
+    missing. Every sum a correlation needs (pair count, sums, sums of
+    squares and cross products over the pairs where both values exist) is
+    a cross-correlation of the masked series, so all lags come out of one
+    batch of FFTs instead of one ``pearsonr`` call per lag. Each lag gets
+    its own sample size, and its p-value is the two-sided t-test that
+    ``stats.pearsonr`` reports.
+    
+    Args:
+        x: Leading series.
+        y: Lagging series, same length as ``x``.
+        lags: Integer lags; negative lags mean ``y`` leads ``x``.
+        
+    Returns:
+        Tuple of (correlations, p-values, sample sizes) per lag. Lags with
+        fewer than 3 pairs or no variance get NaN correlation and p-value.
+    """
+    n = len(x)
+    x_mask, y_mask = ~np.isnan(x), ~np.isnan(y)
+    # Center the series so the sums stay small relative to the FFT rounding error
+    x_centered = np.where(x_mask, x - np.nanmean(x), 0.0)
+    y_centered = np.where(y_mask, y - np.nanmean(y), 0.0)
+    
+    size = fft.next_fast_len(2 * n - 1, real=True)
+    left = fft.rfft(np.stack([x_mask.astype(np.float64), x_centered, x_centered ** 2]), size, axis=1)
+    right = fft.rfft(np.stack([y_mask.astype(np.float64), y_centered, y_centered ** 2]), size, axis=1)
+    
+    # Row i of sums[k] is the sum over pairs at lag k of: count, x, x^2, y, y^2, x*y
+    sums = fft.irfft(np.conj(left[[0, 1, 2, 0, 0, 1]]) * right[[0, 0, 0, 1, 2, 1]], size, axis=1)
+    count, sx, sxx, sy, syy, sxy = sums[:, np.asarray(lags) % size]
+    count = np.where(np.abs(lags) < n, np.rint(count), 0).astype(np.int64)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pairs = np.maximum(count, 1)
+        x_spread = sxx - sx * sx / pairs
+        y_spread = syy - sy * sy / pairs
+        correlation = np.clip((sxy - sx * sy / pairs) / np.sqrt(x_spread * y_spread), -1.0, 1.0)
+        # Spreads at FFT rounding level mean a constant series at that lag
+        tolerance = 1e-10 * np.array([np.sum(x_centered ** 2), np.sum(y_centered ** 2)])
+        correlation[(count < 3) | (x_spread <= tolerance[0]) | (y_spread <= tolerance[1])] = np.nan
+    
+    return correlation, _correlation_p_values(correlation, count), count
+
+def _correlation_p_values(correlation: Any, count: Any) -> np.ndarray:
+    """
+    Two-sided p-values of Pearson correlations, as reported by ``stats.pearsonr``.
+    
+    Args:
+        correlation: Correlation coefficients; NaN gives a NaN p-value.
+        count: Sample size of each coefficient.
+        
+    Returns:
+        Array of p-values.
+    """
+    correlation = np.asarray(correlation, dtype=np.float64)
+    dof = np.asarray(count) - 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = np.abs(correlation) * np.sqrt(dof / (1 - correlation ** 2))
+        p_value = np.where(np.abs(correlation) == 1, 0.0, 2 * stats.t.sf(t_stat, dof))
+    return np.where(np.isnan(correlation), np.nan, p_value)
+
+def _holt_winters_frame(
+    history: pd.DataFrame,
+    horizon_days: int,
+    params: Dict,
+    cached: Dict[Any, HoltWintersFit]
+) -> Tuple[pd.DataFrame, Dict[Any, Tuple[HoltWintersFit, str]]]:
+    """
+    Forecast every series of a cleaned long-format history table with Holt-Winters.
+    
+    Each series' cached fit is reused or extended when its history allows
+    (see ``holt_winters.fit_or_extend``) and refitted otherwise. This is a
+    module-level function so that it can run in a process pool; the
+    updated fits are returned for the caller to store.
+    
+    Args:
+        history: DataFrame with 'operation_id', naive datetime 'date' and float
+            'score' columns, sorted by operation ID and date.
+        horizon_days: Number of days to forecast ahead.
+        params: Forecast parameters (``PredictiveAnalytics.forecast_params``).
+        cached: Previous fits by operation ID.
+        
+    Returns:
+        Tuple of (long-format forecast DataFrame, {operation ID: (fit, action)}).
+    """
+    codes, series_ids = pd.factorize(history['operation_id'])
+    bounds = np.flatnonzero(np.diff(codes)) + 1
+    starts, ends = np.r_[0, bounds], np.r_[bounds, len(codes)]
+    dates = history['date'].to_numpy()
+    scores = history['score'].to_numpy()
+    steps = np.arange(1, horizon_days + 1).astype('timedelta64[D]')
+    
+    fits = {}
+    parts = []
+    for operation_id, start, end in zip(series_ids, starts, ends):
+        model, action = holt_winters.fit_or_extend(
+            dates[start:end], scores[start:end], cached.get(operation_id),
+            params["seasonality_period"], params["refit_interval"]
+        )
+        fits[operation_id] = (model, action)
+        values, lower, upper = holt_winters.forecast(model, horizon_days, params["confidence_interval"])
+        parts.append((operation_id, dates[end - 1].astype('datetime64[D]') + steps, values, lower, upper))
+    
+    operation_ids, forecast_dates, values, lower, upper = zip(*parts)
+    frame = pd.DataFrame({
+        'operation_id': np.repeat(np.array(operation_ids, dtype=object), horizon_days),
+        'date': np.concatenate(forecast_dates),
+        'forecasted_score': np.round(np.concatenate(values), 2),
+        'lower_bound': np.round(np.concatenate(lower), 2),
+        'upper_bound': np.round(np.concatenate(upper), 2)
+    })
+    return frame, fits
+
 class PredictiveAnalytics:
     """
     Class for forecasting sustainability metrics and analyzing market correlations.
@@ -37,7 +248,10 @@ class PredictiveAnalytics:
             "confidence_interval": 0.95,  # 95% confidence interval
             "seasonality_period": 7,  # Weekly seasonality
             "trend_damping": 0.9,  # Damping factor for trend
-            "min_data_points": 10  # Minimum data points needed for forecasting
+            "min_data_points": 10,  # Minimum data points needed for forecasting
+            "method": "simple",  # "simple" smoothing or fitted "holt_winters"
+            "refit_interval": 30,  # Days of new data before Holt-Winters parameters are refitted
+            "cache_path": None  # Optional JSON file persisting Holt-Winters fits
         }
         
         # Market correlation parameters
@@ -45,7 +259,8 @@ class PredictiveAnalytics:
             "lookback_days": 180,  # Analyze last 180 days by default
             "smoothing_window": 7,  # 7-day moving average
             "lag_days": [0, 1, 3, 7, 14, 30],  # Lag days to analyze
-            "significance_threshold": 0.05  # p-value threshold for significance
+            "significance_threshold": 0.05,  # p-value threshold for significance
+            "price_tolerance_days": 0  # Use a price up to this many days older than a score
         }
         
         # Load any additional parameters from model if provided
@@ -59,26 +274,46 @@ class PredictiveAnalytics:
                         self.market_params.update(model_data['market_params'])
             except Exception as e:
                 logger.error(f"Error loading model data: {str(e)}")
+        
+        # Fitted Holt-Winters models by operation ID
+        self.forecast_cache = HoltWintersCache(self.forecast_params["cache_path"])
     
     def forecast_sustainability(
         self, 
         historical_scores: List[Dict], 
-        horizon_days: Optional[int] = None
+        horizon_days: Optional[int] = None,
+        method: Optional[str] = None,
+        operation_id: Optional[str] = None
     ) -> Dict:
         """
         Forecast future sustainability scores based on historical data.
         
+        The "simple" method projects a smoothed score along a damped average
+        trend with weekday factors, with a constant interval width. The
+        "holt_winters" method fits a damped additive Holt-Winters model to
+        the daily series, and its prediction intervals widen with the
+        horizon. Holt-Winters fits are cached by ``operation_id`` and reused
+        while the operation's history only grows.
+        
         Args:
             historical_scores: List of dictionaries with historical score data.
                 Each dictionary should have at least 'date' and 'score' keys.
             horizon_days: Number of days to forecast ahead (optional).
+            method: "simple" or "holt_winters" (optional, defaults to forecast_params["method"]).
+            operation_id: ID of the operation, used to cache Holt-Winters fits (optional).
             
         Returns:
             Dictionary with forecast results.
         """
-        # Use default horizon if not specified
+        # Use default horizon and method if not specified
         if horizon_days is None:
             horizon_days = self.forecast_params["horizon_days"]
+        method = method or self.forecast_params["method"]
+        if method not in ("simple", "holt_winters"):
+            return {
+                "error": f"Unknown forecast method: {method}",
+                "forecast": []
+            }
             
         try:
             # Convert to DataFrame for easier manipulation
@@ -89,33 +324,20 @@ class PredictiveAnalytics:
                     "confidence_intervals": []
                 }
                 
-            # Extract dates and scores
-            dates = []
-            scores = []
-            
-            for entry in historical_scores:
-                # Handle different date formats
-                if isinstance(entry.get('date'), str):
-                    try:
-                        date = datetime.fromisoformat(entry['date'].replace('Z', '+00:00'))
-                    except ValueError:
-                        try:
-                            date = datetime.strptime(entry['date'], '%Y-%m-%d')
-                        except ValueError:
-                            logger.warning(f"Could not parse date: {entry['date']}")
-                            continue
-                elif isinstance(entry.get('date'), datetime):
-                    date = entry['date']
-                else:
-                    logger.warning(f"Invalid date format: {entry.get('date')}")
-                    continue
-                
-                score = entry.get('score') or entry.get('sustainability_score')
-                if score is not None:
-                    dates.append(date)
-                    scores.append(float(score))
+            # Parse every date in one pass and keep entries with a usable date and score
+            dates = self._parse_dates([entry.get('date') for entry in historical_scores])
+            scores = pd.Series(
+                [entry.get('score') or entry.get('sustainability_score') for entry in historical_scores],
+                dtype=object
+            )
             
-            if len(dates) < self.forecast_params["min_data_points"]:
+            unparsed = int(dates.isna().sum())
+            if unparsed:
+                logger.warning(f"Skipping {unparsed} entries with missing or unparseable dates")
+            
+            valid = dates.notna() & scores.notna()
+            
+            if valid.sum() < self.forecast_params["min_data_points"]:
                 return {
                     "error": f"Insufficient data points. Need at least {self.forecast_params['min_data_points']}",
                     "forecast": [],
@@ -124,82 +346,92 @@ class PredictiveAnalytics:
                 
             # Create DataFrame
             df = pd.DataFrame({
-                'date': dates,
-                'score': scores
+                'date': dates[valid].to_numpy(),
+                'score': scores[valid].astype(float).to_numpy()
             })
             
             # Sort by date
             df = df.sort_values('date')
             
-            # Simple exponential smoothing with trend and seasonality (Holt-Winters)
-            # In a real implementation, this would use more sophisticated models
-            # like ARIMA, Prophet, or deep learning models
-            
-            # Calculate trend
-            df['trend'] = df['score'].diff().fillna(0)
-            
-            # Apply exponential smoothing
-            alpha = 0.3  # Smoothing factor
-            df['smooth_score'] = df['score'].ewm(alpha=alpha).mean()
-            
-            # Calculate average trend
-            avg_trend = df['trend'].mean() * self.forecast_params["trend_damping"]
-            
-            # Get the last observed score
-            last_score = df['smooth_score'].iloc[-1]
             last_date = df['date'].iloc[-1]
             
             # Generate forecast dates
-            forecast_dates = [last_date + timedelta(days=i+1) for i in range(horizon_days)]
-            
-            # Generate forecast values
-            forecast_values = []
-            for i in range(horizon_days):
-                # Apply trend and add some randomness
-                next_score = last_score + avg_trend
+            forecast_dates = last_date + pd.to_timedelta(np.arange(1, horizon_days + 1), unit='D')
+            
+            model_info = None
+            if method == "holt_winters":
+                model = self._holt_winters_model(df, operation_id)
+                forecast_values, lower_bounds, upper_bounds = holt_winters.forecast(
+                    model, horizon_days, self.forecast_params["confidence_interval"]
+                )
+                model_info = {
+                    'alpha': round(model.alpha, 4),
+                    'beta': round(model.beta, 4),
+                    'gamma': round(model.gamma, 4),
+                    'phi': round(model.phi, 4),
+                    'residual_std': round(math.sqrt(model.sigma2), 4)
+                }
+            else:
+                # Simple exponential smoothing with trend and seasonality (Holt-Winters)
+                # In a real implementation, this would use more sophisticated models
+                # like ARIMA, Prophet, or deep learning models
+                
+                # Calculate trend
+                df['trend'] = df['score'].diff().fillna(0)
                 
-                # Apply seasonality if we have enough data
+                # Apply exponential smoothing
+                alpha = 0.3  # Smoothing factor
+                df['smooth_score'] = df['score'].ewm(alpha=alpha).mean()
+                
+                # Calculate average trend
+                avg_trend = df['trend'].mean() * self.forecast_params["trend_damping"]
+                
+                # Get the last observed score
+                last_score = df['smooth_score'].iloc[-1]
+                
+                # Seasonal factor for each forecast day, computed once per weekday
+                factors = np.ones(horizon_days)
                 if len(df) >= self.forecast_params["seasonality_period"]:
-                    # Get the same day of week from previous weeks
-                    day_of_week = (last_date + timedelta(days=i+1)).weekday()
-                    seasonal_scores = df[df['date'].dt.weekday == day_of_week]['score']
-                    if len(seasonal_scores) > 0:
-                        seasonal_factor = seasonal_scores.mean() / df['score'].mean()
-                        next_score *= seasonal_factor
+                    factors = self._weekday_factors(df)[forecast_dates.weekday]
                 
-                # Ensure score is within valid range (0-100)
-                next_score = max(0, min(100, next_score))
+                # Generate forecast values
+                forecast_values = _project_scores(
+                    np.array([last_score]), np.array([avg_trend]), factors[np.newaxis, :]
+                )[0]
                 
-                forecast_values.append(next_score)
-                last_score = next_score
-            
-            # Calculate confidence intervals
-            # In a real implementation, this would be based on prediction intervals
-            # from the forecasting model
-            std_dev = df['score'].std() or 1.0  # Default to 1 if std dev is 0
-            z_value = stats.norm.ppf((1 + self.forecast_params["confidence_interval"]) / 2)
-            margin = z_value * std_dev
-            
-            lower_bounds = [max(0, val - margin) for val in forecast_values]
-            upper_bounds = [min(100, val + margin) for val in forecast_values]
+                # Calculate confidence intervals
+                # In a real implementation, this would be based on prediction intervals
+                # from the forecasting model
+                std_dev = df['score'].std() or 1.0  # Default to 1 if std dev is 0
+                z_value = stats.norm.ppf((1 + self.forecast_params["confidence_interval"]) / 2)
+                margin = z_value * std_dev
+                
+                lower_bounds = np.maximum(0, forecast_values - margin)
+                upper_bounds = np.minimum(100, forecast_values + margin)
             
             # Prepare result
-            forecast_data = []
-            for i in range(horizon_days):
-                forecast_data.append({
-                    'date': forecast_dates[i].strftime('%Y-%m-%d'),
-                    'forecasted_score': round(forecast_values[i], 2),
-                    'lower_bound': round(lower_bounds[i], 2),
-                    'upper_bound': round(upper_bounds[i], 2)
-                })
+            forecast_values = forecast_values.tolist()
+            forecast_data = [
+                {
+                    'date': date,
+                    'forecasted_score': round(value, 2),
+                    'lower_bound': round(lower, 2),
+                    'upper_bound': round(upper, 2)
+                }
+                for date, value, lower, upper in zip(
+                    forecast_dates.strftime('%Y-%m-%d'), forecast_values,
+                    lower_bounds.tolist(), upper_bounds.tolist()
+                )
+            ]
             
             # Calculate trend indicators
             short_term_trend = self._calculate_trend(forecast_values[:30])
             medium_term_trend = self._calculate_trend(forecast_values[:60])
             long_term_trend = self._calculate_trend(forecast_values)
             
-            return {
+            result = {
                 'forecast': forecast_data,
+                'method': method,
                 'confidence_interval': self.forecast_params["confidence_interval"],
                 'trend_analysis': {
                     'short_term': {
@@ -219,6 +451,10 @@ class PredictiveAnalytics:
                 'last_observed_date': df['date'].iloc[-1].strftime('%Y-%m-%d'),
                 'forecast_generated_at': datetime.now().isoformat()
             }
+            if model_info:
+                result['model'] = model_info
+            
+            return result
             
         except Exception as e:
             logger.error(f"Error forecasting sustainability: {str(e)}")
@@ -227,23 +463,188 @@ class PredictiveAnalytics:
                 "forecast": []
             }
     
+    def forecast_batch(
+        self,
+        history: Any,
+        horizon_days: Optional[int] = None,
+        workers: int = 0,
+        chunk_size: int = 10000,
+        method: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Forecast sustainability scores for many operations at once.
+        
+        With the "simple" method, fits the same smoothing, damped trend and
+        weekday seasonality as ``forecast_sustainability`` for every series
+        together, using groupby aggregations and (series x horizon) arrays
+        instead of one call per operation. With "holt_winters", each series
+        is brought up to date through ``forecast_cache``: operations whose
+        history only gained new days extend their cached fit, and only
+        those with changed history, no fit or ``refit_interval`` new days
+        are refitted. The cache is saved afterwards if it has a path.
+        
+        With ``workers`` above 1, series are split into chunks of
+        ``chunk_size`` and forecast in a process pool.
+        
+        Args:
+            history: Long-format DataFrame, or list of dictionaries, with
+                'operation_id', 'date' and 'score' columns.
+            horizon_days: Number of days to forecast ahead (optional).
+            workers: Number of worker processes; 0 or 1 forecasts in this process.
+            chunk_size: Number of series per worker task.
+            method: "simple" or "holt_winters" (optional, defaults to forecast_params["method"]).
+            
+        Returns:
+            Long-format DataFrame with 'operation_id', 'date',
+            'forecasted_score', 'lower_bound' and 'upper_bound' columns, one
+            row per operation and forecast day. Operations with fewer than
+            ``min_data_points`` usable points are left out.
+            
+        Raises:
+            ValueError: If a required column is missing or the method is unknown.
+        """
+        if horizon_days is None:
+            horizon_days = self.forecast_params["horizon_days"]
+        method = method or self.forecast_params["method"]
+        if method not in ("simple", "holt_winters"):
+            raise ValueError(f"Unknown forecast method: {method}")
+        
+        frame = history if isinstance(history, pd.DataFrame) else pd.DataFrame(history)
+        missing = {'operation_id', 'date', 'score'} - set(frame.columns)
+        if missing:
+            raise ValueError(f"History is missing columns: {', '.join(sorted(missing))}")
+        
+        # Parse dates and scores once for the whole table
+        dates = frame['date']
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors='coerce', format='ISO8601')
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        
+        clean = pd.DataFrame({
+            'operation_id': frame['operation_id'].to_numpy(),
+            'date': dates.to_numpy(),
+            'score': pd.to_numeric(frame['score'], errors='coerce').to_numpy(dtype=np.float64)
+        }).dropna()
+        
+        # Sort by operation and date, and leave out series that are too short to forecast
+        codes, _ = pd.factorize(clean['operation_id'], sort=True)
+        order = np.lexsort((clean['date'].to_numpy(), codes))
+        codes = codes[order]
+        sizes = np.bincount(codes)
+        enough = sizes[codes] >= self.forecast_params["min_data_points"]
+        skipped = int((sizes < self.forecast_params["min_data_points"]).sum())
+        if skipped:
+            logger.warning(f"Skipping {skipped} operations with fewer than "
+                           f"{self.forecast_params['min_data_points']} data points")
+        clean = clean.iloc[order[enough]]
+        codes = codes[enough]
+        
+        if clean.empty or horizon_days <= 0:
+            return pd.DataFrame(columns=['operation_id', 'date', 'forecasted_score', 'lower_bound', 'upper_bound'])
+        
+        # Number the remaining series 0..n-1 in order
+        series = np.cumsum(np.r_[True, codes[1:] != codes[:-1]]) - 1
+        chunks = [clean]
+        if workers > 1 and series[-1] >= chunk_size:
+            bounds = np.flatnonzero(np.diff(series // chunk_size)) + 1
+            starts, ends = np.r_[0, bounds], np.r_[bounds, len(clean)]
+            chunks = [clean.iloc[start:end] for start, end in zip(starts, ends)]
+        
+        if method == "holt_winters":
+            return self._holt_winters_batch(chunks, horizon_days, workers)
+        
+        if len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_forecast_frame, chunks, repeat(horizon_days), repeat(self.forecast_params)))
+            return pd.concat(parts, ignore_index=True)
+        
+        return _forecast_frame(clean, horizon_days, self.forecast_params)
+    
+    def _holt_winters_batch(self, chunks: List[pd.DataFrame], horizon_days: int, workers: int) -> pd.DataFrame:
+        """
+        Forecast chunks of a cleaned history table with cached Holt-Winters fits.
+        
+        Args:
+            chunks: Cleaned history tables (see ``_holt_winters_frame``).
+            horizon_days: Number of days to forecast ahead.
+            workers: Number of worker processes, used when there are several chunks.
+            
+        Returns:
+            Long-format forecast DataFrame.
+        """
+        cached = [
+            {operation_id: self.forecast_cache.get(operation_id) for operation_id in chunk['operation_id'].unique()}
+            for chunk in chunks
+        ]
+        
+        if len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(
+                    _holt_winters_frame, chunks, repeat(horizon_days), repeat(self.forecast_params), cached
+                ))
+        else:
+            results = [_holt_winters_frame(chunks[0], horizon_days, self.forecast_params, cached[0])]
+        
+        for _, fits in results:
+            for operation_id, (model, action) in fits.items():
+                self.forecast_cache.put(operation_id, model, action)
+        
+        if self.forecast_cache.path:
+            self.forecast_cache.save()
+        
+        return pd.concat([frame for frame, _ in results], ignore_index=True)
+    
+    def _holt_winters_model(self, df: pd.DataFrame, operation_id: Optional[str]) -> HoltWintersFit:
+        """
+        Get an up-to-date Holt-Winters fit for a date-sorted history.
+        
+        Args:
+            df: DataFrame with 'date' and 'score' columns, sorted by date.
+            operation_id: ID of the operation whose cached fit to reuse, or None to fit without caching.
+            
+        Returns:
+            The fit.
+        """
+        cached = self.forecast_cache.get(operation_id) if operation_id is not None else None
+        model, action = holt_winters.fit_or_extend(
+            df['date'], df['score'], cached,
+            self.forecast_params["seasonality_period"], self.forecast_params["refit_interval"]
+        )
+        if operation_id is not None:
+            self.forecast_cache.put(operation_id, model, action)
+        return model
+    
     def analyze_market_correlation(
         self, 
         sustainability_data: List[Dict], 
-        token_price_data: List[Dict]
+        token_price_data: List[Dict],
+        lag_days: Optional[Iterable[int]] = None
     ) -> Dict:
         """
         Analyze correlation between sustainability scores and token prices.
         
+        Scores and prices are averaged per day and aligned with
+        ``merge_asof``, matching each score day to the latest price day no
+        more than ``price_tolerance_days`` earlier. Correlations for every
+        requested lag come from one FFT cross-correlation over the daily
+        series, so wide scans such as ``range(91)`` cost about the same as
+        a handful of lags.
+        
         Args:
             sustainability_data: List of dictionaries with historical sustainability scores.
                 Each dictionary should have at least 'date' and 'score' keys.
             token_price_data: List of dictionaries with historical token prices.
                 Each dictionary should have at least 'date' and 'price' keys.
+            lag_days: Lags in days to analyze, where a lag of k pairs each
+                price with the score k days earlier (optional, defaults to
+                market_params["lag_days"]).
             
         Returns:
             Dictionary with correlation analysis results.
         """
+        lag_days = list(self.market_params["lag_days"] if lag_days is None else lag_days)
+        
         try:
             # Convert to DataFrames
             if not sustainability_data or not token_price_data:
@@ -252,62 +653,15 @@ class PredictiveAnalytics:
                     "correlation": None
                 }
             
-            # Process sustainability data
-            sustainability_dates = []
-            sustainability_scores = []
-            
-            for entry in sustainability_data:
-                if isinstance(entry.get('date'), str):
-                    try:
-                        date = datetime.fromisoformat(entry['date'].replace('Z', '+00:00'))
-                    except ValueError:
-                        try:
-                            date = datetime.strptime(entry['date'], '%Y-%m-%d')
-                        except ValueError:
-                            continue
-                elif isinstance(entry.get('date'), datetime):
-                    date = entry['date']
-                else:
-                    continue
-                
-                score = entry.get('score') or entry.get('sustainability_score')
-                if score is not None:
-                    sustainability_dates.append(date)
-                    sustainability_scores.append(float(score))
-            
-            # Process token price data
-            price_dates = []
-            prices = []
-            
-            for entry in token_price_data:
-                if isinstance(entry.get('date'), str):
-                    try:
-                        date = datetime.fromisoformat(entry['date'].replace('Z', '+00:00'))
-                    except ValueError:
-                        try:
-                            date = datetime.strptime(entry['date'], '%Y-%m-%d')
-                        except ValueError:
-                            continue
-                elif isinstance(entry.get('date'), datetime):
-                    date = entry['date']
-                else:
-                    continue
-                
-                price = entry.get('price')
-                if price is not None:
-                    price_dates.append(date)
-                    prices.append(float(price))
-            
-            # Create DataFrames
-            sustainability_df = pd.DataFrame({
-                'date': sustainability_dates,
-                'score': sustainability_scores
-            })
-            
-            price_df = pd.DataFrame({
-                'date': price_dates,
-                'price': prices
-            })
+            # Parse each input once and average per day
+            sustainability_df = self._daily_values(
+                sustainability_data,
+                [entry.get('score') or entry.get('sustainability_score') for entry in sustainability_data],
+                'score'
+            )
+            price_df = self._daily_values(
+                token_price_data, [entry.get('price') for entry in token_price_data], 'price'
+            )
             
             # Ensure we have enough data
             if len(sustainability_df) < 10 or len(price_df) < 10:
@@ -316,59 +670,54 @@ class PredictiveAnalytics:
                     "correlation": None
                 }
             
-            # Merge data on date
-            # First convert date to date-only format to allow matching
-            sustainability_df['date'] = pd.to_datetime(sustainability_df['date']).dt.date
-            price_df['date'] = pd.to_datetime(price_df['date']).dt.date
+            # Align each score day with the latest price day within the tolerance
+            merged_df = pd.merge_asof(
+                sustainability_df, price_df, on='date', direction='backward',
+                tolerance=pd.Timedelta(days=self.market_params["price_tolerance_days"])
+            ).dropna()
             
-            # Merge and sort by date
-            merged_df = pd.merge(sustainability_df, price_df, on='date', how='inner')
-            merged_df = merged_df.sort_values('date')
+            if len(merged_df) < 5:
+                return {
+                    "error": "Insufficient overlapping data points for correlation analysis",
+                    "correlation": None
+                }
             
             # Apply smoothing if specified
             if self.market_params["smoothing_window"] > 1:
-                merged_df['score'] = merged_df['score'].rolling(
-                    window=self.market_params["smoothing_window"], 
-                    min_periods=1
-                ).mean()
-                
-                merged_df['price'] = merged_df['price'].rolling(
-                    window=self.market_params["smoothing_window"], 
-                    min_periods=1
-                ).mean()
-            
-            # Calculate correlation for different lag periods
-            correlation_results = []
-            
-            for lag in self.market_params["lag_days"]:
-                if lag > 0:
-                    # Shift sustainability scores back by lag days
-                    merged_df[f'score_lag_{lag}'] = merged_df['score'].shift(lag)
-                    
-                    # Calculate correlation between lagged score and price
-                    valid_data = merged_df.dropna()
-                    
-                    if len(valid_data) >= 5:  # Need at least 5 points for meaningful correlation
-                        corr, p_value = stats.pearsonr(valid_data[f'score_lag_{lag}'], valid_data['price'])
-                        
-                        correlation_results.append({
-                            'lag_days': lag,
-                            'correlation': round(corr, 3),
-                            'p_value': round(p_value, 4),
-                            'significant': p_value < self.market_params["significance_threshold"],
-                            'sample_size': len(valid_data)
-                        })
-                else:
-                    # Calculate direct correlation (no lag)
-                    corr, p_value = stats.pearsonr(merged_df['score'], merged_df['price'])
-                    
-                    correlation_results.append({
-                        'lag_days': 0,
-                        'correlation': round(corr, 3),
-                        'p_value': round(p_value, 4),
-                        'significant': p_value < self.market_params["significance_threshold"],
-                        'sample_size': len(merged_df)
-                    })
+                smoothed = merged_df.rolling(f'{self.market_params["smoothing_window"]}D', on='date')
+                merged_df['score'] = smoothed['score'].mean()
+                merged_df['price'] = smoothed['price'].mean()
+            
+            # Lay both series out on a daily grid, with NaN on days without data
+            day = ((merged_df['date'] - merged_df['date'].iloc[0]) // pd.Timedelta(days=1)).to_numpy()
+            score_grid = np.full(day[-1] + 1, np.nan)
+            price_grid = np.full(day[-1] + 1, np.nan)
+            score_grid[day] = merged_df['score'].to_numpy()
+            price_grid[day] = merged_df['price'].to_numpy()
+            
+            # Correlate every lag at once; lag 0 always gives the overall correlation
+            lags = np.unique(np.r_[0, np.asarray(list(lag_days), dtype=np.int64)])
+            correlations, p_values, sample_sizes = _lagged_correlations(score_grid, price_grid, lags)
+            
+            requested = set(lag_days)
+            correlation_results = [
+                {
+                    'lag_days': int(lag),
+                    'correlation': round(float(corr), 3),
+                    'p_value': round(float(p_value), 4),
+                    'significant': bool(p_value < self.market_params["significance_threshold"]),
+                    'sample_size': int(size)
+                }
+                for lag, corr, p_value, size in zip(lags, correlations, p_values, sample_sizes)
+                # Need at least 5 points for meaningful correlation
+                if lag in requested and size >= 5 and not np.isnan(corr)
+            ]
+            
+            if not correlation_results:
+                return {
+                    "error": "Insufficient overlapping data points for the requested lags",
+                    "correlation": None
+                }
             
             # Find the strongest correlation
             strongest_corr = max(correlation_results, key=lambda x: abs(x['correlation']))
@@ -376,8 +725,10 @@ class PredictiveAnalytics:
             # Calculate price impact
             price_impact = self._calculate_price_impact(merged_df)
             
+            overall = correlations[np.searchsorted(lags, 0)]
+            
             return {
-                'overall_correlation': round(corr, 3),
+                'overall_correlation': None if np.isnan(overall) else round(float(overall), 3),
                 'lag_analysis': correlation_results,
                 'strongest_correlation': strongest_corr,
                 'price_impact': price_impact,
@@ -397,6 +748,64 @@ class PredictiveAnalytics:
                 "correlation": None
             }
     
+    def _daily_values(self, entries: List[Dict], values: List[Any], column: str) -> pd.DataFrame:
+        """
+        Build a date-sorted frame of daily mean values from raw entries.
+        
+        Entries with an unusable date or value are dropped, and timezone-aware
+        dates are converted to naive UTC days.
+        
+        Args:
+            entries: Raw entries with a 'date' key.
+            values: Value of each entry.
+            column: Name of the value column.
+            
+        Returns:
+            DataFrame with 'date' and ``column`` columns, one row per day.
+        """
+        dates = self._parse_dates([entry.get('date') for entry in entries])
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_convert('UTC').dt.tz_localize(None)
+        
+        frame = pd.DataFrame({
+            'date': dates.dt.normalize(),
+            column: pd.to_numeric(pd.Series(values, dtype=object), errors='coerce')
+        }).dropna()
+        
+        return frame.groupby('date', as_index=False)[column].mean().astype({column: np.float64})
+    
+    def _parse_dates(self, values: List[Any]) -> pd.Series:
+        """
+        Parse a column of dates in one vectorized pass.
+        
+        Strings are parsed as ISO 8601 and datetime objects are kept as is.
+        Anything else, and strings that cannot be parsed, become NaT.
+        
+        Args:
+            values: Raw date values.
+            
+        Returns:
+            Series of timestamps aligned with ``values``.
+        """
+        raw = pd.Series(values, dtype=object)
+        usable = raw.map(lambda value: isinstance(value, (str, datetime)))
+        return pd.to_datetime(raw.where(usable), errors='coerce', format='ISO8601')
+    
+    def _weekday_factors(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Calculate the seasonal factor of each weekday.
+        
+        Args:
+            df: DataFrame with 'date' and 'score' columns.
+            
+        Returns:
+            Array of 7 factors indexed by weekday (Monday is 0): the mean score
+            on that weekday over the overall mean, or 1.0 without history.
+        """
+        weekday_means = df.groupby(df['date'].dt.weekday)['score'].mean()
+        factors = weekday_means / df['score'].mean()
+        return factors.reindex(range(7), fill_value=1.0).to_numpy(dtype=np.float64)
+    
     def _calculate_trend(self, values: List[float]) -> str:
         """
         Calculate the trend direction from a list of values.
@@ -0,0 +1,510 @@
+"""
+Streaming Analytics Module
+
+This module maintains sustainability score and token price statistics
+incrementally as daily points arrive, so dashboards and agents can read
+current correlations and trends without reprocessing the full history.
+"""
+
+import logging
+import math
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+from ecochain.analysis_module.predictive_analytics import PredictiveAnalytics, _correlation_p_values
+from ecochain.ring_buffer import RingBuffer
+
+logger = logging.getLogger(__name__)
+
+NAN = float('nan')
+
+# Score ranges of the price impact analysis, as (upper bound, label); ranges exclude their lower bound
+SCORE_RANGES = [
+    (30, 'Poor (0-30)'),
+    (60, 'Average (30-60)'),
+    (90, 'Good (60-90)'),
+    (100, 'Excellent (90-100)')
+]
+
+
+def _score_range(score: float) -> Optional[int]:
+    """Get the index of the score range containing a score, if any."""
+    if not 0 < score <= 100:
+        return None
+    for index, (upper, _) in enumerate(SCORE_RANGES):
+        if score <= upper:
+            return index
+    return None
+
+
+class WindowedMoments:
+    """
+    Means, variances and covariance of (x, y) pairs in a sliding window.
+
+    Pairs are added and removed with Welford-style updates, so each
+    change is O(1) and avoids the cancellation of naive sums of squares.
+    """
+
+    __slots__ = ('n', 'mean_x', 'mean_y', 'm2_x', 'm2_y', 'c_xy')
+
+    def __init__(self):
+        """Initialize empty moments."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Remove all pairs."""
+        self.n = 0
+        self.mean_x = self.mean_y = 0.0
+        self.m2_x = self.m2_y = self.c_xy = 0.0
+
+    def add(self, x: float, y: float) -> None:
+        """Add a pair."""
+        self.n += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.n
+        self.mean_y += dy / self.n
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.c_xy += dx * (y - self.mean_y)
+
+    def remove(self, x: float, y: float) -> None:
+        """Remove a pair that was previously added; the exact inverse of ``add``."""
+        if self.n <= 1:
+            self.reset()
+            return
+        self.n -= 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x -= dx / self.n
+        self.mean_y -= dy / self.n
+        previous_dx = x - self.mean_x
+        self.m2_x -= previous_dx * dx
+        self.m2_y -= (y - self.mean_y) * dy
+        self.c_xy -= previous_dx * dy
+
+    def variance_x(self) -> float:
+        """Sample variance of x."""
+        return max(self.m2_x, 0.0) / (self.n - 1) if self.n > 1 else NAN
+
+    def variance_y(self) -> float:
+        """Sample variance of y."""
+        return max(self.m2_y, 0.0) / (self.n - 1) if self.n > 1 else NAN
+
+    def covariance(self) -> float:
+        """Sample covariance of x and y."""
+        return self.c_xy / (self.n - 1) if self.n > 1 else NAN
+
+    def correlation(self) -> float:
+        """Pearson correlation of x and y, NaN when undefined."""
+        # Spreads at rounding level mean a constant series
+        if (self.n < 3 or self.m2_x <= 1e-12 * self.n * self.mean_x ** 2
+                or self.m2_y <= 1e-12 * self.n * self.mean_y ** 2):
+            return NAN
+        return max(-1.0, min(1.0, self.c_xy / math.sqrt(self.m2_x * self.m2_y)))
+
+
+class StreamingAnalytics:
+    """
+    Incrementally updated score and price statistics.
+
+    Fed one daily point at a time through ``update``, it keeps the state
+    that ``PredictiveAnalytics.analyze_market_correlation`` and
+    ``_calculate_trend`` would otherwise rebuild from the full history:
+
+    - smoothed scores and prices, as trailing means over the market
+      ``smoothing_window`` in days
+    - exponentially weighted means (pandas ``ewm`` with ``adjust=True``)
+    - Welford moments of the raw and smoothed values over the last
+      ``lookback_days`` days, giving variances, covariance and one
+      correlation per lag
+    - the average price per score range and the sums behind the slope of
+      the last ``trend_window`` scores
+
+    All windows are fixed-size ring buffers, so an update costs O(number
+    of lags) regardless of how much history has been seen. Moments are
+    recomputed from their buffers once per window length to stop rounding
+    error from the removals accumulating, which keeps the amortized cost
+    per point constant.
+    """
+
+    def __init__(
+        self,
+        analytics: Optional[PredictiveAnalytics] = None,
+        lookback_days: Optional[int] = None,
+        lag_days: Optional[Iterable[int]] = None,
+        trend_window: int = 30,
+        ewm_alpha: float = 0.3
+    ):
+        """
+        Initialize the streaming state.
+
+        Args:
+            analytics: PredictiveAnalytics whose market parameters and
+                interpretation are used (optional).
+            lookback_days: Days of history the correlations cover (optional,
+                defaults to market_params["lookback_days"]).
+            lag_days: Non-negative lags in days to track (optional, defaults
+                to market_params["lag_days"]).
+            trend_window: Number of most recent scores the trend covers.
+            ewm_alpha: Smoothing factor of the exponentially weighted means.
+
+        Raises:
+            ValueError: If a lag is negative or a window is not positive.
+        """
+        self.analytics = analytics or PredictiveAnalytics()
+        params = self.analytics.market_params
+
+        self.lookback_days = lookback_days or params["lookback_days"]
+        self.lag_days = sorted(set(params["lag_days"] if lag_days is None else lag_days))
+        if any(lag < 0 for lag in self.lag_days):
+            raise ValueError("Lags must be non-negative")
+        if self.lookback_days < 1 or trend_window < 2:
+            raise ValueError("lookback_days must be positive and trend_window at least 2")
+
+        self.smoothing_window = max(1, params["smoothing_window"])
+        self.trend_window = trend_window
+        self.ewm_alpha = ewm_alpha
+
+        # Lag 0 is always tracked for the overall correlation and price impact
+        self._lags = sorted(set(self.lag_days) | {0})
+        max_lag = self._lags[-1]
+
+        # Day-indexed windows hold NaN on days without a point
+        window = self.smoothing_window
+        self._raw_scores = RingBuffer(window, 'd', [NAN] * window)
+        self._raw_prices = RingBuffer(window, 'd', [NAN] * window)
+        self._smoothed_scores = RingBuffer(max_lag + 1, 'd', [NAN] * (max_lag + 1))
+
+        # Pairs of each lag over the lookback window, and the raw pairs
+        lookback = self.lookback_days
+        self._pairs = {
+            lag: (RingBuffer(lookback, 'd', [NAN] * lookback), RingBuffer(lookback, 'd', [NAN] * lookback))
+            for lag in self._lags
+        }
+        self._raw_pairs = (RingBuffer(lookback, 'd', [NAN] * lookback), RingBuffer(lookback, 'd', [NAN] * lookback))
+        self._moments = {lag: WindowedMoments() for lag in self._lags}
+        self._raw_moments = WindowedMoments()
+        self._longest_window = max(window, max_lag + 1, lookback)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all points."""
+        for buffer in (self._raw_scores, self._raw_prices, self._smoothed_scores, *self._raw_pairs):
+            self._fill(buffer)
+        for scores, prices in self._pairs.values():
+            self._fill(scores)
+            self._fill(prices)
+        for moments in (*self._moments.values(), self._raw_moments):
+            moments.reset()
+        # Last trend_window scores, with their sum and position-weighted sum
+        self._trend_scores = RingBuffer(self.trend_window, 'd')
+        self._trend_sum = 0.0
+        self._trend_weighted_sum = 0.0
+
+        self._window_sums = [0.0, 0.0]  # Sums of the raw scores and prices in the smoothing window
+        self._window_count = 0
+        self._range_sums = [0.0] * len(SCORE_RANGES)
+        self._range_counts = [0] * len(SCORE_RANGES)
+        self._ewm = [0.0, 0.0, 0.0]  # Weighted score sum, weighted price sum, total weight
+
+        self.first_date: Optional[pd.Timestamp] = None
+        self.last_date: Optional[pd.Timestamp] = None
+        self.last_score = NAN
+        self.last_price = NAN
+        self.points = 0
+        self._days_since_rebuild = 0
+
+    @staticmethod
+    def _fill(buffer: RingBuffer) -> None:
+        """Overwrite every slot of a full buffer with NaN."""
+        for _ in range(len(buffer)):
+            buffer.append(NAN)
+
+    def update(self, date: Any, score: float, price: float) -> bool:
+        """
+        Add a daily score and price point.
+
+        Points must arrive in date order, one per day; days without a point
+        are allowed and count as missing.
+
+        Args:
+            date: Date of the point, as a datetime or ISO 8601 string.
+            score: Sustainability score.
+            price: Token price.
+
+        Returns:
+            True if the point was added, False if it was rejected.
+        """
+        try:
+            day = pd.Timestamp(date)
+            score, price = float(score), float(price)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping streaming point with invalid data: {str(e)}")
+            return False
+        if pd.isna(day) or math.isnan(score) or math.isnan(price):
+            logger.warning("Skipping streaming point with a missing date, score or price")
+            return False
+        if day.tzinfo is not None:
+            day = day.tz_convert('UTC').tz_localize(None)
+        day = day.normalize()
+
+        if self.last_date is not None:
+            gap = (day - self.last_date).days
+            if gap < 1:
+                logger.warning(f"Skipping streaming point for {day:%Y-%m-%d}: "
+                               f"points must follow {self.last_date:%Y-%m-%d}")
+                return False
+            # Missing days beyond the longest window leave nothing to step through
+            for _ in range(min(gap - 1, self._longest_window)):
+                self._advance(NAN, NAN)
+        else:
+            self.first_date = day
+
+        self._advance(score, price)
+
+        # Exponentially weighted means over points, as pandas ewm(adjust=True)
+        decay = 1 - self.ewm_alpha
+        self._ewm = [self._ewm[0] * decay + score, self._ewm[1] * decay + price, self._ewm[2] * decay + 1]
+
+        # Sliding sums for the trend slope; removing the oldest score shifts every position down by one
+        if len(self._trend_scores) == self.trend_window:
+            self._trend_sum -= self._trend_scores[0]
+            self._trend_weighted_sum -= self._trend_sum
+        self._trend_weighted_sum += min(len(self._trend_scores), self.trend_window - 1) * score
+        self._trend_sum += score
+        self._trend_scores.append(score)
+
+        self.last_date = day
+        self.last_score = score
+        self.last_price = price
+        self.points += 1
+        return True
+
+    def _advance(self, score: float, price: float) -> None:
+        """Move every day-indexed window forward one day, with NaN for a missing point."""
+        # Trailing means over the smoothing window
+        old_score, old_price = self._raw_scores[0], self._raw_prices[0]
+        if not math.isnan(old_score):
+            self._window_sums[0] -= old_score
+            self._window_sums[1] -= old_price
+            self._window_count -= 1
+        self._raw_scores.append(score)
+        self._raw_prices.append(price)
+
+        smoothed_score = smoothed_price = NAN
+        if not math.isnan(score):
+            self._window_sums[0] += score
+            self._window_sums[1] += price
+            self._window_count += 1
+            smoothed_score = self._window_sums[0] / self._window_count
+            smoothed_price = self._window_sums[1] / self._window_count
+        self._smoothed_scores.append(smoothed_score)
+
+        # Pair today's smoothed price with the smoothed score of each lag
+        for lag in self._lags:
+            lagged_score = self._smoothed_scores[-1 - lag]
+            self._slide(self._pairs[lag], self._moments[lag], lagged_score, smoothed_price,
+                        track_ranges=lag == 0)
+        self._slide(self._raw_pairs, self._raw_moments, score, price)
+
+        self._days_since_rebuild += 1
+        if self._days_since_rebuild >= self.lookback_days:
+            self._rebuild()
+
+    def _slide(self, pairs: tuple, moments: WindowedMoments, x: float, y: float,
+               track_ranges: bool = False) -> None:
+        """Replace the oldest pair of a lookback window with (x, y), NaN meaning no pair."""
+        xs, ys = pairs
+        old_x, old_y = xs[0], ys[0]
+        if not (math.isnan(old_x) or math.isnan(old_y)):
+            moments.remove(old_x, old_y)
+            if track_ranges:
+                self._count_range(old_x, old_y, -1)
+
+        if math.isnan(x) or math.isnan(y):
+            x = y = NAN
+        xs.append(x)
+        ys.append(y)
+        if not math.isnan(x):
+            moments.add(x, y)
+            if track_ranges:
+                self._count_range(x, y, 1)
+
+    def _count_range(self, score: float, price: float, sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) a price from its score range."""
+        index = _score_range(score)
+        if index is not None:
+            self._range_sums[index] += sign * price
+            self._range_counts[index] += sign
+
+    def _rebuild(self) -> None:
+        """Recompute all running sums and moments from their buffers."""
+        self._days_since_rebuild = 0
+
+        scores, prices = self._raw_scores.to_list(), self._raw_prices.to_list()
+        valid = [(s, p) for s, p in zip(scores, prices) if not math.isnan(s)]
+        self._window_sums = [math.fsum(s for s, _ in valid), math.fsum(p for _, p in valid)]
+        self._window_count = len(valid)
+
+        self._range_sums = [0.0] * len(SCORE_RANGES)
+        self._range_counts = [0] * len(SCORE_RANGES)
+        for lag in self._lags:
+            self._reload(self._pairs[lag], self._moments[lag], track_ranges=lag == 0)
+        self._reload(self._raw_pairs, self._raw_moments)
+
+        trend_scores = self._trend_scores.to_list()
+        self._trend_sum = math.fsum(trend_scores)
+        self._trend_weighted_sum = math.fsum(i * value for i, value in enumerate(trend_scores))
+
+    def _reload(self, pairs: tuple, moments: WindowedMoments, track_ranges: bool = False) -> None:
+        """Recompute moments from the pairs in a lookback window."""
+        moments.reset()
+        for x, y in zip(pairs[0].to_list(), pairs[1].to_list()):
+            if not math.isnan(x):
+                moments.add(x, y)
+                if track_ranges:
+                    self._count_range(x, y, 1)
+
+    def correlation(self) -> Dict:
+        """
+        Get the market correlation analysis of the lookback window.
+
+        Returns:
+            Dictionary shaped like ``PredictiveAnalytics.analyze_market_correlation``
+            results for the same window, or an error dictionary.
+        """
+        if self._raw_moments.n < 10:
+            return {
+                "error": "Insufficient data points for correlation analysis",
+                "correlation": None
+            }
+
+        correlations = [self._moments[lag].correlation() for lag in self._lags]
+        sample_sizes = [self._moments[lag].n for lag in self._lags]
+        p_values = _correlation_p_values(correlations, sample_sizes)
+        threshold = self.analytics.market_params["significance_threshold"]
+
+        correlation_results = [
+            {
+                'lag_days': lag,
+                'correlation': round(corr, 3),
+                'p_value': round(float(p_value), 4),
+                'significant': bool(p_value < threshold),
+                'sample_size': size
+            }
+            for lag, corr, p_value, size in zip(self._lags, correlations, p_values, sample_sizes)
+            # Need at least 5 points for meaningful correlation
+            if lag in self.lag_days and size >= 5 and not math.isnan(corr)
+        ]
+
+        if not correlation_results:
+            return {
+                "error": "Insufficient overlapping data points for the requested lags",
+                "correlation": None
+            }
+
+        strongest_corr = max(correlation_results, key=lambda x: abs(x['correlation']))
+        overall = correlations[0]
+        start_date = max(self.first_date, self.last_date - pd.Timedelta(days=self.lookback_days - 1))
+
+        return {
+            'overall_correlation': None if math.isnan(overall) else round(overall, 3),
+            'lag_analysis': correlation_results,
+            'strongest_correlation': strongest_corr,
+            'price_impact': self.price_impact(),
+            'analysis_period': {
+                'start_date': start_date.strftime('%Y-%m-%d'),
+                'end_date': self.last_date.strftime('%Y-%m-%d'),
+                'days': self._raw_moments.n
+            },
+            'interpretation': self.analytics._interpret_correlation(strongest_corr),
+            'analysis_generated_at': datetime.now().isoformat()
+        }
+
+    def price_impact(self) -> Dict:
+        """
+        Get the average smoothed price per smoothed score range.
+
+        Returns:
+            Dictionary shaped like ``PredictiveAnalytics._calculate_price_impact`` results.
+        """
+        moments = self._moments[0]
+        if moments.n == 0:
+            return {'error': "No data points"}
+
+        avg_price = moments.mean_y
+        price_by_range = {
+            label: self._range_sums[index] / self._range_counts[index]
+            for index, (_, label) in enumerate(SCORE_RANGES)
+            if self._range_counts[index] > 0
+        }
+        return {
+            'average_price': round(avg_price, 4),
+            'price_by_score_range': {k: round(v, 4) for k, v in price_by_range.items()},
+            'percentage_impact': {
+                k: round(((v / avg_price) - 1) * 100, 2) for k, v in price_by_range.items()
+            } if avg_price > 0 else {}
+        }
+
+    def trend(self) -> str:
+        """
+        Get the direction of the last ``trend_window`` scores.
+
+        Returns:
+            'upward', 'downward', 'stable' or 'unknown', as
+            ``PredictiveAnalytics._calculate_trend`` gives for the same scores.
+        """
+        n = len(self._trend_scores)
+        if n < 2:
+            return 'unknown'
+
+        # Least-squares slope against positions 0..n-1
+        position_sum = n * (n - 1) / 2
+        position_square_sum = (n - 1) * n * (2 * n - 1) / 6
+        slope = ((n * self._trend_weighted_sum - position_sum * self._trend_sum)
+                 / (n * position_square_sum - position_sum ** 2))
+
+        if slope > 0.05:
+            return 'upward'
+        elif slope < -0.05:
+            return 'downward'
+        else:
+            return 'stable'
+
+    def statistics(self) -> Dict:
+        """
+        Get the current rolling statistics.
+
+        Returns:
+            Dictionary with the latest, smoothed, exponentially weighted and
+            lookback-window mean and variance of scores and prices, and their
+            covariance and correlation over the lookback window.
+        """
+        raw = self._raw_moments
+        smoothed = self._smoothed_scores[-1]
+        smoothed_price = self._window_sums[1] / self._window_count if self._window_count else NAN
+        ewm_weight = self._ewm[2]
+
+        def summary(latest, smoothed_value, ewm_sum, mean, variance):
+            return {
+                'latest': latest,
+                'smoothed': smoothed_value,
+                'ewm': ewm_sum / ewm_weight if ewm_weight else NAN,
+                'rolling_mean': mean if raw.n else NAN,
+                'rolling_variance': variance
+            }
+
+        return {
+            'points': self.points,
+            'window_points': raw.n,
+            'last_date': self.last_date.strftime('%Y-%m-%d') if self.last_date is not None else None,
+            'score': summary(self.last_score, smoothed, self._ewm[0], raw.mean_x, raw.variance_x()),
+            'price': summary(self.last_price, smoothed_price, self._ewm[1], raw.mean_y, raw.variance_y()),
+            'covariance': raw.covariance(),
+            'correlation': raw.correlation(),
+            'trend': self.trend()
+        }
@@ -1,9 +1,107 @@
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Tier thresholds (lower bounds) and names, lowest tier first
+TIER_THRESHOLDS = np.array([30.0, 45.0, 60.0, 75.0, 90.0])
+TIER_NAMES = np.array(["Needs Improvement", "Standard", "Bronze", "Silver", "Gold", "Platinum"], dtype=object)
+
+# Input columns of the batch API, matching the keys read by score_operation
+BATCH_COLUMNS = (
+    "renewable_energy_percentage",
+    "energy_efficiency_rating",
+    "carbon_footprint_tons_per_day",
+    "carbon_offset_percentage",
+    "sustainability_initiatives",
+    "location"
+)
+
+# Input value types the batch API scores as numbers
+_REAL_TYPES = (int, float, np.integer, np.floating)
+
+@dataclass
+class BatchScores:
+    """
+    Columnar result of ``SustainabilityScorer.score_batch``.
+    
+    Component scores are kept on a 0-1 scale, as in ``score_operation``;
+    improvement suggestions are only generated when requested.
+    """
+    operation_ids: np.ndarray
+    scores: np.ndarray
+    tiers: np.ndarray
+    renewable_scores: np.ndarray
+    efficiency_scores: np.ndarray
+    carbon_scores: np.ndarray
+    offset_scores: np.ndarray
+    initiatives_scores: np.ndarray
+    location_factors: np.ndarray
+    scorer: "SustainabilityScorer"
+    
+    def __len__(self) -> int:
+        return len(self.scores)
+    
+    def suggestions(self, index: int) -> List[str]:
+        """
+        Generate improvement suggestions for one operation.
+        
+        Args:
+            index: Row index in the batch.
+            
+        Returns:
+            List of improvement suggestions.
+        """
+        return self.scorer._generate_suggestions(
+            self.renewable_scores[index], self.efficiency_scores[index], self.carbon_scores[index],
+            self.offset_scores[index], self.initiatives_scores[index]
+        )
+    
+    def to_records(self, include_suggestions: bool = True) -> List[Dict]:
+        """
+        Convert the batch to per-operation dictionaries.
+        
+        Args:
+            include_suggestions: Whether to generate improvement suggestions.
+            
+        Returns:
+            List of dictionaries shaped like the output of ``score_operation``.
+        """
+        columns = [
+            self.operation_ids.tolist(),
+            self.scores.tolist(),
+            self.tiers.tolist(),
+            (self.renewable_scores * 100).tolist(),
+            (self.efficiency_scores * 100).tolist(),
+            (self.carbon_scores * 100).tolist(),
+            (self.offset_scores * 100).tolist(),
+            (self.initiatives_scores * 100).tolist(),
+            (self.location_factors * 100).tolist()
+        ]
+        
+        records = []
+        for i, (op_id, score, tier, renewable, efficiency, carbon, offset, initiatives, location) in enumerate(zip(*columns)):
+            record = {
+                "operation_id": op_id,
+                "sustainability_score": score,
+                "sustainability_tier": tier,
+                "component_scores": {
+                    "renewable_energy": renewable,
+                    "energy_efficiency": efficiency,
+                    "carbon_footprint": carbon,
+                    "carbon_offset": offset,
+                    "sustainability_initiatives": initiatives,
+                    "location_factor": location
+                }
+            }
+            if include_suggestions:
+                record["improvement_suggestions"] = self.suggestions(i)
+            records.append(record)
+        
+        return records
+
 class SustainabilityScorer:
     """
     Class responsible for scoring mining operations based on their sustainability metrics.
@@ -138,28 +236,130 @@ class SustainabilityScorer:
         Returns:
             List of dictionaries containing sustainability scores.
         """
-        scores = []
-        
         # Create a lookup dictionary for carbon data by operation ID
         carbon_data_map = {
             carbon_data["operation_id"]: carbon_data 
             for carbon_data in carbon_data_list
         }
+        carbon_rows = [carbon_data_map.get(op_data.get("id", ""), {}) for op_data in operations_data]
+        
+        # Rows whose inputs are all finite numbers go through the batch path;
+        # the rest keep the per-operation path and its error handling
+        n = len(operations_data)
+        valid = np.ones(n, dtype=bool)
+        columns = {}
+        for key in BATCH_COLUMNS[:-1]:
+            values = np.fromiter(
+                (float(value) if isinstance(value, _REAL_TYPES) else np.nan
+                 for value in (c.get(key, 0) for c in carbon_rows)),
+                dtype=float, count=n
+            )
+            valid &= np.isfinite(values)
+            columns[key] = values
+        
+        results: List[Optional[Dict]] = [None] * n
+        for i in np.flatnonzero(~valid):
+            results[i] = self.score_operation(operations_data[i], carbon_rows[i])
+        
+        rows = np.flatnonzero(valid)
+        if len(rows):
+            columns = {key: values[rows] for key, values in columns.items()}
+            columns["location"] = [operations_data[i].get("location", "") for i in rows]
+            operation_ids = [operations_data[i].get("id", "unknown") for i in rows]
+            for i, record in zip(rows, self.score_batch(columns, operation_ids).to_records()):
+                results[i] = record
+        
+        return results
+    
+    def score_batch(self, data: Mapping[str, Any], operation_ids: Optional[Sequence] = None) -> BatchScores:
+        """
+        Score many operations at once from columnar inputs.
+        
+        ``data`` may be a DataFrame or a mapping of column name to array with
+        the keys in ``BATCH_COLUMNS``; missing columns default as in
+        ``score_operation``. Numeric inputs must be finite. Every score is
+        computed with the same floating-point operations as
+        ``score_operation``, so the results are identical.
+        
+        Args:
+            data: Columnar inputs, one row per operation.
+            operation_ids: Optional operation IDs, one per row.
+            
+        Returns:
+            BatchScores with one entry per row.
+        """
+        present = [key for key in BATCH_COLUMNS if key in data]
+        n = len(data[present[0]]) if present else (len(operation_ids) if operation_ids is not None else 0)
+        
+        def column(key: str) -> np.ndarray:
+            if key not in data:
+                return np.zeros(n)
+            return np.asarray(data[key], dtype=float)
+        
+        renewable_percentage = column("renewable_energy_percentage")
+        efficiency_rating = column("energy_efficiency_rating")
+        carbon_footprint = column("carbon_footprint_tons_per_day")
+        offset_percentage = column("carbon_offset_percentage")
+        initiatives = column("sustainability_initiatives")
+        
+        locations = data["location"] if "location" in data else [""] * n
+        location_factor = np.fromiter(
+            (self.location_factors.get(location, self.default_location_factor) for location in locations),
+            dtype=float, count=n
+        )
+        
+        # Normalize values to 0-1 range
+        normalized_carbon = self._normalize_carbon_footprint(carbon_footprint)
+        normalized_initiatives = np.minimum(initiatives / 5.0, 1.0)  # Assuming max 5 initiatives
+        
+        # Calculate component scores
+        renewable_score = renewable_percentage / 100.0
+        efficiency_score = efficiency_rating
+        carbon_score = 1.0 - normalized_carbon  # Lower carbon is better
+        offset_score = offset_percentage / 100.0
+        initiatives_score = normalized_initiatives
+        
+        # Apply carbon penalty for high emitters (nonlinear penalty)
+        carbon_penalty = np.exp(normalized_carbon * self.carbon_penalty_factor) - 1
+        
+        # Calculate weighted score, summed in the same order as score_operation
+        weighted_score = (
+            self.weights["renewable_energy_percentage"] * renewable_score +
+            self.weights["energy_efficiency_rating"] * efficiency_score +
+            self.weights["carbon_footprint"] * carbon_score +
+            self.weights["carbon_offset_percentage"] * offset_score +
+            self.weights["sustainability_initiatives"] * initiatives_score +
+            self.weights["location_factor"] * location_factor
+        )
+        
+        # Apply penalty and ensure score is in 0-100 range
+        final_score = np.clip((weighted_score - carbon_penalty) * 100, 0, 100)
+        
+        # Determine sustainability tiers
+        tiers = TIER_NAMES[np.searchsorted(TIER_THRESHOLDS, final_score, side="right")]
         
-        for op_data in operations_data:
-            op_id = op_data.get("id", "")
-            carbon_data = carbon_data_map.get(op_id, {})
-            score = self.score_operation(op_data, carbon_data)
-            scores.append(score)
+        if operation_ids is None:
+            operation_ids = ["unknown"] * n
         
-        return scores
+        return BatchScores(
+            operation_ids=np.asarray(operation_ids, dtype=object),
+            scores=final_score,
+            tiers=tiers,
+            renewable_scores=renewable_score,
+            efficiency_scores=efficiency_score,
+            carbon_scores=carbon_score,
+            offset_scores=offset_score,
+            initiatives_scores=initiatives_score,
+            location_factors=location_factor,
+            scorer=self
+        )
     
     def _normalize_carbon_footprint(self, carbon_footprint: float) -> float:
         """
         Normalize carbon footprint to a 0-1 scale.
         
         Args:
-            carbon_footprint: Carbon footprint in tons per day.
+            carbon_footprint: Carbon footprint in tons per day, or an array of them.
             
         Returns:
             Normalized carbon footprint (0-1 scale).
@@ -82,6 +82,7 @@ type Query {
     operation(id: ID!): MiningOperation
     carbonData(operationId: ID!): CarbonData
     score(operationId: ID!): SustainabilityScore
+    scores(operationIds: [ID!]): [SustainabilityScore!]!
     tokenBalance(address: String!): TokenBalance
     stakingStats: StakingStats
     activeStakes(address: String!): [Stake!]!
@@ -317,6 +318,20 @@ def resolve_score(_, info, operationId):
     carbon_data = data_collector.get_carbon_data(operationId)
     return scorer.score_operation(operation, carbon_data)
 
+@query.field("scores")
+def resolve_scores(_, info, operationIds=None):
+    data_collector = g.data_collector
+    scorer = g.scorer
+    
+    if operationIds is None:
+        operations = data_collector.get_mining_operations()
+    else:
+        operations = [data_collector.get_mining_operation(op_id) for op_id in operationIds]
+        operations = [op for op in operations if op]
+    
+    carbon_data_list = [data_collector.get_carbon_data(op['id']) for op in operations]
+    return scorer.score_multiple_operations(operations, carbon_data_list)
+
 @mining_operation.field("carbon_data")
 def resolve_operation_carbon_data(operation, info):
     data_collector = g.data_collector
@@ -540,8 +555,9 @@ def create_app(config=None):
     # Apply configuration
     app.config.update(dict(
         SECRET_KEY=os.environ.get('SECRET_KEY', 'ecochain-dev-key'),
-        ML_MODEL_PATH=os.environ.get('ML_MODEL_PATH', 'data/models/sustainability_model.pkl'),
-        USE_ML_SCORING=os.environ.get('USE_ML_SCORING', 'true').lower() == 'true'
+        ML_MODEL_PATH=os.environ.get('ML_MODEL_PATH', 'data/models/sustainability_model.ecomodel'),
+        USE_ML_SCORING=os.environ.get('USE_ML_SCORING', 'true').lower() == 'true',
+        ML_FAST_INFERENCE=os.environ.get('ML_FAST_INFERENCE', 'false').lower() == 'true'
     ))
     if config:
         app.config.update(config)
@@ -551,7 +567,10 @@ def create_app(config=None):
         g.data_collector = DataCollector()
         
         if app.config['USE_ML_SCORING'] and os.path.exists(app.config['ML_MODEL_PATH']):
-            g.scorer = MLSustainabilityScorer(app.config['ML_MODEL_PATH'])
+            g.scorer = MLSustainabilityScorer(
+                app.config['ML_MODEL_PATH'],
+                fast_inference=app.config['ML_FAST_INFERENCE']
+            )
         else:
             g.scorer = SustainabilityScorer()
             
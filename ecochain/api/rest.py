@@ -45,8 +45,9 @@ def create_app(config=None):
         SECRET_KEY=os.environ.get('SECRET_KEY', 'ecochain-dev-key'),
         API_VERSION='v1',
         JWT_EXPIRATION=3600,  # 1 hour
-        ML_MODEL_PATH=os.environ.get('ML_MODEL_PATH', 'data/models/sustainability_model.pkl'),
-        USE_ML_SCORING=os.environ.get('USE_ML_SCORING', 'true').lower() == 'true'
+        ML_MODEL_PATH=os.environ.get('ML_MODEL_PATH', 'data/models/sustainability_model.ecomodel'),
+        USE_ML_SCORING=os.environ.get('USE_ML_SCORING', 'true').lower() == 'true',
+        ML_FAST_INFERENCE=os.environ.get('ML_FAST_INFERENCE', 'false').lower() == 'true'
     ))
     if config:
         app.config.update(config)
@@ -63,7 +64,10 @@ def create_app(config=None):
         g.data_collector = DataCollector()
         
         if app.config['USE_ML_SCORING'] and os.path.exists(app.config['ML_MODEL_PATH']):
-            g.scorer = MLSustainabilityScorer(app.config['ML_MODEL_PATH'])
+            g.scorer = MLSustainabilityScorer(
+                app.config['ML_MODEL_PATH'],
+                fast_inference=app.config['ML_FAST_INFERENCE']
+            )
         else:
             g.scorer = SustainabilityScorer()
             
@@ -189,6 +193,39 @@ def create_app(config=None):
         
         return jsonify(score_result)
     
+    @app.route('/api/v1/operations/scores', methods=['POST'])
+    @require_api_key
+    def get_operation_scores():
+        """
+        Score several mining operations in one batch.
+        
+        Takes a JSON body with "operation_ids"; scores every known
+        operation when it is omitted. Unknown IDs are reported separately.
+        """
+        data = request.json or {}
+        operation_ids = data.get('operation_ids')
+        
+        if operation_ids is None:
+            operations = g.data_collector.get_mining_operations()
+            missing = []
+        else:
+            operations = []
+            missing = []
+            for operation_id in operation_ids:
+                operation = g.data_collector.get_mining_operation(operation_id)
+                if operation:
+                    operations.append(operation)
+                else:
+                    missing.append(operation_id)
+        
+        carbon_data_list = [g.data_collector.get_carbon_data(op['id']) for op in operations]
+        scores = g.scorer.score_multiple_operations(operations, carbon_data_list)
+        
+        return jsonify({
+            "scores": scores,
+            "not_found": missing
+        })
+    
     @app.route('/api/v1/operations/<operation_id>/optimize', methods=['GET'])
     @require_api_key
     def get_operation_optimization(operation_id):
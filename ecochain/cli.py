@@ -11,12 +11,14 @@ import argparse
 import logging
 import json
 from datetime import datetime
+from typing import Dict, Optional
 import time
 import signal
 
 from ecochain.data_module.data_collector import DataCollector
 from ecochain.analysis_module.sustainability_scorer import SustainabilityScorer
 from ecochain.analysis_module.ml_scoring import MLSustainabilityScorer
+from ecochain.analysis_module.model_artifact import is_artifact
 from ecochain.analysis_module.optimization_advisor import OptimizationAdvisor
 from ecochain.analysis_module.predictive_analytics import PredictiveAnalytics
 from ecochain.analysis_module.compliance_reporter import ComplianceReporter
@@ -51,6 +53,7 @@ logger = logging.getLogger('ecochain')
 CONFIG_DIR = os.path.expanduser('~/.ecochain')
 CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.json')
 MODELS_DIR = os.path.join(CONFIG_DIR, 'models')
+MODEL_FILE_NAMES = {'artifact': 'sustainability_model.ecomodel', 'pickle': 'sustainability_model.pkl'}  # Default file per model format
 
 def load_config():
     """Load configuration from file"""
@@ -79,7 +82,7 @@ def setup_environment():
             'data_source': 'simulated',
             'reward_type': 'simulated',
             'blockchain_network': 'simulated',
-            'ml_model_path': os.path.join(MODELS_DIR, 'sustainability_model.pkl'),
+            'ml_model_path': os.path.join(MODELS_DIR, MODEL_FILE_NAMES['artifact']),
             'use_ml_model': True,
             'contracts': {
                 'token_address': '',
@@ -175,8 +178,8 @@ def analyze_command(args):
                 
                 # Save the model
                 os.makedirs(MODELS_DIR, exist_ok=True)
-                model_path = os.path.join(MODELS_DIR, 'sustainability_model.pkl')
-                scorer.save_model(model_path)
+                model_path = os.path.join(MODELS_DIR, MODEL_FILE_NAMES['artifact'])
+                scorer.save_model(model_path, format='artifact')
                 print(f"Model saved to {model_path}")
                 
                 # Update config
@@ -684,17 +687,33 @@ def train_command(args):
     """Train the ML model for sustainability scoring"""
     config = load_config()
     
-    # Create scorer
-    ml_scorer = MLSustainabilityScorer()
+    # Create scorer, loading the extendable (pickle) copy of the current model when extending it
+    model_path = None
+    if args.incremental:
+        model_path = config.get('ml_training_model_path') or config.get('ml_model_path')
+        if not (model_path and os.path.exists(model_path)):
+            print("No trained model found, training a new model instead")
+            model_path = None
+        elif is_artifact(model_path):
+            print(f"Error: {model_path} is an inference-only artifact and cannot be extended. "
+                  f"Run 'train' without '--format artifact' to keep an extendable pickle copy.")
+            return
+    ml_scorer = MLSustainabilityScorer(model_path, n_jobs=args.jobs)
     
     # Generate training data
     operations_count = args.samples or 1000
     print(f"Generating {operations_count} synthetic training samples...")
-    training_data = ml_scorer.generate_training_data(operations_count=operations_count)
+    training_data = ml_scorer.generate_training_data(operations_count=operations_count, seed=args.seed)
     
     # Train the model
     print("Training ML model...")
-    training_result = ml_scorer.train(training_data)
+    training_result = ml_scorer.train(
+        training_data,
+        incremental=args.incremental,
+        additional_estimators=args.add_estimators,
+        parallel_stages=not args.sequential_stages,
+        test_size=args.test_split
+    )
     
     if "error" in training_result:
         print(f"Error training model: {training_result['error']}")
@@ -705,15 +724,36 @@ def train_command(args):
     print(f"  - MSE: {training_result['mse']:.4f}")
     print(f"  - R²: {training_result['r2']:.4f}")
     print(f"  - Samples: {training_result['samples_count']}")
+    print(f"  - Trees: {training_result['n_estimators']}{' (incremental)' if training_result['incremental'] else ''}")
+    print(f"  - Wall time: {training_result['wall_time']:.2f}s "
+          f"({', '.join(f'{stage} {seconds:.2f}s' for stage, seconds in training_result['timings'].items())})")
     
-    # Save the model
+    # Save the model. By default it is served from an artifact and a pickle copy
+    # is kept next to it so later --incremental runs can extend it
+    model_format = args.format or 'artifact'
     os.makedirs(MODELS_DIR, exist_ok=True)
-    model_path = args.output or os.path.join(MODELS_DIR, 'sustainability_model.pkl')
-    ml_scorer.save_model(model_path)
-    print(f"Model saved to {model_path}")
+    model_path = args.output or os.path.join(MODELS_DIR, MODEL_FILE_NAMES[model_format])
+    if not ml_scorer.save_model(model_path, format=model_format):
+        print(f"Error saving model to {model_path}")
+        return
+    print(f"Model saved to {model_path} ({model_format} format)")
+    
+    training_model_path = None
+    if model_format == 'pickle':
+        training_model_path = model_path
+    elif args.format is None:
+        training_model_path = os.path.splitext(model_path)[0] + '.pkl'
+        if not ml_scorer.save_model(training_model_path, format='pickle'):
+            print(f"Error saving extendable model copy to {training_model_path}")
+            return
+        print(f"Extendable model copy saved to {training_model_path} (pickle format)")
     
     # Update config
     config['ml_model_path'] = model_path
+    if training_model_path:
+        config['ml_training_model_path'] = training_model_path
+    else:
+        config.pop('ml_training_model_path', None)
     config['use_ml_model'] = True
     save_config(config)
     print("Configuration updated to use the new model")
@@ -1038,6 +1078,8 @@ def _oracle_start_network(args):
                 time.sleep(1)
         except KeyboardInterrupt:
             print("\nStopping Oracle Network...")
+    
+    network.shutdown()
 
 def _oracle_register_provider(args):
     """Register a new data provider with the oracle network"""
@@ -1238,8 +1280,60 @@ def optimize_command(args):
 def predict_command(args):
     """Generate predictive analytics"""
     predictor = PredictiveAnalytics()
+    if getattr(args, 'forecast_cache', None):
+        # Reuse Holt-Winters fits from earlier runs
+        from ecochain.analysis_module.holt_winters import HoltWintersCache
+        predictor.forecast_cache = HoltWintersCache(args.forecast_cache)
     
-    if args.action == 'forecast':
+    if args.action == 'forecast' and args.batch:
+        print("Generating sustainability score forecasts for all operations...")
+        
+        historical_days = args.days or 180
+        forecast_horizon = args.horizon or 90
+        
+        # Collect every operation's history into one long-format table
+        from ecochain.data_module.data_collector import DataCollector
+        data_collector = DataCollector()
+        history = []
+        for operation in data_collector.get_mining_operations():
+            for point in data_collector.get_historical_scores(days=historical_days, operation_id=operation['id']):
+                history.append({
+                    'operation_id': operation['id'],
+                    'date': point['date'],
+                    'score': point['score']
+                })
+        
+        if not history:
+            print("No historical data found.")
+            return
+        
+        start = time.time()
+        forecasts = predictor.forecast_batch(
+            history, horizon_days=forecast_horizon, workers=args.workers, method=args.method
+        )
+        elapsed = time.time() - start
+        
+        print(f"Forecast {forecasts['operation_id'].nunique()} operations "
+              f"({len(forecasts)} rows) in {elapsed:.2f}s")
+        if (args.method or predictor.forecast_params['method']) == 'holt_winters':
+            fit_stats = predictor.forecast_cache.stats
+            print(f"Holt-Winters fits: {fit_stats['fitted']} refitted, {fit_stats['extended']} extended, "
+                  f"{fit_stats['cached']} unchanged")
+        
+        print("\nForecast Preview:")
+        for row in forecasts.head(5).itertuples():
+            print(f"  {row.operation_id} {row.date:%Y-%m-%d}: {row.forecasted_score} "
+                  f"(range: {row.lower_bound} - {row.upper_bound})")
+        
+        output = args.output or 'forecasts.parquet'
+        try:
+            forecasts.to_parquet(output, index=False)
+        except ImportError as e:
+            print(f"\nCould not write Parquet output: {e}")
+            return
+        print(f"\nForecasts saved to {output}")
+    
+    elif args.action == 'forecast':
         print("Generating sustainability score forecast...")
         
         # Use historical data for past N days
@@ -1286,8 +1380,12 @@ def predict_command(args):
         # Generate forecast using the correct method name from PredictiveAnalytics class
         forecast_result = predictor.forecast_sustainability(
             historical_scores=historical_data,
-            horizon_days=forecast_horizon
+            horizon_days=forecast_horizon,
+            method=args.method,
+            operation_id=operation_id
         )
+        if predictor.forecast_cache.path:
+            predictor.forecast_cache.save()
         
         if "error" in forecast_result:
             print(f"Error generating forecast: {forecast_result['error']}")
@@ -1365,7 +1463,8 @@ def predict_command(args):
         # Generate analysis
         analysis = predictor.analyze_market_correlation(
             sustainability_data=sustainability_data,
-            token_price_data=token_price_data
+            token_price_data=token_price_data,
+            lag_days=range(args.max_lag + 1) if args.max_lag is not None else None
         )
         
         # Print analysis summary
@@ -1891,6 +1990,15 @@ def run():
     train_parser.add_argument('--samples', type=int, default=1000, help='Number of samples for training')
     train_parser.add_argument('--output', help='Output file for the trained model')
     train_parser.add_argument('--test-split', type=float, default=0.2, help='Test split ratio')
+    train_parser.add_argument('--jobs', type=int, default=-1, help='Parallel training jobs (-1 for all cores)')
+    train_parser.add_argument('--incremental', action='store_true',
+                              help='Grow the current model with new trees instead of retraining (needs its pickle copy)')
+    train_parser.add_argument('--add-estimators', type=int, default=50, help='Trees added per forest in incremental mode')
+    train_parser.add_argument('--sequential-stages', action='store_true', help='Fit the scorer and anomaly detector one after the other')
+    train_parser.add_argument('--seed', type=int, help='Random seed for synthetic training data')
+    train_parser.add_argument('--format', choices=['artifact', 'pickle'], default=None,
+                              help='Model file format (default: an artifact plus a pickle copy that --incremental '
+                                   'extends; artifact alone cannot be extended)')
     train_parser.set_defaults(func=train_command)
     
     # Demo command
@@ -1938,6 +2046,12 @@ def run():
     predict_parser.add_argument('--days', type=int, help='Number of days for historical data')
     predict_parser.add_argument('--horizon', type=int, help='Number of days for forecast horizon')
     predict_parser.add_argument('--output', help='Output file for results')
+    predict_parser.add_argument('--batch', action='store_true', help='Forecast every operation and write a Parquet table')
+    predict_parser.add_argument('--workers', type=int, default=0, help='Worker processes for batch forecasting')
+    predict_parser.add_argument('--method', choices=['simple', 'holt_winters'], default=None,
+                                help='Forecasting method (default: the predictor\'s configured method)')
+    predict_parser.add_argument('--forecast-cache', help='JSON file caching Holt-Winters fits between runs')
+    predict_parser.add_argument('--max-lag', type=int, help='Analyze every market correlation lag from 0 to this many days')
     predict_parser.set_defaults(func=predict_command)
     
     # Compliance command
@@ -1976,8 +2090,6 @@ def run():
     else:
         parser.print_help()
 
-if __name__ == '__main__':
-    run() 
 def create_default_config() -> Dict:
     """Create a default configuration for the agent."""
     return {
@@ -1996,8 +2108,8 @@ def create_default_config() -> Dict:
         }
     }
 
-def save_config(config: Dict, config_path: str) -> None:
-    """Save configuration to a file."""
+def save_agent_config(config: Dict, config_path: str) -> None:
+    """Save an agent configuration to a file."""
     os.makedirs(os.path.dirname(config_path), exist_ok=True)
     with open(config_path, 'w') as f:
         json.dump(config, f, indent=2)
@@ -2058,7 +2170,7 @@ def setup_config(args) -> None:
         return
     
     config = create_default_config()
-    save_config(config, config_path)
+    save_agent_config(config, config_path)
 
 def main() -> None:
     """Main entry point for the CLI."""
@@ -2104,9 +2216,5 @@ def main() -> None:
     elif args.command == "simulate":
         simulate_rewards(args.config)
 
-if __name__ == "__main__":
-    main() 
-        simulate_rewards(args.config)
-
-if __name__ == "__main__":
-    main() 
\ No newline at end of file
+if __name__ == '__main__':
+    run()
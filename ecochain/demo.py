@@ -91,8 +91,8 @@ def demo_ml_scoring():
     
     # Save the model
     os.makedirs("data/models", exist_ok=True)
-    ml_scorer.save_model("data/models/sustainability_model.pkl")
-    logger.info("Model saved to data/models/sustainability_model.pkl")
+    ml_scorer.save_model("data/models/sustainability_model.ecomodel")
+    logger.info("Model saved to data/models/sustainability_model.ecomodel")
 
 def demo_zk_verification():
     """Demonstrate zkSNARK proofs for carbon reporting."""
@@ -406,8 +406,8 @@ def demo_ml_scoring():
     
     # Save the model
     os.makedirs("data/models", exist_ok=True)
-    ml_scorer.save_model("data/models/sustainability_model.pkl")
-    logger.info("Model saved to data/models/sustainability_model.pkl")
+    ml_scorer.save_model("data/models/sustainability_model.ecomodel")
+    logger.info("Model saved to data/models/sustainability_model.ecomodel")
 
 def demo_zk_verification():
     """Demonstrate zkSNARK proofs for carbon reporting."""
@@ -6,9 +6,9 @@ providing reliable and verified data from multiple sources.
 """
 
 from ecochain.oracles.oracle_network import OracleNetwork
-from ecochain.oracles.data_provider import DataProvider
+from ecochain.oracles.data_provider import DataProvider, AsyncDataProvider
 from ecochain.oracles.reputation_system import ReputationSystem
 
-__all__ = ['OracleNetwork', 'DataProvider', 'ReputationSystem'] 
+__all__ = ['OracleNetwork', 'DataProvider', 'AsyncDataProvider', 'ReputationSystem'] 
  
  
\ No newline at end of file
@@ -0,0 +1,406 @@
+"""
+Aggregation Engine for Oracle Network
+
+This module implements the NumPy-backed statistics the oracle network
+uses to combine provider responses into a single result. Every method
+takes an array of values and an optional array of weights, so they can
+be registered interchangeably in ``OracleNetwork.aggregation_methods``.
+Legacy one-argument methods, such as ``statistics.median``, are wrapped
+when registered in a ``MethodTable`` and called with the values only.
+
+Means and medians of lists, and of arrays of up to ``SMALL_INPUT_SIZE``
+values, are computed in pure Python, which avoids NumPy's per-call and
+conversion overhead on the few responses a request usually gets.
+"""
+
+import inspect
+import operator
+from collections import Counter
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+# Signature shared by all aggregation methods: fn(values, weights) -> float
+AggregationMethod = Callable[[np.ndarray, Optional[np.ndarray]], float]
+
+# Arrays up to this many values skip NumPy in mean, weighted_mean and median
+SMALL_INPUT_SIZE = 32
+
+
+def _python_values(values) -> Optional[list]:
+    """
+    Get values to aggregate in pure Python, or None to aggregate with NumPy.
+
+    Lists and tuples are used as they are, since converting them to an
+    array costs more than the reduction; arrays are converted to lists up
+    to ``SMALL_INPUT_SIZE`` values.
+    """
+    if isinstance(values, (list, tuple)):
+        return values
+    if isinstance(values, np.ndarray) and values.size <= SMALL_INPUT_SIZE:
+        return values.tolist()
+    return None
+
+
+def _takes_weights(method: Callable) -> bool:
+    """
+    Check whether a callable follows the fn(values, weights) convention.
+
+    A method takes weights if it has a ``weights`` parameter or at least two
+    required positional parameters. Anything else, including callables
+    whose signature cannot be inspected, is treated as a legacy fn(values).
+    """
+    try:
+        parameters = inspect.signature(method).parameters.values()
+    except (TypeError, ValueError):
+        return False
+
+    if any(p.name == "weights" for p in parameters):
+        return True
+    required = [
+        p for p in parameters
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) and p.default is p.empty
+    ]
+    return len(required) >= 2
+
+
+def as_aggregation_method(method: Callable) -> AggregationMethod:
+    """
+    Adapt a callable to the fn(values, weights) aggregation signature.
+
+    Args:
+        method: An aggregation method or a legacy one-argument callable.
+
+    Returns:
+        The method itself if it takes weights, otherwise a wrapper that
+        calls it with the values as a list and ignores the weights.
+    """
+    if _takes_weights(method):
+        return method
+
+    @wraps(method)
+    def legacy(values, weights=None):
+        return method(values.tolist() if isinstance(values, np.ndarray) else list(values))
+
+    return legacy
+
+
+class MethodTable(dict):
+    """
+    Name -> aggregation method table.
+
+    Methods are adapted with ``as_aggregation_method`` as they are added,
+    so legacy one-argument callables can be registered alongside methods
+    that take weights.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, name: str, method: Callable) -> None:
+        super().__setitem__(name, as_aggregation_method(method))
+
+    def update(self, *args, **kwargs) -> None:
+        for name, method in dict(*args, **kwargs).items():
+            self[name] = method
+
+    def setdefault(self, name: str, method: Callable = None) -> AggregationMethod:
+        if name not in self:
+            self[name] = method
+        return self[name]
+
+
+def _as_arrays(values, weights) -> tuple:
+    """Convert values and weights to float arrays, dropping unusable weights."""
+    values = np.asarray(values, dtype=float)
+    if weights is None:
+        return values, None
+
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape != values.shape or weights.sum() <= 0:
+        return values, None
+
+    return values, weights
+
+
+def _sorted_median(values: np.ndarray) -> float:
+    """Median of a non-empty array; cheaper than np.median for short inputs."""
+    ordered = np.sort(values)
+    middle = ordered.size // 2
+    if ordered.size % 2:
+        return float(ordered[middle])
+    return float((ordered[middle - 1] + ordered[middle]) / 2.0)
+
+
+def _python_weighted_mean(values: list, weights) -> float:
+    """Pure-Python weighted_mean of a non-empty list, with the same weight fallbacks."""
+    if isinstance(weights, np.ndarray):
+        weights = weights.tolist()
+    if weights is not None and len(weights) == len(values):
+        total = sum(weights)
+        if total > 0:
+            return sum(map(operator.mul, values, weights)) / total
+    return sum(values) / len(values)
+
+
+def mean(values, weights=None) -> float:
+    """
+    Calculate the arithmetic mean, ignoring weights.
+
+    Args:
+        values: Array of values.
+        weights: Unused, accepted for a uniform signature.
+
+    Returns:
+        The mean, or 0.0 for an empty input.
+    """
+    python_values = _python_values(values)
+    if python_values is not None:
+        return sum(python_values) / len(python_values) if python_values else 0.0
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return 0.0
+    return float(values.mean())
+
+
+def weighted_mean(values, weights=None) -> float:
+    """
+    Calculate the weighted mean.
+
+    Falls back to the plain mean when no usable weights are given.
+
+    Args:
+        values: Array of values.
+        weights: Array of non-negative weights aligned with ``values``.
+
+    Returns:
+        The weighted mean, or 0.0 for an empty input.
+    """
+    python_values = _python_values(values)
+    if python_values is not None:
+        return _python_weighted_mean(python_values, weights) if python_values else 0.0
+    values, weights = _as_arrays(values, weights)
+    if values.size == 0:
+        return 0.0
+    if weights is None:
+        return float(values.mean())
+    return float(np.dot(values, weights) / weights.sum())
+
+
+def median(values, weights=None) -> float:
+    """
+    Calculate the median, ignoring weights.
+
+    Args:
+        values: Array of values.
+        weights: Unused, accepted for a uniform signature.
+
+    Returns:
+        The median, or 0.0 for an empty input.
+    """
+    python_values = _python_values(values)
+    if python_values is not None:
+        if not python_values:
+            return 0.0
+        ordered = sorted(python_values)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return float(ordered[middle])
+        return (ordered[middle - 1] + ordered[middle]) / 2.0
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return 0.0
+    return _sorted_median(values)
+
+
+def weighted_median(values, weights=None) -> float:
+    """
+    Calculate the weighted median.
+
+    The result is the value where the cumulative weight first reaches half
+    of the total weight. When it lands exactly on the half, the two middle
+    values are averaged, so equal weights give the ordinary median.
+
+    Args:
+        values: Array of values.
+        weights: Array of non-negative weights aligned with ``values``.
+
+    Returns:
+        The weighted median, or 0.0 for an empty input.
+    """
+    values, weights = _as_arrays(values, weights)
+    if values.size == 0:
+        return 0.0
+    if weights is None:
+        return _sorted_median(values)
+
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    cumulative = np.cumsum(weights[order])
+    half = cumulative[-1] / 2.0
+
+    i = int(np.searchsorted(cumulative, half))
+    if i + 1 < sorted_values.size and np.isclose(cumulative[i], half):
+        return float((sorted_values[i] + sorted_values[i + 1]) / 2.0)
+    return float(sorted_values[i])
+
+
+def weighted_trimmed_mean(values, weights=None, trim_fraction: float = 0.1) -> float:
+    """
+    Calculate the weighted mean after trimming both tails of the weight mass.
+
+    ``trim_fraction`` of the total weight is removed from each end of the
+    sorted values. A value straddling the cut keeps only the part of its
+    weight inside the kept range. Inputs of three values or fewer are not
+    trimmed.
+
+    Args:
+        values: Array of values.
+        weights: Array of non-negative weights aligned with ``values``.
+        trim_fraction: Fraction of the total weight to trim from each tail.
+
+    Returns:
+        The trimmed mean, or 0.0 for an empty input.
+    """
+    values, weights = _as_arrays(values, weights)
+    if values.size == 0:
+        return 0.0
+    if weights is None:
+        weights = np.ones_like(values)
+    if values.size <= 3 or trim_fraction <= 0:
+        return float(np.dot(values, weights) / weights.sum())
+
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    upper = np.cumsum(weights[order])
+    lower = upper - weights[order]
+
+    total = upper[-1]
+    low_cut = total * trim_fraction
+    high_cut = total * (1.0 - trim_fraction)
+
+    kept = np.clip(np.minimum(upper, high_cut) - np.maximum(lower, low_cut), 0.0, None)
+    if kept.sum() <= 0:
+        return weighted_median(values, weights)
+    return float(np.dot(sorted_values, kept) / kept.sum())
+
+
+def mode(values, weights=None) -> float:
+    """
+    Calculate the most common value, ignoring weights.
+
+    Ties are broken in favour of the smallest value.
+
+    Args:
+        values: Array of values.
+        weights: Unused, accepted for a uniform signature.
+
+    Returns:
+        The most common value, or 0.0 for an empty input.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return 0.0
+    unique, counts = np.unique(values, return_counts=True)
+    return float(unique[np.argmax(counts)])
+
+
+def mad_inliers(values, threshold: float = 3.5) -> np.ndarray:
+    """
+    Flag values that are not outliers by the median absolute deviation.
+
+    Uses the modified z-score ``0.6745 * |x - median| / MAD``. When the
+    MAD is zero, only values equal to the median are kept.
+
+    Args:
+        values: Array of values.
+        threshold: Modified z-score above which a value is an outlier.
+
+    Returns:
+        Boolean mask, True for values to keep.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size < 3:
+        return np.ones(values.shape, dtype=bool)
+
+    deviations = np.abs(values - _sorted_median(values))
+    mad = _sorted_median(deviations)
+    if mad == 0:
+        return deviations == 0
+    return 0.6745 * deviations / mad <= threshold
+
+
+def most_common(values: List[Any]) -> Any:
+    """
+    Get the most common item of a list of hashable, non-numeric values.
+
+    Args:
+        values: List of values.
+
+    Returns:
+        The most common value; the first one seen wins ties.
+    """
+    return Counter(values).most_common(1)[0][0]
+
+
+def aggregate_columns(method: AggregationMethod, matrix: np.ndarray,
+                      weights: Optional[np.ndarray] = None,
+                      mad_threshold: Optional[float] = None) -> np.ndarray:
+    """
+    Aggregate each column of a response matrix independently.
+
+    Rows are responses and columns are payload keys; missing entries are
+    NaN. Means and weighted means are reduced for all columns in one pass;
+    other methods are applied to the present entries of each column.
+
+    Args:
+        method: The aggregation method.
+        matrix: 2-D array of shape (responses, keys).
+        weights: Optional weights, one per row.
+        mad_threshold: If set, drop MAD outliers within each column first.
+
+    Returns:
+        Array with one aggregated value per column (NaN for empty columns).
+    """
+    present = ~np.isnan(matrix)
+
+    if mad_threshold is not None:
+        for j in range(matrix.shape[1]):
+            rows = np.flatnonzero(present[:, j])
+            present[rows, j] = mad_inliers(matrix[rows, j], mad_threshold)
+
+    if method is mean or method is weighted_mean:
+        row_weights = np.ones(matrix.shape[0]) if method is mean or weights is None else np.asarray(weights, dtype=float)
+        column_weights = present * row_weights[:, None]
+        totals = column_weights.sum(axis=0)
+
+        # Columns whose providers carry no weight fall back to the plain mean
+        counts = present.sum(axis=0)
+        column_weights = np.where(totals > 0, column_weights, present)
+        totals = np.where(totals > 0, totals, counts)
+
+        sums = (np.where(present, matrix, 0.0) * column_weights).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / totals, np.nan)
+
+    result = np.full(matrix.shape[1], np.nan)
+    for j in range(matrix.shape[1]):
+        rows = present[:, j]
+        if rows.any():
+            result[j] = method(matrix[rows, j], None if weights is None else np.asarray(weights)[rows])
+    return result
+
+
+# Methods that aggregate Python lists without building arrays
+LIST_METHODS = (mean, weighted_mean, median)
+
+DEFAULT_METHODS: Dict[str, AggregationMethod] = {
+    "mean": mean,
+    "median": median,
+    "mode": mode,
+    "weighted_mean": weighted_mean,
+    "weighted_median": weighted_median,
+    "trimmed_mean": weighted_trimmed_mean
+}
@@ -0,0 +1,117 @@
+"""
+Request Archive Index for Oracle Network
+
+This module implements the on-disk index of the oracle network's request
+archive: an SQLite table mapping each archived request ID to the byte
+offset of its line in the append-only archive file. Lookups go to disk,
+so the index does not grow the process's memory with the archive.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rows inserted per transaction while catching up with the archive file
+_CATCH_UP_BATCH = 10000
+
+
+class ArchiveIndex:
+    """
+    SQLite index of request offsets in an archive file.
+
+    The index records how many bytes of the archive it covers, so opening
+    it only scans archive lines appended since it was last updated, e.g.
+    by an older version that kept no index.
+    """
+
+    def __init__(self, archive_path: str, index_path: Optional[str] = None):
+        """
+        Open the index, creating it or catching up with the archive as needed.
+
+        Args:
+            archive_path: Path of the archive file.
+            index_path: Path of the SQLite index, defaults to the archive path plus ".idx".
+        """
+        self.archive_path = archive_path
+        self.path = index_path or f"{archive_path}.idx"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS offsets (request_id TEXT PRIMARY KEY, offset INTEGER)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)")
+        self.count = self._conn.execute("SELECT COUNT(*) FROM offsets").fetchone()[0]
+        self._catch_up()
+
+    def _indexed_bytes(self) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'indexed_bytes'").fetchone()
+        return row[0] if row else 0
+
+    def _catch_up(self) -> None:
+        """Index archive lines the index does not cover yet."""
+        if not os.path.exists(self.archive_path):
+            return
+
+        offset = self._indexed_bytes()
+        if offset > os.path.getsize(self.archive_path):
+            # The archive was replaced; index it from the start
+            with self._conn:
+                self._conn.execute("DELETE FROM offsets")
+            offset = 0
+
+        try:
+            with open(self.archive_path, 'rb') as f:
+                f.seek(offset)
+                batch = []
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Partially written last line
+                    try:
+                        batch.append((json.loads(line)["request_id"], offset))
+                    except (ValueError, KeyError):
+                        logger.warning(f"Skipping malformed archive entry at offset {offset}")
+                    offset += len(line)
+                    if len(batch) >= _CATCH_UP_BATCH:
+                        self._insert(batch, offset)
+                        batch = []
+                self._insert(batch, offset)
+        except OSError as e:
+            logger.warning(f"Could not index request archive: {e}")
+            return
+
+        self.count = self._conn.execute("SELECT COUNT(*) FROM offsets").fetchone()[0]
+        logger.info(f"Indexed {self.count} archived requests from {self.archive_path}")
+
+    def _insert(self, entries: Iterable[Tuple[str, int]], indexed_bytes: int) -> None:
+        """Insert (request_id, offset) entries and record the archive size they cover."""
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO offsets VALUES (?, ?)", list(entries))
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('indexed_bytes', ?)", (indexed_bytes,))
+
+    def add(self, entries: Iterable[Tuple[str, int]], indexed_bytes: int) -> None:
+        """
+        Record newly archived requests.
+
+        Args:
+            entries: (request_id, offset) of each line written to the archive.
+            indexed_bytes: Size of the archive file after those lines.
+        """
+        entries = list(entries)
+        with self._lock:
+            self._insert(entries, indexed_bytes)
+            self.count += len(entries)
+
+    def get(self, request_id: str) -> Optional[int]:
+        """Get the archive offset of a request, or None if it is not archived."""
+        with self._lock:
+            row = self._conn.execute("SELECT offset FROM offsets WHERE request_id = ?", (request_id,)).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        """Close the index database."""
+        with self._lock:
+            self._conn.close()
@@ -6,15 +6,22 @@ oracle network, allowing external data sources to provide carbon and
 sustainability data.
 """
 
+import asyncio
 import logging
 import time
 import json
 import uuid
 import hashlib
+import queue
+import threading
 import requests
+from functools import partial
 from typing import Dict, List, Any, Optional, Callable, Union
 from abc import ABC, abstractmethod
 
+from ecochain.oracles.response_cache import ResponseCache
+from ecochain.oracles.verification import sign_response
+
 logger = logging.getLogger(__name__)
 
 class DataProvider(ABC):
@@ -23,6 +30,14 @@ class DataProvider(ABC):
     
     Data providers are responsible for fetching data from external sources
     and submitting it to the oracle network in response to data requests.
+    
+    By default requests are processed inline when the provider is notified.
+    With ``processing_mode`` set to "queued", notifications only enqueue the
+    work on a bounded queue served by ``worker_count`` background threads,
+    and responses reach the network through ``submit_callback`` as they
+    complete. When the queue is full, ``queue_full_policy`` decides whether
+    new requests are rejected at once ("reject") or wait up to
+    ``queue_timeout`` seconds for room ("defer").
     """
     
     def __init__(self, name: str, supported_data_types: List[str], config: Dict[str, Any]):
@@ -43,13 +58,33 @@ class DataProvider(ABC):
         self.api_keys = config.get('api_keys', {})
         self.base_urls = config.get('base_urls', {})
         self.active = True
-        self.pending_requests = {}  # request_id -> request details
+        self.pending_requests = {}  # request_id -> request details, removed once processed
+        self._pending_lock = threading.Lock()
+        self.processed_count = 0
+        self.failed_count = 0
+        self.rejected_count = 0
+        
+        # Request processing settings
+        self.processing_mode = config.get('processing_mode', 'inline')  # 'inline' or 'queued'
+        self.worker_count = config.get('worker_count', 4)
+        self.queue_size = config.get('queue_size', 256)
+        self.queue_full_policy = config.get('queue_full_policy', 'reject')  # 'reject' or 'defer'
+        self.queue_timeout = config.get('queue_timeout', 1.0)
+        self._work_queue = None
+        self._workers = []
         
         # Private key for signing responses (in a real system, this would be securely managed)
         self.private_key = config.get('private_key')
         
         # Function to call when submitting a response
         self.submit_callback = None
+        
+        # Cache of fetched data; a cache_ttl of 0 disables it
+        self.cache = ResponseCache(
+            default_ttl=config.get('cache_ttl', 60.0),
+            ttls=config.get('cache_ttls'),
+            max_entries=config.get('cache_size', 1024)
+        )
     
     def set_submit_callback(self, callback: Callable) -> None:
         """
@@ -72,6 +107,26 @@ class DataProvider(ABC):
         Returns:
             True if the provider will handle the request, False otherwise.
         """
+        if not self._store_pending([request_id], data_type, [parameters]):
+            return False
+        
+        logger.info(f"Provider {self.name} notified of request {request_id} for {data_type}")
+        
+        return self._dispatch(partial(self._process_request, request_id), [request_id])
+    
+    def _store_pending(self, request_ids: List[str], data_type: str,
+                       parameters_list: List[Dict[str, Any]]) -> bool:
+        """
+        Check that the provider can handle requests and record them as pending.
+        
+        Args:
+            request_ids: IDs of the requests.
+            data_type: Type of data being requested.
+            parameters_list: Parameters for each request, aligned with ``request_ids``.
+            
+        Returns:
+            True if the requests were recorded, False if the provider can't handle them.
+        """
         # Check if the provider supports this data type
         if data_type not in self.supported_data_types:
             logger.warning(f"Provider {self.name} does not support data type {data_type}")
@@ -82,22 +137,35 @@ class DataProvider(ABC):
             logger.warning(f"Provider {self.name} is not active")
             return False
         
-        # Store the request
-        self.pending_requests[request_id] = {
-            "request_id": request_id,
-            "data_type": data_type,
-            "parameters": parameters,
-            "timestamp": time.time(),
-            "status": "PENDING"
-        }
+        # Store the requests
+        timestamp = time.time()
+        with self._pending_lock:
+            for request_id, parameters in zip(request_ids, parameters_list):
+                self.pending_requests[request_id] = {
+                    "request_id": request_id,
+                    "data_type": data_type,
+                    "parameters": parameters,
+                    "timestamp": timestamp,
+                    "status": "PENDING"
+                }
         
-        logger.info(f"Provider {self.name} notified of request {request_id} for {data_type}")
+        return True
+    
+    def _submit_result(self, request: Dict[str, Any], data: Any) -> None:
+        """
+        Record fetched data on a pending request, then sign and submit it.
         
-        # Process the request asynchronously
-        # In a real system, this would be done in a separate thread or task
-        self._process_request(request_id)
+        Args:
+            request: The pending request entry.
+            data: The fetched data.
+        """
+        # Update request status
+        request["status"] = "PROCESSED"
+        request["result"] = data
         
-        return True
+        # Sign and submit the response
+        signature = self._sign_response(request["request_id"], data)
+        self._submit_response(request["request_id"], data, signature)
     
     def _process_request(self, request_id: str) -> None:
         """
@@ -107,33 +175,216 @@ class DataProvider(ABC):
             request_id: ID of the request.
         """
         # Check if the request exists
-        if request_id not in self.pending_requests:
+        request = self.pending_requests.get(request_id)
+        if request is None:
             logger.warning(f"Request {request_id} not found")
             return
         
-        request = self.pending_requests[request_id]
         data_type = request["data_type"]
         parameters = request["parameters"]
         
         try:
             # Get the data
-            data = self.fetch_data(data_type, parameters)
-            
-            # Update request status
-            request["status"] = "PROCESSED"
-            request["result"] = data
-            
-            # Sign the response
-            signature = self._sign_response(request_id, data)
+            data = self.get_data(data_type, parameters)
             
-            # Submit the response
-            self._submit_response(request_id, data, signature)
+            self._submit_result(request, data)
             
             logger.info(f"Provider {self.name} processed request {request_id}")
         except Exception as e:
             logger.error(f"Error processing request {request_id}: {e}")
             request["status"] = "FAILED"
             request["error"] = str(e)
+        finally:
+            self._complete_requests([request])
+    
+    def _dispatch(self, work: Callable[[], None], request_ids: List[str]) -> bool:
+        """
+        Run or enqueue request processing according to ``processing_mode``.
+        
+        Args:
+            work: Callable that processes the requests.
+            request_ids: IDs of the requests ``work`` processes.
+            
+        Returns:
+            True if the work was run or enqueued, False if the queue was full.
+        """
+        if self.processing_mode != "queued":
+            work()
+            return True
+        
+        if self._work_queue is None:
+            self.start_workers()
+        
+        try:
+            if self.queue_full_policy == "defer":
+                self._work_queue.put(work, timeout=self.queue_timeout)
+            else:
+                self._work_queue.put_nowait(work)
+        except queue.Full:
+            self._reject_requests(request_ids)
+            return False
+        
+        return True
+    
+    def _reject_requests(self, request_ids: List[str]) -> None:
+        """
+        Drop requests that could not be queued from ``pending_requests``.
+        
+        Args:
+            request_ids: IDs of the rejected requests.
+        """
+        logger.warning(f"Provider {self.name} queue is full, rejecting {len(request_ids)} request(s)")
+        with self._pending_lock:
+            for request_id in request_ids:
+                self.pending_requests.pop(request_id, None)
+            self.rejected_count += len(request_ids)
+    
+    def _complete_requests(self, requests: List[Dict[str, Any]]) -> None:
+        """
+        Remove processed or failed requests from ``pending_requests``.
+        
+        Args:
+            requests: The request entries that finished processing.
+        """
+        with self._pending_lock:
+            for request in requests:
+                self.pending_requests.pop(request["request_id"], None)
+                if request["status"] == "FAILED":
+                    self.failed_count += 1
+                else:
+                    self.processed_count += 1
+    
+    def start_workers(self) -> None:
+        """Start the worker threads that serve the request queue."""
+        with self._pending_lock:
+            if self._work_queue is not None:
+                return
+            
+            self._work_queue = queue.Queue(maxsize=self.queue_size)
+            self._workers = [
+                threading.Thread(target=self._worker_loop, args=(self._work_queue,),
+                                 name=f"provider-{self.name}-{i}", daemon=True)
+                for i in range(max(1, self.worker_count))
+            ]
+        
+        for worker in self._workers:
+            worker.start()
+    
+    def _worker_loop(self, work_queue: queue.Queue) -> None:
+        """Process queued work until a stop sentinel is received."""
+        while True:
+            work = work_queue.get()
+            try:
+                if work is None:
+                    return
+                work()
+            except Exception as e:
+                logger.error(f"Provider {self.name} worker error: {e}")
+            finally:
+                work_queue.task_done()
+    
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker threads.
+        
+        Work already queued is processed before the workers exit.
+        
+        Args:
+            wait: Whether to wait for the workers to exit.
+            timeout: Maximum time in seconds to wait for each worker.
+        """
+        with self._pending_lock:
+            work_queue, workers = self._work_queue, self._workers
+            self._work_queue, self._workers = None, []
+        
+        if work_queue is None:
+            return
+        
+        for _ in workers:
+            work_queue.put(None)
+        
+        if wait:
+            for worker in workers:
+                worker.join(timeout)
+    
+    def notify_requests_batch(self, request_ids: List[str], data_type: str,
+                              parameters_list: List[Dict[str, Any]]) -> bool:
+        """
+        Notify the provider about a batch of data requests of the same type.
+        
+        Args:
+            request_ids: IDs of the requests.
+            data_type: Type of data being requested.
+            parameters_list: Parameters for each request, aligned with ``request_ids``.
+            
+        Returns:
+            True if the provider will handle the requests, False otherwise.
+        """
+        if not self._store_pending(request_ids, data_type, parameters_list):
+            return False
+        
+        logger.info(f"Provider {self.name} notified of {len(request_ids)} requests for {data_type}")
+        
+        return self._dispatch(partial(self._process_requests_batch, data_type, list(request_ids)), request_ids)
+    
+    def _process_requests_batch(self, data_type: str, request_ids: List[str]) -> None:
+        """
+        Process a batch of data requests with a single ``fetch_data_batch`` call.
+        
+        Args:
+            data_type: Type of data being requested.
+            request_ids: IDs of the requests.
+        """
+        requests = [self.pending_requests[r] for r in request_ids if r in self.pending_requests]
+        if not requests:
+            return
+        
+        try:
+            # Get the data
+            results = self.fetch_data_batch(data_type, [r["parameters"] for r in requests])
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(requests)} {data_type} requests: {e}")
+            for request in requests:
+                request["status"] = "FAILED"
+                request["error"] = str(e)
+            self._complete_requests(requests)
+            return
+        
+        for request, data in zip(requests, results):
+            request_id = request["request_id"]
+            
+            if isinstance(data, Exception):
+                logger.error(f"Error processing request {request_id}: {data}")
+                request["status"] = "FAILED"
+                request["error"] = str(data)
+                continue
+            
+            try:
+                self._submit_result(request, data)
+            except Exception as e:
+                logger.error(f"Error submitting response for request {request_id}: {e}")
+                request["status"] = "FAILED"
+                request["error"] = str(e)
+        
+        self._complete_requests(requests)
+        
+        logger.info(f"Provider {self.name} processed batch of {len(requests)} requests")
+    
+    def get_data(self, data_type: str, parameters: Dict[str, Any]) -> Any:
+        """
+        Get data for a request through the provider's response cache.
+        
+        Identical requests within the data type's TTL are served from the
+        cache, and concurrent identical requests share one ``fetch_data`` call.
+        
+        Args:
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+            
+        Returns:
+            The fetched data.
+        """
+        return self.cache.get_or_fetch(data_type, parameters, self.fetch_data)
     
     @abstractmethod
     def fetch_data(self, data_type: str, parameters: Dict[str, Any]) -> Any:
@@ -149,6 +400,31 @@ class DataProvider(ABC):
         """
         pass
     
+    def fetch_data_batch(self, data_type: str, parameters_list: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Fetch data for several requests of the same type.
+        
+        The default implementation calls ``get_data`` once per item, so
+        repeated parameters within the batch are fetched only once.
+        Providers backed by APIs with bulk endpoints should override it.
+        Items that fail are returned as the raised exception so that one
+        bad request does not fail the whole batch.
+        
+        Args:
+            data_type: Type of data being requested.
+            parameters_list: Parameters for each request.
+            
+        Returns:
+            The fetched data, aligned with ``parameters_list``.
+        """
+        results = []
+        for parameters in parameters_list:
+            try:
+                results.append(self.get_data(data_type, parameters))
+            except Exception as e:
+                results.append(e)
+        return results
+    
     def _sign_response(self, request_id: str, data: Any) -> Optional[str]:
         """
         Sign a response using the provider's private key.
@@ -165,10 +441,7 @@ class DataProvider(ABC):
         
         # In a real system, this would use proper cryptographic signing
         # For this demo, use a simple hash-based approach
-        message = f"{request_id}:{json.dumps(data, sort_keys=True)}"
-        signature = hashlib.sha256((message + self.private_key).encode()).hexdigest()
-        
-        return signature
+        return sign_response(request_id, data, self.private_key)
     
     def _submit_response(self, request_id: str, data: Any, signature: Optional[str] = None) -> bool:
         """
@@ -218,10 +491,359 @@ class DataProvider(ABC):
             "response_count": self.response_count,
             "last_updated": self.last_updated,
             "active": self.active,
-            "pending_requests": len(self.pending_requests)
+            "pending_requests": len(self.pending_requests),
+            "processed_requests": self.processed_count,
+            "failed_requests": self.failed_count,
+            "rejected_requests": self.rejected_count,
+            "queue_depth": self._work_queue.qsize() if self._work_queue is not None else 0,
+            "cache": self.cache.get_stats()
         }
 
 
+class AsyncDataProvider(DataProvider):
+    """
+    Data provider served by asyncio worker tasks.
+    
+    Subclasses implement the coroutine ``fetch_data_async``. Requests are
+    put on a bounded ``asyncio.Queue`` of ``queue_size`` entries and served
+    by ``worker_count`` worker tasks, which submit each response through
+    ``submit_callback`` as it completes and drop the request from
+    ``pending_requests``. When the queue is full, ``queue_full_policy``
+    decides whether new requests are rejected at once ("reject") or wait up
+    to ``queue_timeout`` seconds for room ("defer").
+    
+    From a coroutine, ``await start()`` runs the workers on the current
+    event loop and ``await submit(...)`` queues a request. The synchronous
+    ``notify_request`` the oracle network calls may be used from any other
+    thread; if the provider was not started, it runs its own event loop in
+    a background thread.
+    """
+    
+    def __init__(self, name: str, supported_data_types: List[str], config: Dict[str, Any]):
+        """
+        Initialize the data provider.
+        
+        Args:
+            name: Name of the data provider.
+            supported_data_types: List of data types supported by the provider.
+            config: Configuration dictionary for the provider.
+        """
+        super().__init__(name, supported_data_types, config)
+        self.processing_mode = 'queued'
+        self._loop = None  # event loop the workers run on
+        self._loop_thread = None  # thread running the loop, if the provider owns it
+        self._async_queue = None
+        self._worker_tasks = []
+        self._fetches = {}  # cache key -> future of the fetch in progress
+    
+    @abstractmethod
+    async def fetch_data_async(self, data_type: str, parameters: Dict[str, Any]) -> Any:
+        """
+        Fetch data from an external source.
+        
+        Args:
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+            
+        Returns:
+            The fetched data.
+        """
+        pass
+    
+    async def fetch_data_batch_async(self, data_type: str, parameters_list: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Fetch data for several requests of the same type concurrently.
+        
+        Items that fail are returned as the raised exception, as in
+        ``fetch_data_batch``. Providers backed by APIs with bulk endpoints
+        should override it.
+        
+        Args:
+            data_type: Type of data being requested.
+            parameters_list: Parameters for each request.
+            
+        Returns:
+            The fetched data, aligned with ``parameters_list``.
+        """
+        return await asyncio.gather(
+            *(self.get_data_async(data_type, parameters) for parameters in parameters_list),
+            return_exceptions=True
+        )
+    
+    async def get_data_async(self, data_type: str, parameters: Dict[str, Any]) -> Any:
+        """
+        Get data for a request through the provider's response cache.
+        
+        Concurrent identical requests share one ``fetch_data_async`` call.
+        
+        Args:
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+            
+        Returns:
+            The fetched data.
+        """
+        key = self.cache.make_key(data_type, parameters)
+        fetch = self._fetches.get(key)
+        if fetch is None:
+            found, value = self.cache.lookup(data_type, parameters)
+            if found:
+                return value
+            fetch = self._fetches[key] = asyncio.ensure_future(self.fetch_data_async(data_type, parameters))
+            fetch.add_done_callback(partial(self._fetch_done, data_type, parameters, key))
+        
+        # A cancelled caller must not cancel the fetch other callers share
+        return await asyncio.shield(fetch)
+    
+    def _fetch_done(self, data_type: str, parameters: Dict[str, Any], key: tuple, fetch: asyncio.Future) -> None:
+        """Cache a completed fetch and stop sharing it."""
+        self._fetches.pop(key, None)
+        if not fetch.cancelled() and fetch.exception() is None:
+            self.cache.store(data_type, parameters, fetch.result())
+    
+    def fetch_data(self, data_type: str, parameters: Dict[str, Any]) -> Any:
+        """
+        Fetch data synchronously by running ``fetch_data_async`` on the provider's loop.
+        
+        Args:
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+            
+        Returns:
+            The fetched data.
+        """
+        return self._call_in_loop(self.fetch_data_async(data_type, parameters))
+    
+    async def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not None and self._loop is not loop:
+            raise RuntimeError(f"Provider {self.name} is already running on another event loop")
+        if self._async_queue is not None:
+            return
+        
+        self._loop = loop
+        self._async_queue = asyncio.Queue(maxsize=self.queue_size)
+        self._worker_tasks = [
+            loop.create_task(self._worker(self._async_queue), name=f"provider-{self.name}-{i}")
+            for i in range(max(1, self.worker_count))
+        ]
+    
+    async def stop(self) -> None:
+        """Process the requests already queued, then stop the worker tasks."""
+        work_queue, tasks = self._async_queue, self._worker_tasks
+        if work_queue is None:
+            return
+        self._async_queue, self._worker_tasks = None, []
+        
+        await work_queue.join()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if self._loop_thread is None:
+            self._loop = None
+    
+    async def submit(self, request_id: str, data_type: str, parameters: Dict[str, Any]) -> bool:
+        """
+        Queue a data request for the worker tasks.
+        
+        Args:
+            request_id: ID of the request.
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+            
+        Returns:
+            True if the request was queued, False if the provider can't
+            handle it or the queue stayed full.
+        """
+        return await self._enqueue([request_id], data_type, [parameters])
+    
+    async def submit_batch(self, request_ids: List[str], data_type: str,
+                           parameters_list: List[Dict[str, Any]]) -> bool:
+        """
+        Queue a batch of data requests of the same type as one work item.
+        
+        Args:
+            request_ids: IDs of the requests.
+            data_type: Type of data being requested.
+            parameters_list: Parameters for each request, aligned with ``request_ids``.
+            
+        Returns:
+            True if the requests were queued, False if the provider can't
+            handle them or the queue stayed full.
+        """
+        return await self._enqueue(list(request_ids), data_type, parameters_list)
+    
+    async def _enqueue(self, request_ids: List[str], data_type: str,
+                       parameters_list: List[Dict[str, Any]]) -> bool:
+        """Record requests as pending and put them on the queue, applying ``queue_full_policy``."""
+        if self._async_queue is None:
+            await self.start()
+        
+        if not self._store_pending(request_ids, data_type, parameters_list):
+            return False
+        
+        work = (data_type, request_ids)
+        try:
+            if self.queue_full_policy == "defer":
+                await asyncio.wait_for(self._async_queue.put(work), self.queue_timeout)
+            else:
+                self._async_queue.put_nowait(work)
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            self._reject_requests(request_ids)
+            return False
+        
+        logger.info(f"Provider {self.name} queued {len(request_ids)} request(s) for {data_type}")
+        return True
+    
+    async def _worker(self, work_queue: asyncio.Queue) -> None:
+        """Process queued requests until cancelled."""
+        while True:
+            data_type, request_ids = await work_queue.get()
+            try:
+                await self._process_requests_async(data_type, request_ids)
+            except Exception as e:
+                logger.error(f"Provider {self.name} worker error: {e}")
+            finally:
+                work_queue.task_done()
+    
+    async def _process_requests_async(self, data_type: str, request_ids: List[str]) -> None:
+        """
+        Fetch data for queued requests and submit each response.
+        
+        Args:
+            data_type: Type of data being requested.
+            request_ids: IDs of the requests.
+        """
+        requests = [self.pending_requests[r] for r in request_ids if r in self.pending_requests]
+        if not requests:
+            return
+        
+        results = await self.fetch_data_batch_async(data_type, [r["parameters"] for r in requests])
+        
+        for request, data in zip(requests, results):
+            request_id = request["request_id"]
+            
+            if isinstance(data, Exception):
+                logger.error(f"Error processing request {request_id}: {data}")
+                request["status"] = "FAILED"
+                request["error"] = str(data)
+                continue
+            
+            try:
+                self._submit_result(request, data)
+            except Exception as e:
+                logger.error(f"Error submitting response for request {request_id}: {e}")
+                request["status"] = "FAILED"
+                request["error"] = str(e)
+        
+        self._complete_requests(requests)
+    
+    def notify_request(self, request_id: str, data_type: str, parameters: Dict[str, Any]) -> bool:
+        """
+        Queue a data request from a thread outside the provider's event loop.
+        
+        Args:
+            request_id: ID of the request.
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+            
+        Returns:
+            True if the request was queued, False otherwise.
+        """
+        return self._call_in_loop(self.submit(request_id, data_type, parameters))
+    
+    def notify_requests_batch(self, request_ids: List[str], data_type: str,
+                              parameters_list: List[Dict[str, Any]]) -> bool:
+        """
+        Queue a batch of data requests from a thread outside the provider's event loop.
+        
+        Args:
+            request_ids: IDs of the requests.
+            data_type: Type of data being requested.
+            parameters_list: Parameters for each request, aligned with ``request_ids``.
+            
+        Returns:
+            True if the requests were queued, False otherwise.
+        """
+        return self._call_in_loop(self.submit_batch(request_ids, data_type, parameters_list))
+    
+    def _call_in_loop(self, coro) -> Any:
+        """Run a coroutine on the provider's event loop and wait for its result."""
+        if self._loop is None:
+            self.start_workers()
+        
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None and running is self._loop:
+            coro.close()
+            raise RuntimeError(f"Provider {self.name} can't block its own event loop; await the coroutine instead")
+        
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    def start_workers(self) -> None:
+        """Run the worker tasks on an event loop in a background thread."""
+        with self._pending_lock:
+            if self._loop is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._run_loop, args=(self._loop,),
+                                                 name=f"provider-{self.name}-loop", daemon=True)
+        
+        self._loop_thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), self._loop).result()
+    
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Run an event loop until stopped, then close it."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+    
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker tasks, and the event loop if the provider owns it.
+        
+        Requests already queued are processed before the workers exit.
+        
+        Args:
+            wait: Whether to wait for the workers and loop to exit.
+            timeout: Maximum time in seconds to wait for them.
+        """
+        with self._pending_lock:
+            loop, thread = self._loop, self._loop_thread
+            if thread is not None:
+                self._loop, self._loop_thread = None, None
+        
+        if loop is None or loop.is_closed():
+            return
+        
+        stopped = asyncio.run_coroutine_threadsafe(self.stop(), loop)
+        if thread is None:
+            # The workers run on the caller's loop, which is left running
+            return
+        
+        stopped.add_done_callback(lambda _: loop.call_soon_threadsafe(loop.stop))
+        if wait:
+            thread.join(timeout)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the provider.
+        
+        Returns:
+            Dictionary with provider statistics.
+        """
+        stats = super().get_stats()
+        stats["queue_depth"] = self._async_queue.qsize() if self._async_queue is not None else 0
+        return stats
+
+
 class CarbonEmissionsProvider(DataProvider):
     """
     Provider for carbon emissions data.
@@ -5,19 +5,30 @@ This module implements a decentralized oracle network for aggregating,
 validating, and delivering carbon data from multiple trusted sources.
 """
 
+import bisect
+import heapq
 import logging
 import time
 import uuid
 import json
 import math
-import statistics
-from typing import Dict, List, Any, Optional, Union, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import hashlib
+import os
+from functools import partial
 
+import numpy as np
+
+from ecochain.oracles import aggregation
 from ecochain.oracles.data_provider import DataProvider
 from ecochain.oracles.reputation_system import ReputationSystem
+from ecochain.oracles.verification import SignatureVerifier
+from ecochain.oracles.publication import PublicationQueue, encode_result, merkle_tree
+from ecochain.oracles.archive import ArchiveIndex
 from ecochain.blockchain.chain_adapter import ChainAdapter
 
 logger = logging.getLogger(__name__)
@@ -63,21 +74,28 @@ class OracleNetwork:
             config: Configuration dictionary for the network.
         """
         self.config = config
+        self._lock = threading.RLock()
         self.data_providers = {}  # provider_id -> DataProvider
+        self._providers_by_type = {}  # data_type -> {provider_id: None}, ordered by registration
+        self._provider_rank = []  # sorted list of (reputation rank key, provider_id)
+        self._provider_rank_keys = {}  # provider_id -> rank key in _provider_rank
+        self._unranked_providers = set()  # provider IDs the reputation system doesn't track
+        self._reputation_system = None
         self.reputation_system = ReputationSystem()
         self.requests = {}  # request_id -> DataRequest
         self.responses = {}  # request_id -> list of DataResponse
+        self._responders = {}  # request_id -> set of provider IDs that have responded
+        self._verified_counts = {}  # request_id -> number of verified responses
         self.chain_adapters = {}  # chain_name -> ChainAdapter
         self.on_chain_contracts = {}  # chain_name -> contract_address
         
-        # Aggregation methods
-        self.aggregation_methods = {
-            "mean": statistics.mean,
-            "median": statistics.median,
-            "mode": statistics.mode,
-            "weighted_mean": self._weighted_mean,
-            "trimmed_mean": lambda values, weights=None: statistics.mean(sorted(values)[1:-1] if len(values) > 3 else values)
-        }
+        # Aggregation methods: name -> fn(values, weights); one-argument callables are wrapped
+        self.aggregation_methods = aggregation.MethodTable(aggregation.DEFAULT_METHODS)
+        self.aggregation_methods["trimmed_mean"] = partial(
+            aggregation.weighted_trimmed_mean,
+            trim_fraction=config.get('trim_fraction', 0.1)  # Weight fraction trimmed from each tail
+        )
+        self.mad_threshold = config.get('mad_threshold')  # MAD outlier cutoff (modified z-score), None to disable
         
         # Default aggregation method
         self.default_aggregation = config.get('default_aggregation', 'weighted_mean')
@@ -90,6 +108,138 @@ class OracleNetwork:
         self.consensus_threshold = config.get('consensus_threshold', 0.7)  # Required agreement percentage
         self.valid_time_window = config.get('valid_time_window', 3600)  # Valid time window for responses (seconds)
         self.auto_finalize = config.get('auto_finalize', True)  # Auto-finalize requests when enough responses
+        
+        # Provider dispatch
+        self.dispatch_mode = config.get('dispatch_mode', 'sequential')  # "sequential" or "concurrent"
+        self.dispatch_workers = config.get('dispatch_workers', 16)  # Thread pool size for concurrent dispatch
+        self.provider_timeout = config.get('provider_timeout', 10.0)  # Per-provider timeout (seconds)
+        self._executor = None
+        self._timed_out_providers = {}  # request_id -> set of provider IDs that missed the timeout
+        self._deferred_finalize = set()  # request IDs whose auto-finalization is left to a batch
+        
+        # Response verification
+        self.verification_mode = config.get('verification_mode', 'inline')  # "inline" or "background"
+        self._verifier = SignatureVerifier(
+            key_resolver=self._provider_key,
+            on_verified=self._on_response_verified,
+            batch_size=config.get('verification_batch_size', 256),
+            max_wait=config.get('verification_max_wait', 0.01),  # Max time to fill a batch (seconds)
+            workers=config.get('verification_workers', 0),  # Verification processes, 0 for none
+            require_signatures=config.get('require_signatures', False)
+        )
+        
+        # On-chain publication
+        self.publication_mode = config.get('publication_mode', 'multi_value')  # "multi_value" or "merkle"
+        self._publications = {}  # request_id -> latest publication result
+        self._publication_queue = PublicationQueue(
+            publish_batch=self._publish_batch,
+            on_published=self._record_publications,
+            batch_size=config.get('publication_batch_size', 100),
+            max_delay=config.get('publication_max_delay', 60.0)  # Max time a queued result waits (seconds)
+        )
+        
+        # Request retention
+        self.retention_max_age = config.get('retention_max_age', 86400)  # Max age of a stored request (seconds)
+        self.retention_max_requests = config.get('retention_max_requests', 100000)  # Max number of stored requests
+        self.sweep_interval = config.get('sweep_interval')  # Background sweep period (seconds), None to disable
+        self.archive_file = config.get('archive_file')  # Append-only log of evicted finalized requests
+        self._archive_index = None  # On-disk request_id -> byte offset index of the archive file
+        self._archive_lock = threading.Lock()  # Serializes archive appends, taken without the network lock
+        self._archiving = {}  # request_id -> status of evicted requests still being archived
+        self._expired_count = 0
+        self._evicted_count = 0
+        self._next_sweep_size = self.retention_max_requests
+        self._sweeper = None
+        self._sweeper_stop = threading.Event()
+        
+        if self.archive_file:
+            self._archive_index = ArchiveIndex(self.archive_file, config.get('archive_index_file'))
+        if self.sweep_interval:
+            self.start_sweeper()
+    
+    @property
+    def reputation_system(self) -> ReputationSystem:
+        """Reputation system scoring the network's providers."""
+        return self._reputation_system
+    
+    @reputation_system.setter
+    def reputation_system(self, reputation_system: ReputationSystem) -> None:
+        with self._lock:
+            if self._reputation_system is not None:
+                self._reputation_system.remove_rank_listener(self._on_reputation_change)
+            self._reputation_system = reputation_system
+            reputation_system.add_rank_listener(self._on_reputation_change)
+            
+            self._provider_rank = []
+            self._provider_rank_keys = {}
+            self._unranked_providers = set()
+            for provider_id in self.data_providers:
+                if not reputation_system.has_entity(provider_id):
+                    reputation_system.add_entity(provider_id)
+                self._rank_provider(provider_id)
+    
+    def _on_reputation_change(self, entity_id: str) -> None:
+        """Keep the provider rank index in step with the reputation system."""
+        with self._lock:
+            if entity_id in self.data_providers:
+                self._rank_provider(entity_id)
+    
+    def _rank_provider(self, provider_id: str) -> None:
+        """Move a provider to its reputation rank key, or drop it if it has none."""
+        with self._lock:
+            self._unrank_provider(provider_id)
+            key = self.reputation_system.rank_key(provider_id)
+            if key is None:
+                self._unranked_providers.add(provider_id)
+            else:
+                self._provider_rank_keys[provider_id] = key
+                bisect.insort(self._provider_rank, (key, provider_id))
+    
+    def _unrank_provider(self, provider_id: str) -> None:
+        """Remove a provider from the reputation rank index."""
+        with self._lock:
+            self._unranked_providers.discard(provider_id)
+            key = self._provider_rank_keys.pop(provider_id, None)
+            if key is not None:
+                i = bisect.bisect_left(self._provider_rank, (key, provider_id))
+                if i < len(self._provider_rank) and self._provider_rank[i] == (key, provider_id):
+                    del self._provider_rank[i]
+    
+    def _index_provider(self, provider: DataProvider) -> None:
+        """Add a provider to the capability index."""
+        with self._lock:
+            for data_type in provider.supported_data_types:
+                self._providers_by_type.setdefault(data_type, {})[provider.provider_id] = None
+    
+    def _unindex_provider(self, provider_id: str) -> None:
+        """Remove a provider from the capability index."""
+        with self._lock:
+            for data_type in self.data_providers[provider_id].supported_data_types:
+                providers = self._providers_by_type.get(data_type)
+                if providers is not None:
+                    providers.pop(provider_id, None)
+                    if not providers:
+                        del self._providers_by_type[data_type]
+    
+    def _eligible_providers(self, data_type: str, min_reputation: float) -> List[tuple]:
+        """
+        Look up providers that support a data type and meet a reputation floor.
+        
+        Args:
+            data_type: Type of data being requested.
+            min_reputation: Minimum reputation score for providers.
+            
+        Returns:
+            List of (provider_id, provider) tuples in registration order.
+        """
+        with self._lock:
+            candidates = list(self._providers_by_type.get(data_type, ()))
+        
+        return [
+            (provider_id, self.data_providers[provider_id])
+            for provider_id in candidates
+            if self.reputation_system.get_score(provider_id) >= min_reputation
+        ]
     
     def register_provider(self, provider: DataProvider) -> bool:
         """
@@ -115,6 +265,10 @@ class OracleNetwork:
         if not self.reputation_system.has_entity(provider_id):
             self.reputation_system.add_entity(provider_id)
         
+        self._index_provider(provider)
+        self._rank_provider(provider_id)
+        self._verifier.invalidate_key(provider_id)
+        
         logger.info(f"Registered data provider {provider_id} ({provider.name})")
         return True
     
@@ -134,7 +288,10 @@ class OracleNetwork:
             return False
         
         # Remove the provider
+        self._unindex_provider(provider_id)
+        self._unrank_provider(provider_id)
         del self.data_providers[provider_id]
+        self._verifier.invalidate_key(provider_id)
         logger.info(f"Removed data provider {provider_id}")
         return True
     
@@ -154,27 +311,45 @@ class OracleNetwork:
         """
         List all registered data providers.
         
+        Providers are read from the reputation-ordered rank index, so only
+        those at or above the threshold are visited.
+        
         Args:
             min_reputation: Minimum reputation score to filter by.
             
         Returns:
-            List of provider information dictionaries.
+            List of provider information dictionaries, highest reputation first.
         """
-        providers = []
+        with self._lock:
+            bound = self.reputation_system.threshold_rank_key(min_reputation)
+            start = 0 if bound is None else bisect.bisect_left(self._provider_rank, (bound, ""))
+            ranked = [provider_id for _, provider_id in reversed(self._provider_rank[start:])]
+            # Providers the reputation system doesn't track score the default
+            unranked = set(self._unranked_providers)
+            unscored = unranked.union(provider_id for provider_id in ranked
+                                      if self._provider_rank_keys[provider_id] == -math.inf)
         
-        for provider_id, provider in self.data_providers.items():
+        providers = []
+        tail = []  # providers the index can't order: non-positive scores share a -inf key
+        for provider_id in ranked + list(unranked):
+            provider = self.data_providers.get(provider_id)
             reputation = self.reputation_system.get_score(provider_id)
-            if reputation >= min_reputation:
-                providers.append({
-                    "provider_id": provider_id,
-                    "name": provider.name,
-                    "data_types": provider.supported_data_types,
-                    "reputation": reputation,
-                    "response_count": provider.response_count,
-                    "last_updated": provider.last_updated
-                })
-        
-        return sorted(providers, key=lambda p: p["reputation"], reverse=True)
+            if provider is None or reputation < min_reputation:
+                continue
+            info = {
+                "provider_id": provider_id,
+                "name": provider.name,
+                "data_types": provider.supported_data_types,
+                "reputation": reputation,
+                "response_count": provider.response_count,
+                "last_updated": provider.last_updated
+            }
+            (tail if provider_id in unscored else providers).append(info)
+        
+        if tail:
+            tail.sort(key=lambda p: p["reputation"], reverse=True)
+            providers = list(heapq.merge(providers, tail, key=lambda p: p["reputation"], reverse=True))
+        return providers
     
     def submit_request(self, data_type: str, parameters: Dict[str, Any],
                       requester: str, deadline: Optional[float] = None,
@@ -209,16 +384,100 @@ class OracleNetwork:
         )
         
         # Store the request
-        self.requests[request_id] = request
-        self.responses[request_id] = []
+        with self._lock:
+            self.requests[request_id] = request
+            self.responses[request_id] = []
+            self._responders[request_id] = set()
+            self._verified_counts[request_id] = 0
         
         logger.info(f"Submitted request {request_id} for {data_type}")
         
+        self._maybe_sweep()
+        
         # Notify eligible providers
         self._notify_providers(request)
         
         return request_id
     
+    def submit_requests_batch(self, items: List[Tuple[str, Dict[str, Any]]],
+                              requester: str, deadline: Optional[float] = None,
+                              min_providers: int = 3, min_reputation: float = 50.0) -> List[str]:
+        """
+        Submit many data requests to the oracle network at once.
+        
+        Requests are grouped by data type so that each eligible provider
+        answers a whole group with a single ``fetch_data_batch`` call.
+        Auto-finalization is deferred until every group has been dispatched
+        and then runs through ``finalize_requests_batch``.
+        
+        Args:
+            items: List of (data_type, parameters) tuples.
+            requester: Address or identifier of the requester.
+            deadline: Optional deadline for the requests.
+            min_providers: Minimum number of data providers needed.
+            min_reputation: Minimum reputation score for providers.
+            
+        Returns:
+            List of request IDs, in the same order as ``items``.
+        """
+        request_ids = []
+        groups = {}  # data_type -> list of DataRequest
+        timestamp = time.time()
+        
+        with self._lock:
+            for data_type, parameters in items:
+                request_id = str(uuid.uuid4())
+                request = DataRequest(
+                    request_id=request_id,
+                    data_type=data_type,
+                    parameters=parameters,
+                    requester=requester,
+                    timestamp=timestamp,
+                    deadline=deadline,
+                    min_providers=min_providers,
+                    min_reputation=min_reputation
+                )
+                self.requests[request_id] = request
+                self.responses[request_id] = []
+                self._responders[request_id] = set()
+                self._verified_counts[request_id] = 0
+                groups.setdefault(data_type, []).append(request)
+                request_ids.append(request_id)
+            
+            self._deferred_finalize.update(request_ids)
+        
+        logger.info(f"Submitted batch of {len(request_ids)} requests across {len(groups)} data types")
+        
+        self._maybe_sweep()
+        
+        try:
+            for data_type, requests in groups.items():
+                group_ids = [r.request_id for r in requests]
+                parameters_list = [r.parameters for r in requests]
+                
+                tasks = [
+                    (provider_id, partial(provider.notify_requests_batch, group_ids, data_type, parameters_list))
+                    for provider_id, provider in self._eligible_providers(data_type, min_reputation)
+                ]
+                notified = self._run_provider_tasks(tasks, group_ids)
+                
+                logger.info(f"Notified {notified} providers about {len(group_ids)} {data_type} requests")
+        finally:
+            with self._lock:
+                self._deferred_finalize.difference_update(request_ids)
+        
+        if self.auto_finalize:
+            with self._lock:
+                ready = [
+                    request_id for request_id in request_ids
+                    if self.requests[request_id].status == "PENDING"
+                    and self._verified_counts[request_id] >= self.requests[request_id].min_providers
+                ]
+            if ready:
+                self.finalize_requests_batch(ready)
+        
+        return request_ids
+    
     def _notify_providers(self, request: DataRequest) -> int:
         """
         Notify eligible providers about a new data request.
@@ -229,28 +488,87 @@ class OracleNetwork:
         Returns:
             Number of providers notified.
         """
-        notified = 0
+        tasks = [
+            (provider_id, partial(provider.notify_request, request.request_id, request.data_type, request.parameters))
+            for provider_id, provider in self._eligible_providers(request.data_type, request.min_reputation)
+        ]
+        notified = self._run_provider_tasks(tasks, [request.request_id])
         
-        for provider_id, provider in self.data_providers.items():
-            # Check if provider supports the data type
-            if request.data_type not in provider.supported_data_types:
-                continue
-            
-            # Check if provider has sufficient reputation
-            reputation = self.reputation_system.get_score(provider_id)
-            if reputation < request.min_reputation:
-                continue
+        logger.info(f"Notified {notified} providers about request {request.request_id}")
+        return notified
+    
+    def _run_provider_tasks(self, tasks: List[Tuple[str, Callable]], request_ids: List[str]) -> int:
+        """
+        Run provider notification calls according to ``dispatch_mode``.
+        
+        In "concurrent" mode the calls are fanned out on a thread pool and
+        waited for up to the provider timeout. Providers still running when
+        the timeout elapses are recorded so that their late responses to
+        ``request_ids`` are rejected by ``submit_response``.
+        
+        Args:
+            tasks: List of (provider_id, callable) tuples.
+            request_ids: IDs of the requests the calls are answering.
             
-            # Notify provider
+        Returns:
+            Number of providers notified successfully.
+        """
+        if self.dispatch_mode != "concurrent" or len(tasks) <= 1:
+            notified = 0
+            for provider_id, task in tasks:
+                # Notify provider
+                try:
+                    task()
+                    notified += 1
+                except Exception as e:
+                    logger.error(f"Error notifying provider {provider_id}: {e}")
+            return notified
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.dispatch_workers,
+                thread_name_prefix="oracle-dispatch"
+            )
+        
+        futures = {self._executor.submit(task): provider_id for provider_id, task in tasks}
+        
+        done, not_done = wait(futures, timeout=self.provider_timeout)
+        
+        notified = 0
+        for future in done:
             try:
-                provider.notify_request(request.request_id, request.data_type, request.parameters)
+                future.result()
                 notified += 1
             except Exception as e:
-                logger.error(f"Error notifying provider {provider_id}: {e}")
+                logger.error(f"Error notifying provider {futures[future]}: {e}")
+        
+        if not_done:
+            with self._lock:
+                for future in not_done:
+                    future.cancel()
+                    provider_id = futures[future]
+                    for request_id in request_ids:
+                        self._timed_out_providers.setdefault(request_id, set()).add(provider_id)
+                    logger.warning(f"Provider {provider_id} timed out on {len(request_ids)} request(s)")
         
-        logger.info(f"Notified {notified} providers about request {request.request_id}")
         return notified
     
+    def shutdown(self) -> None:
+        """Stop background work and flush pending reputation changes."""
+        self.stop_sweeper()
+        for provider in list(self.data_providers.values()):
+            provider.shutdown(wait=False)
+        self._verifier.stop()
+        self._publication_queue.stop(flush=True)
+        self.reputation_system.flush()
+        with self._archive_lock:
+            if self._archive_index is not None:
+                self._archive_index.close()
+                self._archive_index = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
     def submit_response(self, request_id: str, provider_id: str, data: Any,
                        signature: Optional[str] = None) -> bool:
         """
@@ -265,65 +583,73 @@ class OracleNetwork:
         Returns:
             True if submission was successful, False otherwise.
         """
-        # Check if request exists
-        if request_id not in self.requests:
-            logger.warning(f"Request {request_id} not found")
-            return False
-        
-        # Check if provider exists
-        if provider_id not in self.data_providers:
-            logger.warning(f"Provider {provider_id} not registered")
-            return False
-        
-        # Get request
-        request = self.requests[request_id]
-        
-        # Check if request is still open
-        if request.status != "PENDING":
-            logger.warning(f"Request {request_id} is not pending (status: {request.status})")
-            return False
-        
-        # Check if deadline has passed
-        if request.deadline and time.time() > request.deadline:
-            request.status = "EXPIRED"
-            logger.warning(f"Request {request_id} has expired")
-            return False
-        
-        # Check if provider has already submitted a response
-        if any(response.provider_id == provider_id for response in self.responses[request_id]):
-            logger.warning(f"Provider {provider_id} has already submitted a response")
-            return False
-        
-        # Create a new response
-        response = DataResponse(
-            request_id=request_id,
-            provider_id=provider_id,
-            data=data,
-            timestamp=time.time(),
-            signature=signature
-        )
-        
-        # Store the response
-        self.responses[request_id].append(response)
-        
-        # Update provider's response count
-        self.data_providers[provider_id].response_count += 1
-        self.data_providers[provider_id].last_updated = time.time()
-        
-        logger.info(f"Received response from provider {provider_id} for request {request_id}")
-        
-        # Verify the response
-        self._verify_response(response)
+        with self._lock:
+            # Check if request exists
+            if request_id not in self.requests:
+                logger.warning(f"Request {request_id} not found")
+                return False
+            
+            # Check if provider exists
+            if provider_id not in self.data_providers:
+                logger.warning(f"Provider {provider_id} not registered")
+                return False
+            
+            # Get request
+            request = self.requests[request_id]
+            
+            # Check if request is still open
+            if request.status != "PENDING":
+                logger.warning(f"Request {request_id} is not pending (status: {request.status})")
+                return False
+            
+            # Check if deadline has passed
+            if request.deadline and time.time() > request.deadline:
+                request.status = "EXPIRED"
+                self._expired_count += 1
+                logger.warning(f"Request {request_id} has expired")
+                return False
+            
+            # Check if provider missed the dispatch timeout
+            if provider_id in self._timed_out_providers.get(request_id, ()):
+                logger.warning(f"Provider {provider_id} responded after the timeout for request {request_id}")
+                return False
+            
+            # Check if provider has already submitted a response
+            responders = self._responders[request_id]
+            if provider_id in responders:
+                logger.warning(f"Provider {provider_id} has already submitted a response")
+                return False
+            
+            # Create a new response
+            response = DataResponse(
+                request_id=request_id,
+                provider_id=provider_id,
+                data=data,
+                timestamp=time.time(),
+                signature=signature
+            )
+            
+            # Store the response
+            self.responses[request_id].append(response)
+            responders.add(provider_id)
+            
+            # Update provider's response count
+            self.data_providers[provider_id].response_count += 1
+            self.data_providers[provider_id].last_updated = time.time()
+            
+            logger.info(f"Received response from provider {provider_id} for request {request_id}")
         
-        # Check if we have enough responses to finalize
-        if self.auto_finalize and len(self.responses[request_id]) >= request.min_providers:
-            self.finalize_request(request_id)
+        # Verify the response; in background mode this only queues it
+        if self.verification_mode == "background":
+            self._verifier.submit(response)
+        else:
+            self._on_response_verified(response, self._verify_response(response))
         
         return True
     
     def _verify_response(self, response: DataResponse) -> bool:
         """
-        Verify a response from a data provider.
+        Verify a response's signature against its provider's key.
         
         Args:
             response: The response to verify.
@@ -331,14 +657,48 @@ class OracleNetwork:
         Returns:
             True if verification was successful, False otherwise.
         """
-        # In a real implementation, this would verify the signature
-        # and perform other validation checks
+        return self._verifier.verify([response])[0]
+    
+    def _provider_key(self, provider_id: str) -> Optional[str]:
+        """
+        Get the key used to verify a provider's signatures.
         
-        # For now, just mark it as verified
-        response.status = "VERIFIED"
-        response.verification_result = True
+        The demo signing scheme is symmetric, so this is the provider's
+        signing key.
+        """
+        provider = self.data_providers.get(provider_id)
+        return provider.private_key if provider is not None else None
+    
+    def _on_response_verified(self, response: DataResponse, verified: bool) -> None:
+        """
+        Record a verification result and auto-finalize the request once it
+        has enough verified responses.
         
-        return True
+        Args:
+            response: The verified response.
+            verified: Whether verification was successful.
+        """
+        with self._lock:
+            already_verified = response.verification_result
+            response.status = "VERIFIED" if verified else "REJECTED"
+            response.verification_result = verified
+            
+            if not verified:
+                logger.warning(f"Invalid signature from provider {response.provider_id} for request {response.request_id}")
+                return
+            
+            request = self.requests.get(response.request_id)
+            if request is None:
+                return
+            if not already_verified:
+                self._verified_counts[request.request_id] += 1
+            if request.status != "PENDING":
+                return
+            
+            # Check if we have enough responses to finalize
+            if (self.auto_finalize and request.request_id not in self._deferred_finalize
+                    and self._verified_counts[request.request_id] >= request.min_providers):
+                self.finalize_request(request.request_id)
     
     def finalize_request(self, request_id: str) -> Dict:
         """
@@ -350,10 +710,124 @@ class OracleNetwork:
         Returns:
             Dictionary with result information.
         """
+        with self._lock:
+            request, valid_responses, error = self._finalization_inputs(request_id)
+            if error is not None:
+                return error
+            
+            # Get data from responses
+            try:
+                # The structure of data depends on the data type
+                # For numerical data, we can use statistical aggregation
+                if isinstance(valid_responses[0].data, (int, float)):
+                    method = self.aggregation_methods[self._aggregation_method()]
+                    
+                    if self.mad_threshold is None and method in aggregation.LIST_METHODS:
+                        # These methods reduce lists faster than it takes to build arrays
+                        values = [r.data for r in valid_responses]
+                        weights = [self.reputation_system.get_score(r.provider_id) for r in valid_responses]
+                    else:
+                        values = np.fromiter((r.data for r in valid_responses), dtype=float, count=len(valid_responses))
+                        weights = self._response_weights(valid_responses)
+                        
+                        # Drop outliers before aggregating, if enabled
+                        if self.mad_threshold is not None:
+                            inliers = aggregation.mad_inliers(values, self.mad_threshold)
+                            values, weights = values[inliers], weights[inliers]
+                    
+                    # Aggregate the data using the configured method
+                    result = float(method(values, weights))
+                    
+                    return self._complete_numeric_request(request, valid_responses, result)
+                elif isinstance(valid_responses[0].data, dict):
+                    # For dictionary data, aggregate each key independently
+                    result = self._aggregate_dicts(valid_responses)
+                    
+                    # Update the request
+                    request.result = result
+                    request.status = "FINALIZED"
+                    self._timed_out_providers.pop(request_id, None)
+                    
+                    logger.info(f"Finalized request {request_id} with complex result")
+                    
+                    # Distribute rewards (simple implementation)
+                    self._distribute_rewards(valid_responses, None)
+                    
+                    return {
+                        "success": True,
+                        "request_id": request_id,
+                        "result": result,
+                        "providers": len(valid_responses),
+                        "timestamp": time.time()
+                    }
+                else:
+                    # For other types of data, more complex aggregation would be needed
+                    logger.warning(f"Unsupported data type for request {request_id}")
+                    return {"success": False, "error": "Unsupported data type"}
+            except Exception as e:
+                logger.error(f"Error finalizing request {request_id}: {e}")
+                return {"success": False, "error": str(e)}
+    
+    def finalize_requests_batch(self, request_ids: List[str]) -> List[Dict]:
+        """
+        Finalize many data requests in one pass.
+        
+        Numeric requests aggregated with "mean" or "weighted_mean" are
+        reduced together in a single vectorized pass over all responses;
+        any other request falls back to ``finalize_request``.
+        
+        Args:
+            request_ids: IDs of the requests to finalize.
+            
+        Returns:
+            List of result dictionaries, in the same order as ``request_ids``.
+        """
+        with self._lock:
+            results = {}
+            numeric = []  # (request, valid_responses) pairs aggregated together
+            method = self.aggregation_methods[self._aggregation_method()]
+            vectorized = self.mad_threshold is None and method in (aggregation.mean, aggregation.weighted_mean)
+            
+            for request_id in dict.fromkeys(request_ids):
+                request, valid_responses, error = self._finalization_inputs(request_id)
+                if error is not None:
+                    results[request_id] = error
+                elif vectorized and all(isinstance(r.data, (int, float)) for r in valid_responses):
+                    numeric.append((request, valid_responses))
+                else:
+                    results[request_id] = self.finalize_request(request_id)
+            
+            if numeric:
+                aggregated = self._aggregate_numeric_batch(
+                    [valid_responses for _, valid_responses in numeric],
+                    weighted=method is aggregation.weighted_mean
+                )
+                for (request, valid_responses), result in zip(numeric, aggregated):
+                    try:
+                        results[request.request_id] = self._complete_numeric_request(request, valid_responses, result)
+                    except Exception as e:
+                        logger.error(f"Error finalizing request {request.request_id}: {e}")
+                        results[request.request_id] = {"success": False, "error": str(e)}
+            
+            logger.info(f"Finalized batch of {len(results)} requests ({len(numeric)} vectorized)")
+            
+            return [results[request_id] for request_id in request_ids]
+    
+    def _finalization_inputs(self, request_id: str) -> Tuple[Optional[DataRequest], List[DataResponse], Optional[Dict]]:
+        """
+        Look up a request and its valid responses ahead of finalization.
+        
+        Args:
+            request_id: ID of the request.
+            
+        Returns:
+            Tuple of (request, valid responses, error). ``error`` is a result
+            dictionary when the request cannot be finalized, otherwise None.
+        """
         # Check if request exists
         if request_id not in self.requests:
             logger.warning(f"Request {request_id} not found")
-            return {"success": False, "error": "Request not found"}
+            return None, [], {"success": False, "error": "Request not found"}
         
         # Get request and responses
         request = self.requests[request_id]
@@ -362,112 +836,132 @@ class OracleNetwork:
         # Check if we have enough responses
         if len(responses) < request.min_providers:
             logger.warning(f"Not enough responses for request {request_id}")
-            return {"success": False, "error": "Not enough responses"}
+            return request, [], {"success": False, "error": "Not enough responses"}
         
         # Filter out invalid responses
         valid_responses = [r for r in responses if r.status == "VERIFIED" and r.verification_result]
         
         if len(valid_responses) < request.min_providers:
             logger.warning(f"Not enough valid responses for request {request_id}")
-            return {"success": False, "error": "Not enough valid responses"}
+            return request, valid_responses, {"success": False, "error": "Not enough valid responses"}
         
-        # Get data from responses
-        try:
-            # The structure of data depends on the data type
-            # For numerical data, we can use statistical aggregation
-            if isinstance(valid_responses[0].data, (int, float)):
-                values = [r.data for r in valid_responses]
-                weights = [self.reputation_system.get_score(r.provider_id) for r in valid_responses]
-                
-                # Aggregate the data using the configured method
-                aggregation_method = self.config.get('aggregation_method', self.default_aggregation)
-                if aggregation_method not in self.aggregation_methods:
-                    aggregation_method = self.default_aggregation
-                
-                if aggregation_method == "weighted_mean":
-                    result = self._weighted_mean(values, weights)
-                else:
-                    result = self.aggregation_methods[aggregation_method](values)
-                
-                # Update the request
-                request.result = result
-                request.status = "FINALIZED"
-                
-                # Update provider reputations based on accuracy
-                self._update_reputations(valid_responses, result)
-                
-                logger.info(f"Finalized request {request_id} with result {result}")
-                
-                # Distribute rewards
-                self._distribute_rewards(valid_responses, result)
-                
-                return {
-                    "success": True,
-                    "request_id": request_id,
-                    "result": result,
-                    "providers": len(valid_responses),
-                    "timestamp": time.time()
-                }
-            elif isinstance(valid_responses[0].data, dict):
-                # For dictionary data, merge the dictionaries
-                # This is a simple implementation; a real system would be more sophisticated
-                result = {}
-                for key in valid_responses[0].data.keys():
-                    values = [r.data.get(key) for r in valid_responses if key in r.data]
-                    if values:
-                        if all(isinstance(v, (int, float)) for v in values):
-                            result[key] = sum(values) / len(values)
-                        else:
-                            # For non-numeric values, use the most common value
-                            result[key] = max(set(values), key=values.count)
-                
-                # Update the request
-                request.result = result
-                request.status = "FINALIZED"
-                
-                logger.info(f"Finalized request {request_id} with complex result")
-                
-                # Distribute rewards (simple implementation)
-                self._distribute_rewards(valid_responses, None)
-                
-                return {
-                    "success": True,
-                    "request_id": request_id,
-                    "result": result,
-                    "providers": len(valid_responses),
-                    "timestamp": time.time()
-                }
-            else:
-                # For other types of data, more complex aggregation would be needed
-                logger.warning(f"Unsupported data type for request {request_id}")
-                return {"success": False, "error": "Unsupported data type"}
-        except Exception as e:
-            logger.error(f"Error finalizing request {request_id}: {e}")
-            return {"success": False, "error": str(e)}
+        return request, valid_responses, None
     
-    def _weighted_mean(self, values: List[float], weights: List[float]) -> float:
+    def _aggregation_method(self) -> str:
+        """Get the configured aggregation method, falling back to the default."""
+        aggregation_method = self.config.get('aggregation_method', self.default_aggregation)
+        if aggregation_method not in self.aggregation_methods:
+            aggregation_method = self.default_aggregation
+        return aggregation_method
+    
+    def _aggregate_numeric_batch(self, response_groups: List[List[DataResponse]],
+                                 weighted: bool = True) -> List[float]:
         """
-        Calculate the weighted mean of a list of values.
+        Aggregate several groups of numeric responses in one vectorized pass.
         
         Args:
-            values: List of values.
-            weights: List of weights corresponding to the values.
+            response_groups: One list of valid responses per request.
+            weighted: Whether to weight values by provider reputation.
             
         Returns:
-            The weighted mean.
+            The aggregated value for each group.
+        """
+        counts = np.fromiter((len(group) for group in response_groups), dtype=np.int64, count=len(response_groups))
+        segments = np.repeat(np.arange(len(response_groups)), counts)
+        values = np.fromiter((r.data for group in response_groups for r in group), dtype=float, count=counts.sum())
+        
+        means = np.bincount(segments, weights=values, minlength=len(response_groups)) / counts
+        if not weighted:
+            return means.tolist()
+        
+        weights = self._response_weights([r for group in response_groups for r in group])
+        weighted_sums = np.bincount(segments, weights=values * weights, minlength=len(response_groups))
+        total_weights = np.bincount(segments, weights=weights, minlength=len(response_groups))
+        
+        # Fall back to the plain mean where providers carry no weight, as aggregation.weighted_mean does
+        safe_totals = np.where(total_weights == 0, 1.0, total_weights)
+        return np.where(total_weights == 0, means, weighted_sums / safe_totals).tolist()
+    
+    def _complete_numeric_request(self, request: DataRequest, valid_responses: List[DataResponse],
+                                  result: float) -> Dict:
+        """
+        Record the aggregated result of a numeric request and settle providers.
+        
+        Args:
+            request: The request being finalized.
+            valid_responses: The responses the result was aggregated from.
+            result: The aggregated result.
+            
+        Returns:
+            Dictionary with result information.
+        """
+        # Update the request
+        request.result = result
+        request.status = "FINALIZED"
+        self._timed_out_providers.pop(request.request_id, None)
+        
+        # Update provider reputations based on accuracy
+        self._update_reputations(valid_responses, result)
+        
+        logger.info(f"Finalized request {request.request_id} with result {result}")
+        
+        # Distribute rewards
+        self._distribute_rewards(valid_responses, result)
+        
+        return {
+            "success": True,
+            "request_id": request.request_id,
+            "result": result,
+            "providers": len(valid_responses),
+            "timestamp": time.time()
+        }
+    
+    def _response_weights(self, responses: List[DataResponse]) -> np.ndarray:
+        """Get the reputation weight of each response's provider."""
+        return np.fromiter(
+            (self.reputation_system.get_score(r.provider_id) for r in responses),
+            dtype=float, count=len(responses)
+        )
+    
+    def _aggregate_dicts(self, responses: List[DataResponse]) -> Dict[str, Any]:
         """
-        if not values:
-            return 0.0
+        Aggregate dictionary payloads key by key.
+        
+        Numeric keys are packed into one (responses x keys) matrix and reduced
+        with the configured aggregation method; other keys take their most
+        common value. Keys are taken from the first response.
         
-        if not weights or len(weights) != len(values):
-            return statistics.mean(values)
+        Args:
+            responses: List of responses with dictionary data.
+            
+        Returns:
+            Dictionary with the aggregated value of each key.
+        """
+        keys = list(responses[0].data.keys())
+        numeric_keys = [
+            key for key in keys
+            if all(isinstance(r.data[key], (int, float)) for r in responses if key in r.data)
+        ]
+        
+        matrix = np.array(
+            [[r.data.get(key, np.nan) for key in numeric_keys] for r in responses],
+            dtype=float
+        ).reshape(len(responses), len(numeric_keys))
+        method = self.aggregation_methods[self._aggregation_method()]
+        aggregated = aggregation.aggregate_columns(
+            method, matrix, self._response_weights(responses), self.mad_threshold
+        )
         
-        total_weight = sum(weights)
-        if total_weight == 0:
-            return statistics.mean(values)
+        result = {}
+        numeric = dict(zip(numeric_keys, aggregated.tolist()))
+        for key in keys:
+            if key in numeric:
+                result[key] = numeric[key]
+            else:
+                # For non-numeric values, use the most common value
+                result[key] = aggregation.most_common([r.data[key] for r in responses if key in r.data])
         
-        weighted_sum = sum(v * w for v, w in zip(values, weights))
-        return weighted_sum / total_weight
+        return result
     
     def _update_reputations(self, responses: List[DataResponse], result: float) -> None:
         """
@@ -539,10 +1033,22 @@ class OracleNetwork:
         """
         # Check if request exists
         if request_id not in self.requests:
+            with self._lock:
+                archiving = self._archiving.get(request_id)
+            if archiving is not None:
+                return dict(archiving, archived=True)
+            
+            archived = self._read_archive(request_id)
+            if archived is not None:
+                return archived
+            
             logger.warning(f"Request {request_id} not found")
             return {"success": False, "error": "Request not found"}
         
-        # Get request and responses
+        return self._request_status(request_id)
+    
+    def _request_status(self, request_id: str) -> Dict:
+        """Build the status dictionary of a stored request."""
         request = self.requests[request_id]
         responses = self.responses[request_id]
         
@@ -558,6 +1064,190 @@ class OracleNetwork:
             "result": request.result
         }
     
+    def sweep(self) -> Dict[str, int]:
+        """
+        Expire overdue requests and evict old ones from memory.
+        
+        Pending requests past their deadline, or older than the retention
+        max age, are marked EXPIRED. Finalized and expired requests older
+        than the max age are then evicted, followed by the oldest remaining
+        finalized and expired requests while more than the maximum number
+        of requests are stored. Evicted finalized requests are appended to
+        the archive file when one is configured.
+        
+        Returns:
+            Dictionary with the number of expired, evicted and archived requests.
+        """
+        now = time.time()
+        expired = 0
+        evict = []
+        
+        with self._lock:
+            for request_id, request in self.requests.items():
+                too_old = self.retention_max_age is not None and now - request.timestamp > self.retention_max_age
+                
+                if request.status == "PENDING" and (too_old or (request.deadline and now > request.deadline)):
+                    request.status = "EXPIRED"
+                    expired += 1
+                
+                if too_old and request.status != "PENDING":
+                    evict.append(request_id)
+            
+            # Requests are stored in submission order, so the oldest come first
+            overflow = len(self.requests) - len(evict) - self.retention_max_requests
+            if overflow > 0:
+                evicting = set(evict)
+                for request_id, request in self.requests.items():
+                    if overflow <= 0:
+                        break
+                    if request.status != "PENDING" and request_id not in evicting:
+                        evict.append(request_id)
+                        overflow -= 1
+            
+            to_archive = self._evict_requests(evict)
+            
+            self._expired_count += expired
+            self._evicted_count += len(evict)
+            self._next_sweep_size = max(
+                self.retention_max_requests,
+                len(self.requests) + max(1, self.retention_max_requests // 10)
+            )
+        
+        # Write the archive outside the lock so file and index I/O don't stall requests
+        archived = self._archive_requests(to_archive)
+        
+        if expired or evict:
+            logger.info(f"Swept requests: {expired} expired, {len(evict)} evicted, {archived} archived")
+        
+        return {"expired": expired, "evicted": len(evict), "archived": archived}
+    
+    def _maybe_sweep(self) -> None:
+        """Sweep inline once the request store outgrows its retention limit."""
+        if len(self.requests) > self._next_sweep_size:
+            self.sweep()
+    
+    def _evict_requests(self, request_ids: List[str]) -> List[Dict]:
+        """
+        Remove requests from memory, collecting the finalized ones to archive.
+        
+        Must be called with the lock held. The collected statuses stay
+        readable through ``get_request_status`` until ``_archive_requests``
+        has written them.
+        
+        Args:
+            request_ids: IDs of the requests to evict.
+            
+        Returns:
+            Status dictionaries of the evicted requests to archive.
+        """
+        to_archive = []
+        
+        for request_id in request_ids:
+            if self._archive_index is not None and self.requests[request_id].status == "FINALIZED":
+                status = self._request_status(request_id)
+                self._archiving[request_id] = status
+                to_archive.append(status)
+            
+            del self.requests[request_id]
+            self.responses.pop(request_id, None)
+            self._responders.pop(request_id, None)
+            self._verified_counts.pop(request_id, None)
+            self._timed_out_providers.pop(request_id, None)
+            self._publications.pop(request_id, None)
+        
+        return to_archive
+    
+    def _archive_requests(self, statuses: List[Dict]) -> int:
+        """
+        Append evicted requests to the archive file and index them.
+        
+        Args:
+            statuses: Status dictionaries from ``_evict_requests``.
+            
+        Returns:
+            Number of requests written to the archive.
+        """
+        if not statuses:
+            return 0
+        
+        archived = []
+        try:
+            with self._archive_lock:
+                if self._archive_index is None:
+                    return 0
+                
+                with open(self.archive_file, 'a', encoding='utf-8') as archive:
+                    try:
+                        for status in statuses:
+                            try:
+                                line = json.dumps(status)
+                            except (TypeError, ValueError) as e:
+                                logger.warning(f"Could not archive request {status['request_id']}: {e}")
+                                continue
+                            offset = archive.tell()
+                            archive.write(line + "\n")
+                            archived.append((status["request_id"], offset))
+                    finally:
+                        archive_size = archive.tell()
+                        self._archive_index.add(archived, archive_size)
+        finally:
+            with self._lock:
+                for status in statuses:
+                    self._archiving.pop(status["request_id"], None)
+        
+        return len(archived)
+    
+    def _read_archive(self, request_id: str) -> Optional[Dict]:
+        """
+        Read the status of an archived request.
+        
+        Args:
+            request_id: ID of the request.
+            
+        Returns:
+            The archived status dictionary or None if the request is not archived.
+        """
+        offset = self._archive_index.get(request_id) if self._archive_index is not None else None
+        if offset is None:
+            return None
+        
+        try:
+            with open(self.archive_file, 'rb') as f:
+                f.seek(offset)
+                status = json.loads(f.readline())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read archived request {request_id}: {e}")
+            return None
+        
+        status["archived"] = True
+        return status
+    
+    def start_sweeper(self) -> None:
+        """Start the background thread that periodically calls ``sweep``."""
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        
+        interval = self.sweep_interval or 60
+        self._sweeper_stop.clear()
+        
+        def run():
+            while not self._sweeper_stop.wait(interval):
+                try:
+                    self.sweep()
+                except Exception as e:
+                    logger.error(f"Error sweeping requests: {e}")
+        
+        self._sweeper = threading.Thread(target=run, name="oracle-sweeper", daemon=True)
+        self._sweeper.start()
+        logger.info(f"Started request sweeper (every {interval}s)")
+    
+    def stop_sweeper(self) -> None:
+        """Stop the background sweeper thread, if running."""
+        if self._sweeper is not None:
+            self._sweeper_stop.set()
+            self._sweeper.join()
+            self._sweeper = None
+    
     def connect_blockchain(self, chain_name: str, adapter: ChainAdapter, 
                           contract_address: Optional[str] = None) -> bool:
         """
@@ -597,6 +1287,73 @@ class OracleNetwork:
         Returns:
             Dictionary with transaction information.
         """
+        error = self._check_publishable(request_id, chain_name)
+        if error:
+            return error
+        
+        logger.info(f"Publishing result for request {request_id} to blockchain {chain_name}")
+        
+        result = self._publish_batch(chain_name, [request_id])[request_id]
+        self._record_publications({request_id: result})
+        return result
+    
+    def queue_publication(self, request_id: str, chain_name: str) -> Dict:
+        """
+        Queue a result for batched publication to the blockchain.
+        
+        Queued results are published together, one contract call per chain,
+        once ``publication_batch_size`` results are queued for the chain or
+        the oldest has waited ``publication_max_delay`` seconds. The outcome
+        is available from ``get_publication_status`` afterwards.
+        
+        Args:
+            request_id: ID of the request.
+            chain_name: Name of the blockchain to publish to.
+            
+        Returns:
+            Dictionary with the queueing result, or the publication result if
+            this request completed a batch.
+        """
+        error = self._check_publishable(request_id, chain_name)
+        if error:
+            return error
+        
+        with self._lock:
+            self._publications[request_id] = {"success": None, "status": "QUEUED", "request_id": request_id, "chain": chain_name}
+        
+        flushed = self._publication_queue.enqueue(chain_name, request_id)
+        if flushed is not None:
+            return flushed[request_id]
+        
+        return {"success": True, "status": "QUEUED", "request_id": request_id, "chain": chain_name}
+    
+    def flush_publications(self, chain_name: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Publish all queued results now.
+        
+        Args:
+            chain_name: If set, only flush this chain's queue.
+            
+        Returns:
+            Dictionary mapping request ID to its publication result.
+        """
+        return self._publication_queue.flush(chain_name)
+    
+    def get_publication_status(self, request_id: str) -> Optional[Dict]:
+        """
+        Get the latest publication result of a request.
+        
+        Args:
+            request_id: ID of the request.
+            
+        Returns:
+            The publication result, or None if the request was never published.
+        """
+        with self._lock:
+            return self._publications.get(request_id)
+    
+    def _check_publishable(self, request_id: str, chain_name: str) -> Optional[Dict]:
+        """Check that a request can be published to a chain, returning an error dict if not."""
         # Check if request exists and is finalized
         if request_id not in self.requests:
             logger.warning(f"Request {request_id} not found")
@@ -617,28 +1374,101 @@ class OracleNetwork:
             logger.error(f"No oracle contract address for blockchain {chain_name}")
             return {"success": False, "error": f"No oracle contract address for blockchain {chain_name}"}
         
-        # Get adapter and contract address
-        adapter = self.chain_adapters[chain_name]
-        contract_address = self.on_chain_contracts[chain_name]
+        return None
+    
+    def _publish_batch(self, chain_name: str, request_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Publish finalized results to a chain in a single contract call.
         
-        # Prepare the result for on-chain submission
-        result_data = {
-            "request_id": request_id,
-            "result": request.result,
-            "timestamp": int(time.time())
-        }
+        In "merkle" mode the results, even a single one, are committed as
+        one root with ``commitResultsRoot`` and returned with their
+        inclusion proofs. Otherwise a single result is sent with
+        ``submitResult`` and several with the multi-value setter
+        ``submitResults``.
         
-        # In a real implementation, this would call the oracle contract
-        # For now, just log the action
-        logger.info(f"Publishing result for request {request_id} to blockchain {chain_name}")
+        Args:
+            chain_name: Name of the blockchain to publish to.
+            request_ids: IDs of finalized requests.
+            
+        Returns:
+            Dictionary mapping request ID to its publication result.
+        """
+        timestamp = int(time.time())
+        results = {}
+        entries = []
+        
+        with self._lock:
+            for request_id in request_ids:
+                request = self.requests.get(request_id)
+                if request is None or request.status != "FINALIZED":
+                    results[request_id] = {"success": False, "request_id": request_id, "chain": chain_name,
+                                           "error": "Request not found" if request is None else "Request not finalized"}
+                    continue
+                entries.append({"request_id": request_id, "result": request.result, "timestamp": timestamp})
+        
+        if not entries:
+            return results
+        
+        adapter = self.chain_adapters.get(chain_name)
+        contract_address = self.on_chain_contracts.get(chain_name)
+        if adapter is None or contract_address is None:
+            for entry in entries:
+                results[entry["request_id"]] = {"success": False, "request_id": entry["request_id"], "chain": chain_name,
+                                                "error": f"Not connected to blockchain {chain_name}"}
+            return results
+        
+        encoded = [encode_result(e["request_id"], e["result"], e["timestamp"]) for e in entries]
+        proofs = None
+        if self.publication_mode == "merkle":
+            # A single result is a one-leaf tree: the root is its leaf hash and its proof is empty
+            root, proofs = merkle_tree(encoded)
+            function_name, args = "commitResultsRoot", [root, len(entries), timestamp]
+        elif len(entries) == 1:
+            function_name, args = "submitResult", [entries[0]["request_id"], encoded[0]]
+        else:
+            function_name, args = "submitResults", [[e["request_id"] for e in entries], encoded]
         
-        return {
-            "success": True,
-            "request_id": request_id,
-            "chain": chain_name,
-            "message": "Result published (simulated)",
-            "data": result_data
-        }
+        try:
+            tx = adapter.send_transaction(
+                contract_address=contract_address,
+                abi=[],  # Simulated ABI
+                function_name=function_name,
+                args=args,
+                private_key=self.config.get('private_key')
+            )
+        except Exception as e:
+            tx = {"success": False, "error": str(e)}
+        
+        if tx.get("success", False):
+            logger.info(f"Published {len(entries)} result(s) to blockchain {chain_name} with {function_name}")
+        else:
+            logger.error(f"Failed to publish {len(entries)} result(s) to blockchain {chain_name}: {tx.get('error')}")
+        
+        for i, entry in enumerate(entries):
+            result = {
+                "success": bool(tx.get("success", False)),
+                "request_id": entry["request_id"],
+                "chain": chain_name,
+                "transaction_hash": tx.get("transaction_hash"),
+                "batch_size": len(entries),
+                "data": entry
+            }
+            if not result["success"]:
+                result["error"] = tx.get("error", "Unknown transaction error")
+            if proofs is not None:
+                result["merkle_root"] = root
+                result["merkle_proof"] = proofs[i]
+                result["encoded"] = encoded[i]
+            results[entry["request_id"]] = result
+        
+        return results
+    
+    def _record_publications(self, results: Dict[str, Dict]) -> None:
+        """Store per-request publication results for live requests."""
+        with self._lock:
+            for request_id, result in results.items():
+                if request_id in self.requests:
+                    self._publications[request_id] = result
     
     def get_network_stats(self) -> Dict:
         """
@@ -650,9 +1480,10 @@ class OracleNetwork:
         total_providers = len(self.data_providers)
         active_providers = sum(1 for p in self.data_providers.values() if time.time() - p.last_updated < 86400)
         
-        total_requests = len(self.requests)
-        pending_requests = sum(1 for r in self.requests.values() if r.status == "PENDING")
-        finalized_requests = sum(1 for r in self.requests.values() if r.status == "FINALIZED")
+        with self._lock:
+            total_requests = len(self.requests)
+            pending_requests = sum(1 for r in self.requests.values() if r.status == "PENDING")
+            finalized_requests = sum(1 for r in self.requests.values() if r.status == "FINALIZED")
         
         avg_reputation = 0.0
         if total_providers > 0:
@@ -666,13 +1497,22 @@ class OracleNetwork:
             "requests": {
                 "total": total_requests,
                 "pending": pending_requests,
-                "finalized": finalized_requests
+                "finalized": finalized_requests,
+                "live": total_requests,
+                "expired": self._expired_count,
+                "evicted": self._evicted_count,
+                "archived": self._archive_index.count if self._archive_index is not None else 0
             },
             "reputation": {
                 "average": avg_reputation,
                 "min": min((self.reputation_system.get_score(pid) for pid in self.data_providers.keys()), default=0.0),
                 "max": max((self.reputation_system.get_score(pid) for pid in self.data_providers.keys()), default=0.0)
             },
+            "verification": self._verifier.get_stats(),
+            "publication": {
+                "queued": self._publication_queue.pending_count(),
+                "flushes": self._publication_queue.flush_count
+            },
             "blockchain_connections": list(self.chain_adapters.keys())
         } 
  
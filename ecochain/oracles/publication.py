@@ -0,0 +1,233 @@
+"""
+Batched On-Chain Publication for Oracle Network
+
+This module implements the queue the oracle network uses to publish
+finalized results in batches, one contract call per chain per flush, and
+the Merkle commitment helpers used when a batch is published as a single
+root with off-chain inclusion proofs.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Publishes one batch: fn(chain_name, request_ids) -> {request_id: result dict}
+BatchPublisher = Callable[[str, List[str]], Dict[str, Dict]]
+
+
+def encode_result(request_id: str, result: Any, timestamp: int) -> str:
+    """Encode a published result as canonical JSON."""
+    return json.dumps({"request_id": request_id, "result": result, "timestamp": timestamp}, sort_keys=True)
+
+
+def _hash(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def merkle_tree(leaves: List[str]) -> Tuple[str, List[List[Dict[str, str]]]]:
+    """
+    Build a Merkle tree over encoded results.
+
+    Leaves are the SHA-256 of each encoded result; an odd node at any level
+    is paired with itself.
+
+    Args:
+        leaves: Encoded results, e.g. from ``encode_result``.
+
+    Returns:
+        Tuple of (hex root, proofs), where each proof lists the sibling
+        hashes from leaf to root as ``{"hash": hex, "position": "left"|"right"}``.
+    """
+    if not leaves:
+        return _hash(b"").hex(), []
+
+    level = [_hash(leaf.encode()) for leaf in leaves]
+    proofs: List[List[Dict[str, str]]] = [[] for _ in leaves]
+    positions = list(range(len(leaves)))  # index of each leaf's ancestor in the current level
+
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+
+        for leaf, index in enumerate(positions):
+            sibling = index ^ 1
+            proofs[leaf].append({
+                "hash": level[sibling].hex(),
+                "position": "left" if sibling < index else "right"
+            })
+            positions[leaf] = index // 2
+
+        level = [_hash(level[i] + level[i + 1]) for i in range(0, len(level), 2)]
+
+    return level[0].hex(), proofs
+
+
+def verify_merkle_proof(leaf: str, proof: List[Dict[str, str]], root: str) -> bool:
+    """
+    Check that an encoded result is included under a Merkle root.
+
+    Args:
+        leaf: The encoded result.
+        proof: Its proof from ``merkle_tree``.
+        root: The hex root committed on chain.
+
+    Returns:
+        True if the proof is valid, False otherwise.
+    """
+    node = _hash(leaf.encode())
+    for step in proof:
+        sibling = bytes.fromhex(step["hash"])
+        node = _hash(sibling + node) if step["position"] == "left" else _hash(node + sibling)
+    return node.hex() == root
+
+
+class PublicationQueue:
+    """
+    Accumulates request IDs per chain and publishes them in batches.
+
+    A chain's batch is flushed when it reaches ``batch_size`` entries or
+    when its oldest entry has waited ``max_delay`` seconds. The per-request
+    results of each flush are passed to ``on_published``.
+    """
+
+    def __init__(self, publish_batch: BatchPublisher,
+                 on_published: Optional[Callable[[Dict[str, Dict]], None]] = None,
+                 batch_size: int = 100, max_delay: Optional[float] = 60.0):
+        """
+        Initialize the queue.
+
+        Args:
+            publish_batch: Function that publishes one batch for a chain.
+            on_published: Optional callback receiving each flush's per-request results.
+            batch_size: Number of queued results that triggers a flush.
+            max_delay: Maximum time in seconds a result waits, None to flush only on size.
+        """
+        self.publish_batch = publish_batch
+        self.on_published = on_published
+        self.batch_size = max(1, batch_size)
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[str]] = {}  # chain_name -> queued request IDs
+        self._oldest: Dict[str, float] = {}  # chain_name -> time the oldest entry was queued
+        self._timer = None
+        self._timer_stop = threading.Event()
+
+        self.flush_count = 0
+
+    def enqueue(self, chain_name: str, request_id: str) -> Optional[Dict[str, Dict]]:
+        """
+        Queue a request's result for publication.
+
+        Args:
+            chain_name: Name of the blockchain to publish to.
+            request_id: ID of the finalized request.
+
+        Returns:
+            The per-request results if this entry triggered a flush, otherwise None.
+        """
+        with self._lock:
+            pending = self._pending.setdefault(chain_name, [])
+            if not pending:
+                self._oldest[chain_name] = time.time()
+            pending.append(request_id)
+            full = len(pending) >= self.batch_size
+
+        if self.max_delay is not None and self._timer is None:
+            self._start_timer()
+
+        if full:
+            return self.flush(chain_name)
+        return None
+
+    def pending_count(self, chain_name: Optional[str] = None) -> int:
+        """Get the number of queued results, for one chain or all."""
+        with self._lock:
+            if chain_name is not None:
+                return len(self._pending.get(chain_name, ()))
+            return sum(len(p) for p in self._pending.values())
+
+    def flush(self, chain_name: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Publish queued results now.
+
+        Args:
+            chain_name: If set, only flush this chain's queue.
+
+        Returns:
+            Dictionary mapping request ID to its publication result.
+        """
+        with self._lock:
+            chains = [chain_name] if chain_name is not None else list(self._pending)
+            batches = []
+            for chain in chains:
+                request_ids = self._pending.pop(chain, None)
+                self._oldest.pop(chain, None)
+                if request_ids:
+                    batches.append((chain, request_ids))
+
+        results = {}
+        for chain, request_ids in batches:
+            for start in range(0, len(request_ids), self.batch_size):
+                chunk = request_ids[start:start + self.batch_size]
+                try:
+                    results.update(self.publish_batch(chain, chunk))
+                except Exception as e:
+                    logger.error(f"Error publishing batch of {len(chunk)} results to {chain}: {e}")
+                    results.update({
+                        request_id: {"success": False, "request_id": request_id, "chain": chain, "error": str(e)}
+                        for request_id in chunk
+                    })
+                self.flush_count += 1
+
+        if results and self.on_published is not None:
+            try:
+                self.on_published(results)
+            except Exception as e:
+                logger.error(f"Error handling publication results: {e}")
+
+        return results
+
+    def _flush_due(self) -> None:
+        """Flush every chain whose oldest entry has waited ``max_delay``."""
+        now = time.time()
+        with self._lock:
+            due = [chain for chain, oldest in self._oldest.items() if now - oldest >= self.max_delay]
+        for chain in due:
+            self.flush(chain)
+
+    def _start_timer(self) -> None:
+        """Start the background thread that enforces ``max_delay``."""
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._timer_stop.clear()
+            self._timer = threading.Thread(target=self._run_timer, name="oracle-publisher", daemon=True)
+        self._timer.start()
+
+    def _run_timer(self) -> None:
+        interval = min(self.max_delay, 1.0) if self.max_delay > 0 else 0.1
+        while not self._timer_stop.wait(interval):
+            try:
+                self._flush_due()
+            except Exception as e:
+                logger.error(f"Error flushing publication queue: {e}")
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop the background timer.
+
+        Args:
+            flush: Whether to publish everything still queued.
+        """
+        if self._timer is not None:
+            self._timer_stop.set()
+            self._timer.join()
+            self._timer = None
+        if flush:
+            self.flush()
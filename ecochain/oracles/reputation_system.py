@@ -10,21 +10,348 @@ import logging
 import time
 import math
 import json
-from typing import Dict, List, Any, Optional, Set
-from dataclasses import dataclass, field
+import os
+import sqlite3
+import atexit
+import threading
+import weakref
+import bisect
+from typing import Dict, List, Any, Optional, Set, Iterable, Callable
 import statistics
 
+from ecochain.ring_buffer import RingBuffer
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Reason strings are interned once and stored in history as small integer codes
+_REASONS: List[Optional[str]] = [None]
+_REASON_CODES: Dict[Optional[str], int] = {None: 0}
+
+def _intern_reason(reason: Optional[str]) -> int:
+    """Get the integer code of a history reason, assigning one if needed."""
+    code = _REASON_CODES.get(reason)
+    if code is None:
+        code = len(_REASONS)
+        _REASONS.append(reason)
+        _REASON_CODES[reason] = code
+    return code
+
+class HistoryLog:
+    """
+    Compact log of score changes.
+    
+    Each field is stored in its own ring buffer and reasons are stored as
+    interned codes. Details in the ``{"accuracy", "consistency"}`` form
+    written by ``record_accuracy`` are kept in typed buffers and rebuilt
+    as dictionaries when entries are read; any other details are kept in
+    a small map keyed by the entry's sequence number.
+    """
+    
+    __slots__ = ('timestamps', 'old_scores', 'deltas', 'new_scores', 'reasons', 'detail_kinds',
+                 'accuracies', 'consistencies', 'other_details', 'appended')
+    
+    # Values of ``detail_kinds``
+    NO_DETAILS = 0
+    ACCURACY_DETAILS = 1
+    OTHER_DETAILS = 2
+    
+    def __init__(self, capacity: int, entries: Iterable[Dict] = ()):
+        """
+        Initialize the log.
+        
+        Args:
+            capacity: Maximum number of entries kept.
+            entries: Initial entries in the dictionary form produced by ``entries()``.
+        """
+        self.timestamps = RingBuffer(capacity, 'd')
+        self.old_scores = RingBuffer(capacity, 'd')
+        self.deltas = RingBuffer(capacity, 'd')
+        self.new_scores = RingBuffer(capacity, 'd')
+        self.reasons = RingBuffer(capacity, 'I')
+        self.detail_kinds = RingBuffer(capacity, 'B')
+        self.accuracies = RingBuffer(capacity, 'd')
+        self.consistencies = RingBuffer(capacity, 'd')  # NaN for a missing consistency
+        self.other_details = {}  # sequence number -> details of OTHER_DETAILS entries
+        self.appended = 0  # Number of entries ever appended
+        
+        for entry in entries:
+            self.append(entry.get("timestamp", 0.0), entry.get("old_score", 0.0), entry.get("delta", 0.0),
+                        entry.get("new_score", 0.0), entry.get("reason"), entry.get("details"))
+    
+    def append(self, timestamp: float, old_score: float, delta: float, new_score: float,
+               reason: Optional[str] = None, details: Optional[Dict] = None) -> None:
+        """Record a score change."""
+        capacity = self.timestamps.capacity
+        if self.appended >= capacity:
+            # The oldest entry is overwritten
+            self.other_details.pop(self.appended - capacity, None)
+        
+        self.timestamps.append(timestamp)
+        self.old_scores.append(old_score)
+        self.deltas.append(delta)
+        self.new_scores.append(new_score)
+        self.reasons.append(_intern_reason(reason))
+        
+        accuracy = consistency = math.nan
+        if details is None:
+            kind = self.NO_DETAILS
+        elif _is_accuracy_details(details):
+            kind = self.ACCURACY_DETAILS
+            accuracy = float(details["accuracy"])
+            if details["consistency"] is not None:
+                consistency = float(details["consistency"])
+        else:
+            kind = self.OTHER_DETAILS
+            self.other_details[self.appended] = details
+        self.detail_kinds.append(kind)
+        self.accuracies.append(accuracy)
+        self.consistencies.append(consistency)
+        self.appended += 1
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def _details(self, index: int) -> Optional[Dict]:
+        """Rebuild the details of the entry at a position."""
+        kind = self.detail_kinds[index]
+        if kind == self.ACCURACY_DETAILS:
+            consistency = self.consistencies[index]
+            return {
+                "accuracy": self.accuracies[index],
+                "consistency": None if math.isnan(consistency) else consistency
+            }
+        if kind == self.OTHER_DETAILS:
+            return self.other_details.get(self.appended - len(self) + index)
+        return None
+    
+    def entries(self, last: Optional[int] = None) -> List[Dict]:
+        """
+        Get history entries as dictionaries, oldest first.
+        
+        Args:
+            last: If set, only return this many of the most recent entries.
+            
+        Returns:
+            List of history entry dictionaries.
+        """
+        start = 0 if last is None else max(0, len(self) - last)
+        return [
+            {
+                "timestamp": self.timestamps[i],
+                "old_score": self.old_scores[i],
+                "delta": self.deltas[i],
+                "new_score": self.new_scores[i],
+                "reason": _REASONS[self.reasons[i]],
+                "details": self._details(i)
+            }
+            for i in range(start, len(self))
+        ]
+
+def _is_accuracy_details(details: Dict) -> bool:
+    """Whether details have the form written by ``ReputationSystem.record_accuracy``."""
+    if details.keys() != {"accuracy", "consistency"}:
+        return False
+    accuracy, consistency = details["accuracy"], details["consistency"]
+    return (isinstance(accuracy, (int, float)) and not isinstance(accuracy, bool)
+            and (consistency is None or (isinstance(consistency, (int, float)) and not isinstance(consistency, bool)
+                                         and not math.isnan(consistency))))
+
 class EntityRecord:
     """Record of an entity's reputation and history."""
-    entity_id: str
-    score: float = 50.0  # Default starting score
-    history: List[Dict] = field(default_factory=list)
-    accuracy_history: List[float] = field(default_factory=list)
-    last_updated: float = field(default_factory=lambda: time.time())
-    creation_time: float = field(default_factory=lambda: time.time())
+    
+    # Number of recent accuracy samples used for the consistency score
+    CONSISTENCY_WINDOW = 5
+    
+    __slots__ = ('entity_id', 'score', 'history', 'accuracy_history', 'last_updated', 'creation_time',
+                 '_window_sum', '_window_sum_sq')
+    
+    def __init__(self, entity_id: str, score: float = 50.0, history: Iterable[Dict] = (),
+                 accuracy_history: Iterable[float] = (), last_updated: Optional[float] = None,
+                 creation_time: Optional[float] = None, history_size: int = 100,
+                 accuracy_history_size: int = 100):
+        """
+        Initialize the record.
+        
+        Args:
+            entity_id: ID of the entity.
+            score: Score anchored at ``last_updated``.
+            history: Initial score change entries, oldest first.
+            accuracy_history: Initial accuracy samples, oldest first.
+            last_updated: Time of the last score change.
+            creation_time: Time the entity was created.
+            history_size: Maximum number of score change entries kept.
+            accuracy_history_size: Maximum number of accuracy samples kept.
+        """
+        now = time.time()
+        self.entity_id = entity_id
+        self.score = score
+        self.history = HistoryLog(history_size, history)
+        self.accuracy_history = RingBuffer(max(accuracy_history_size, self.CONSISTENCY_WINDOW), 'd', accuracy_history)
+        self.last_updated = last_updated if last_updated is not None else now
+        self.creation_time = creation_time if creation_time is not None else now
+        
+        window = self.accuracy_history.to_list()[-self.CONSISTENCY_WINDOW:]
+        self._window_sum = math.fsum(window)
+        self._window_sum_sq = math.fsum(a * a for a in window)
+    
+    def add_accuracy(self, accuracy: float) -> Optional[float]:
+        """
+        Record an accuracy sample and update the rolling window sums.
+        
+        Args:
+            accuracy: Accuracy value (0.0 to 1.0).
+            
+        Returns:
+            Standard deviation of the most recent accuracy samples, or None
+            until the window is full.
+        """
+        window = self.CONSISTENCY_WINDOW
+        if len(self.accuracy_history) >= window:
+            leaving = self.accuracy_history[-window]
+            self._window_sum -= leaving
+            self._window_sum_sq -= leaving * leaving
+        
+        self.accuracy_history.append(accuracy)
+        self._window_sum += accuracy
+        self._window_sum_sq += accuracy * accuracy
+        
+        if len(self.accuracy_history) < window:
+            return None
+        
+        variance = (self._window_sum_sq - self._window_sum * self._window_sum / window) / (window - 1)
+        return math.sqrt(max(0.0, variance))
+
+def _record_to_dict(record: EntityRecord) -> Dict[str, Any]:
+    """Convert an entity record to its stored form."""
+    return {
+        'score': record.score,
+        'history': record.history.entries(),
+        'accuracy_history': record.accuracy_history.to_list(),
+        'last_updated': record.last_updated,
+        'creation_time': record.creation_time
+    }
+
+class JSONReputationStore:
+    """
+    Stores reputation data as a single JSON document.
+    
+    Each entity's JSON fragment is cached, so a flush only re-serializes
+    the entities that changed. The file is written to a temporary path and
+    atomically renamed over the previous version.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Initialize the store.
+        
+        Args:
+            path: Path of the JSON file.
+        """
+        self.path = path
+        self._fragments = {}  # entity_id -> serialized record
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load all stored records."""
+        with open(self.path, 'r') as f:
+            data = json.load(f)
+        
+        self._fragments = {entity_id: json.dumps(record) for entity_id, record in data.items()}
+        return data
+    
+    def write(self, changed: Dict[str, Dict[str, Any]], removed: Iterable[str]) -> None:
+        """
+        Persist changed and removed records.
+        
+        Args:
+            changed: entity_id -> stored form of each changed record.
+            removed: IDs of removed entities.
+        """
+        for entity_id in removed:
+            self._fragments.pop(entity_id, None)
+        for entity_id, record in changed.items():
+            self._fragments[entity_id] = json.dumps(record)
+        
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write("{")
+            f.write(", ".join(f"{json.dumps(entity_id)}: {fragment}" for entity_id, fragment in self._fragments.items()))
+            f.write("}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+    
+    def close(self) -> None:
+        """Release resources held by the store."""
+        pass
+
+class SQLiteReputationStore:
+    """
+    Stores reputation data in SQLite, one row per entity.
+    
+    A flush only upserts changed rows and deletes removed ones, inside a
+    single transaction.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Initialize the store.
+        
+        Args:
+            path: Path of the SQLite database file.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            "entity_id TEXT PRIMARY KEY, score REAL, history TEXT, accuracy_history TEXT, "
+            "last_updated REAL, creation_time REAL)"
+        )
+        self._conn.commit()
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load all stored records."""
+        rows = self._conn.execute(
+            "SELECT entity_id, score, history, accuracy_history, last_updated, creation_time FROM entities"
+        )
+        return {
+            entity_id: {
+                'score': score,
+                'history': json.loads(history),
+                'accuracy_history': json.loads(accuracy_history),
+                'last_updated': last_updated,
+                'creation_time': creation_time
+            }
+            for entity_id, score, history, accuracy_history, last_updated, creation_time in rows
+        }
+    
+    def write(self, changed: Dict[str, Dict[str, Any]], removed: Iterable[str]) -> None:
+        """
+        Persist changed and removed records.
+        
+        Args:
+            changed: entity_id -> stored form of each changed record.
+            removed: IDs of removed entities.
+        """
+        with self._conn:
+            self._conn.executemany("DELETE FROM entities WHERE entity_id = ?", [(e,) for e in removed])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (entity_id, r['score'], json.dumps(r['history']), json.dumps(r['accuracy_history']),
+                     r['last_updated'], r['creation_time'])
+                    for entity_id, r in changed.items()
+                ]
+            )
+    
+    def close(self) -> None:
+        """Release resources held by the store."""
+        self._conn.close()
+
+def _flush_on_exit(system_ref: "weakref.ref") -> None:
+    """Flush a reputation system at interpreter shutdown, if it is still alive."""
+    system = system_ref()
+    if system is not None:
+        system.flush()
 
 class ReputationSystem:
     """
@@ -44,6 +371,18 @@ class ReputationSystem:
         self.config = config or {}
         self.entities = {}  # entity_id -> EntityRecord
         self.initialized = False
+        self._lock = threading.RLock()
+        
+        # Write-behind persistence
+        self._store = None
+        self._dirty = set()  # entity IDs changed since the last flush
+        self._removed = set()  # entity IDs removed since the last flush
+        self.flush_interval = self.config.get('flush_interval', 5.0)  # Max seconds between flushes, 0 to disable
+        self.flush_threshold = self.config.get('flush_threshold', 100)  # Dirty entities that trigger a flush
+        self._last_flush = time.time()
+        self._flusher = None
+        self._flusher_stop = threading.Event()
+        self._flush_requested = threading.Event()  # Wakes the flusher before its interval elapses
         
         # Reputation parameters
         self.min_score = self.config.get('min_score', 0.0)
@@ -56,6 +395,21 @@ class ReputationSystem:
         self.participation_weight = self.config.get('participation_weight', 0.5)
         self.time_decay_factor = self.config.get('time_decay_factor', 0.995)  # Score decay per day
         
+        # History retention
+        self.max_history_size = self.config.get('max_history_size', 100)
+        self.max_accuracy_history = self.config.get('max_accuracy_history', 100)
+        
+        # Scores are stored anchored to their last update and decayed when read.
+        # Decay is applied in whole ticks of a global clock, so every entity
+        # decays at the same moments and the rank index (log score projected
+        # back to tick zero) keeps the order of decayed scores at any time.
+        self.decay_interval = self.config.get('decay_interval', 24 * 3600)  # Seconds per decay tick
+        self._log_tick_decay = math.log(self.time_decay_factor) * self.decay_interval / (24 * 3600)
+        self._rank_index = []  # sorted list of (rank_key, entity_id)
+        self._ranked = {}  # entity_id -> (rank_key, anchor tick, anchored score)
+        self._tick_totals = {}  # anchor tick -> [count, sum, sum of squares] of anchored scores
+        self._rank_listeners = []  # callables notified with an entity ID after it moves in the rank index
+        
         # Load existing data if available
         self._load_data()
         self.initialized = True
@@ -67,46 +421,269 @@ class ReputationSystem:
             if not data_file:
                 return
             
-            with open(data_file, 'r') as f:
-                data = json.load(f)
-                
-                for entity_id, record in data.items():
-                    self.entities[entity_id] = EntityRecord(
-                        entity_id=entity_id,
-                        score=record.get('score', self.default_score),
-                        history=record.get('history', []),
-                        accuracy_history=record.get('accuracy_history', []),
-                        last_updated=record.get('last_updated', time.time()),
-                        creation_time=record.get('creation_time', time.time())
-                    )
+            if self.config.get('storage', 'json') == 'sqlite':
+                self._store = SQLiteReputationStore(data_file)
+            else:
+                self._store = JSONReputationStore(data_file)
+            
+            self._start_flusher()
+            atexit.register(_flush_on_exit, weakref.ref(self))
+            
+            data = self._store.load()
+            
+            for entity_id, record in data.items():
+                self.entities[entity_id] = EntityRecord(
+                    entity_id=entity_id,
+                    score=record.get('score', self.default_score),
+                    history=record.get('history', []),
+                    accuracy_history=record.get('accuracy_history', []),
+                    last_updated=record.get('last_updated', time.time()),
+                    creation_time=record.get('creation_time', time.time()),
+                    history_size=self.max_history_size,
+                    accuracy_history_size=self.max_accuracy_history
+                )
+            
+            self._rebuild_index()
             
             logger.info(f"Loaded reputation data for {len(self.entities)} entities")
         except Exception as e:
             logger.warning(f"Could not load reputation data: {e}")
     
-    def _save_data(self) -> None:
-        """Save reputation data to storage."""
-        try:
-            data_file = self.config.get('data_file')
-            if not data_file:
+    def _mark_dirty(self, entity_id: str, removed: bool = False) -> None:
+        """
+        Record that an entity needs to be persisted on the next flush.
+        
+        Once the number of dirty entities reaches the flush threshold or
+        the flush interval has elapsed, the background flusher is woken;
+        the write itself never runs on the caller's thread.
+        
+        Args:
+            entity_id: ID of the changed entity.
+            removed: Whether the entity was removed.
+        """
+        if self._store is None:
+            return
+        
+        with self._lock:
+            if removed:
+                self._dirty.discard(entity_id)
+                self._removed.add(entity_id)
+            else:
+                self._removed.discard(entity_id)
+                self._dirty.add(entity_id)
+            
+            pending = len(self._dirty) + len(self._removed)
+        
+        if pending >= self.flush_threshold or (
+                self.flush_interval and time.time() - self._last_flush >= self.flush_interval):
+            self._flush_requested.set()
+    
+    def flush(self) -> None:
+        """Write all pending changes to storage."""
+        if self._store is None:
+            return
+        
+        with self._lock:
+            if not self._dirty and not self._removed:
+                return
+            
+            changed = {
+                entity_id: _record_to_dict(self.entities[entity_id])
+                for entity_id in self._dirty if entity_id in self.entities
+            }
+            removed = list(self._removed)
+            
+            try:
+                self._store.write(changed, removed)
+            except Exception as e:
+                logger.warning(f"Could not save reputation data: {e}")
                 return
             
-            data = {}
+            self._dirty.clear()
+            self._removed.clear()
+            self._last_flush = time.time()
+        
+        logger.debug(f"Flushed reputation data for {len(changed)} changed and {len(removed)} removed entities")
+    
+    def _start_flusher(self) -> None:
+        """
+        Start the background thread that flushes pending changes.
+        
+        It flushes every ``flush_interval`` seconds (only on request when
+        the interval is 0) and whenever ``_mark_dirty`` requests a flush.
+        """
+        system_ref = weakref.ref(self)
+        stop = self._flusher_stop
+        requested = self._flush_requested
+        interval = self.flush_interval or None
+        
+        def run():
+            while True:
+                requested.wait(interval)
+                requested.clear()
+                if stop.is_set():
+                    return
+                system = system_ref()
+                if system is None:
+                    return
+                system.flush()
+                del system
+        
+        # Let the thread exit once the system is garbage collected
+        weakref.finalize(self, lambda: (stop.set(), requested.set()))
+        
+        self._flusher = threading.Thread(target=run, name="reputation-flusher", daemon=True)
+        self._flusher.start()
+    
+    def close(self) -> None:
+        """Flush pending changes, stop the background flusher and close storage."""
+        self._flusher_stop.set()
+        self._flush_requested.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        
+        self.flush()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+    
+    def _decay_ticks(self, timestamp: float) -> int:
+        """Number of decay ticks elapsed on the global clock at a timestamp."""
+        return math.floor(timestamp / self.decay_interval)
+    
+    def _rank_key(self, record: EntityRecord) -> float:
+        """Log of the record's score projected back to decay tick zero."""
+        if record.score <= 0:
+            return -math.inf
+        return math.log(record.score) - self._decay_ticks(record.last_updated) * self._log_tick_decay
+    
+    def _threshold_key(self, threshold: float) -> float:
+        """Rank key of a positive score threshold at the current time, projected back to tick zero."""
+        return math.log(threshold) - self._decay_ticks(time.time()) * self._log_tick_decay
+    
+    def rank_key(self, entity_id: str) -> Optional[float]:
+        """
+        Get the key that orders an entity in the rank index.
+        
+        Keys are log scores projected back to decay tick zero, so they stay
+        comparable as scores decay; -inf marks a non-positive score.
+        
+        Args:
+            entity_id: ID of the entity.
+            
+        Returns:
+            The rank key, or None if the entity doesn't exist.
+        """
+        with self._lock:
+            ranked = self._ranked.get(entity_id)
+            return ranked[0] if ranked is not None else None
+    
+    def threshold_rank_key(self, threshold: float) -> Optional[float]:
+        """
+        Get the rank key a score must reach to be at or above a threshold now.
+        
+        Args:
+            threshold: Minimum score.
+            
+        Returns:
+            The rank key of the threshold, or None if every score passes it
+            (a threshold at or below the minimum score or zero).
+        """
+        if threshold <= self.min_score or threshold <= 0:
+            return None
+        return self._threshold_key(threshold)
+    
+    def add_rank_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Register a callable notified whenever an entity's rank key changes.
+        
+        Listeners are called with the entity ID after the system's lock is
+        released, once the entity has been added, updated or removed.
+        
+        Args:
+            listener: Callable taking the entity ID.
+        """
+        with self._lock:
+            if listener not in self._rank_listeners:
+                self._rank_listeners.append(listener)
+    
+    def remove_rank_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Unregister a rank listener.
+        
+        Args:
+            listener: Callable previously passed to add_rank_listener.
+        """
+        with self._lock:
+            if listener in self._rank_listeners:
+                self._rank_listeners.remove(listener)
+    
+    def _rebuild_index(self) -> None:
+        """Rebuild the rank index and running aggregates from all entities."""
+        with self._lock:
+            self._ranked = {}
+            self._tick_totals = {}
             for entity_id, record in self.entities.items():
-                data[entity_id] = {
-                    'score': record.score,
-                    'history': record.history,
-                    'accuracy_history': record.accuracy_history,
-                    'last_updated': record.last_updated,
-                    'creation_time': record.creation_time
-                }
+                self._add_aggregates(entity_id, record)
+            self._rank_index = sorted((key, entity_id) for entity_id, (key, _, _) in self._ranked.items())
+    
+    def _add_aggregates(self, entity_id: str, record: EntityRecord) -> float:
+        """Record an entity's anchored score in the running aggregates and return its rank key."""
+        key = self._rank_key(record)
+        tick = self._decay_ticks(record.last_updated)
+        self._ranked[entity_id] = (key, tick, record.score)
+        
+        totals = self._tick_totals.setdefault(tick, [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += record.score
+        totals[2] += record.score * record.score
+        return key
+    
+    def _reindex(self, entity_id: str) -> None:
+        """Move an entity to its current position in the rank index, or drop it if removed."""
+        with self._lock:
+            old = self._ranked.pop(entity_id, None)
+            if old is not None:
+                old_key, old_tick, old_score = old
+                i = bisect.bisect_left(self._rank_index, (old_key, entity_id))
+                if i < len(self._rank_index) and self._rank_index[i] == (old_key, entity_id):
+                    del self._rank_index[i]
+                
+                totals = self._tick_totals[old_tick]
+                totals[0] -= 1
+                if totals[0] == 0:
+                    # Drop the bucket rather than keep accumulated rounding error
+                    del self._tick_totals[old_tick]
+                else:
+                    totals[1] -= old_score
+                    totals[2] -= old_score * old_score
             
-            with open(data_file, 'w') as f:
-                json.dump(data, f)
+            record = self.entities.get(entity_id)
+            if record is not None:
+                key = self._add_aggregates(entity_id, record)
+                bisect.insort(self._rank_index, (key, entity_id))
+            listeners = list(self._rank_listeners)
+        
+        for listener in listeners:
+            listener(entity_id)
+    
+    def _current_score(self, record: EntityRecord, now: Optional[float] = None) -> float:
+        """
+        Apply time decay to a record's anchored score.
+        
+        Args:
+            record: The entity record.
+            now: Time to evaluate the score at, defaults to the current time.
             
-            logger.debug(f"Saved reputation data for {len(self.entities)} entities")
-        except Exception as e:
-            logger.warning(f"Could not save reputation data: {e}")
+        Returns:
+            The decayed score, clamped to the score range.
+        """
+        ticks = self._decay_ticks(now or time.time()) - self._decay_ticks(record.last_updated)
+        score = record.score
+        if ticks > 0:
+            score *= math.exp(ticks * self._log_tick_decay)
+        return max(self.min_score, min(self.max_score, score))
     
     def add_entity(self, entity_id: str, initial_score: Optional[float] = None) -> bool:
         """
@@ -128,13 +705,16 @@ class ReputationSystem:
         
         self.entities[entity_id] = EntityRecord(
             entity_id=entity_id,
-            score=score
+            score=score,
+            history_size=self.max_history_size,
+            accuracy_history_size=self.max_accuracy_history
         )
         
         logger.info(f"Added entity {entity_id} to reputation system with score {score}")
+        self._reindex(entity_id)
         
         if self.initialized:
-            self._save_data()
+            self._mark_dirty(entity_id)
         
         return True
     
@@ -152,7 +732,7 @@ class ReputationSystem:
     
     def get_score(self, entity_id: str) -> float:
         """
-        Get the reputation score of an entity.
+        Get the reputation score of an entity, with time decay applied.
         
         Args:
             entity_id: ID of the entity.
@@ -164,7 +744,7 @@ class ReputationSystem:
             logger.warning(f"Entity {entity_id} not found in reputation system")
             return self.default_score
         
-        return self.entities[entity_id].score
+        return self._current_score(self.entities[entity_id])
     
     def update_score(self, entity_id: str, delta: float, 
                     reason: str = None, details: Dict = None) -> float:
@@ -185,40 +765,24 @@ class ReputationSystem:
             self.add_entity(entity_id)
         
         record = self.entities[entity_id]
-        old_score = record.score
+        now = time.time()
         
-        # Apply time decay since last update
-        days_since_update = (time.time() - record.last_updated) / (24 * 3600)
-        if days_since_update > 0:
-            time_decay = self.time_decay_factor ** days_since_update
-            record.score *= time_decay
+        # Apply time decay since last update, then re-anchor the score to now
+        old_score = self._current_score(record, now)
         
         # Apply score adjustment
-        record.score += delta
-        record.score = max(self.min_score, min(self.max_score, record.score))
+        record.score = max(self.min_score, min(self.max_score, old_score + delta))
         
         # Update record
-        record.last_updated = time.time()
-        
-        # Add to history
-        history_entry = {
-            "timestamp": time.time(),
-            "old_score": old_score,
-            "delta": delta,
-            "new_score": record.score,
-            "reason": reason,
-            "details": details
-        }
-        record.history.append(history_entry)
+        record.last_updated = now
         
-        # Keep history size manageable
-        max_history = self.config.get('max_history_size', 100)
-        if len(record.history) > max_history:
-            record.history = record.history[-max_history:]
+        # Add to history; the log keeps only the most recent max_history_size entries
+        record.history.append(now, old_score, delta, record.score, reason, details)
         
         logger.debug(f"Updated score for {entity_id}: {old_score:.2f} -> {record.score:.2f} ({delta:+.2f})")
+        self._reindex(entity_id)
         
-        self._save_data()
+        self._mark_dirty(entity_id)
         
         return record.score
     
@@ -241,13 +805,8 @@ class ReputationSystem:
         
         record = self.entities[entity_id]
         
-        # Add to accuracy history
-        record.accuracy_history.append(accuracy)
-        
-        # Keep history size manageable
-        max_history = self.config.get('max_accuracy_history', 100)
-        if len(record.accuracy_history) > max_history:
-            record.accuracy_history = record.accuracy_history[-max_history:]
+        # Add to accuracy history, which keeps the most recent max_accuracy_history samples
+        recent_stdev = record.add_accuracy(accuracy)
         
         # Calculate score delta based on accuracy
         # Accuracy 0.5 is neutral, above is good, below is bad
@@ -255,14 +814,14 @@ class ReputationSystem:
         delta = accuracy_factor * self.accuracy_weight * weight
         
         # Apply consistency bonus/penalty if we have enough history
-        if len(record.accuracy_history) >= 5:
-            recent_accuracy = record.accuracy_history[-5:]
-            consistency = 1.0 - statistics.stdev(recent_accuracy) * 2.0  # Higher consistency is better
+        consistency = None
+        if recent_stdev is not None:
+            consistency = 1.0 - recent_stdev * 2.0  # Higher consistency is better
             consistency_factor = (consistency - 0.5) * 2.0  # -1.0 to 1.0
             delta += consistency_factor * self.consistency_weight * weight
         
         # Update score
-        details = {"accuracy": accuracy, "consistency": consistency if 'consistency' in locals() else None}
+        details = {"accuracy": accuracy, "consistency": consistency}
         return self.update_score(entity_id, delta, reason="accuracy", details=details)
     
     def get_entities_above_threshold(self, threshold: float) -> List[str]:
@@ -273,9 +832,27 @@ class ReputationSystem:
             threshold: Score threshold.
             
         Returns:
-            List of entity IDs.
+            List of entity IDs, highest score first.
         """
-        return [entity_id for entity_id, record in self.entities.items() if record.score >= threshold]
+        with self._lock:
+            if threshold <= self.min_score or threshold <= 0:
+                # Every positive score passes (all do at or below the minimum score);
+                # non-positive scores have no log rank key (they sort first, at -inf)
+                # and are compared directly
+                unranked = 0
+                while unranked < len(self._rank_index) and self._rank_index[unranked][0] == -math.inf:
+                    unranked += 1
+                now = time.time()
+                passing = sorted(
+                    ((self._current_score(self.entities[entity_id], now), entity_id)
+                     for _, entity_id in self._rank_index[:unranked]),
+                    reverse=True
+                )
+                return ([entity_id for _, entity_id in reversed(self._rank_index[unranked:])] +
+                        [entity_id for score, entity_id in passing if score >= threshold])
+            
+            start = bisect.bisect_left(self._rank_index, (self._threshold_key(threshold), ""))
+            return [entity_id for _, entity_id in reversed(self._rank_index[start:])]
     
     def get_top_entities(self, count: int) -> List[Dict]:
         """
@@ -287,17 +864,16 @@ class ReputationSystem:
         Returns:
             List of dictionaries with entity information.
         """
-        sorted_entities = sorted(
-            self.entities.items(),
-            key=lambda x: x[1].score,
-            reverse=True
-        )
+        now = time.time()
+        with self._lock:
+            top = [entity_id for _, entity_id in self._rank_index[-count:]] if count > 0 else []
         
         result = []
-        for entity_id, record in sorted_entities[:count]:
+        for entity_id in reversed(top):
+            record = self.entities[entity_id]
             result.append({
                 "entity_id": entity_id,
-                "score": record.score,
+                "score": self._current_score(record, now),
                 "last_updated": record.last_updated,
                 "creation_time": record.creation_time,
                 "history_length": len(record.history),
@@ -323,16 +899,17 @@ class ReputationSystem:
         record = self.entities[entity_id]
         
         # Calculate statistics
-        avg_accuracy = statistics.mean(record.accuracy_history) if record.accuracy_history else None
-        consistency = 1.0 - statistics.stdev(record.accuracy_history) * 2.0 if len(record.accuracy_history) >= 2 else None
+        accuracy_history = record.accuracy_history.to_list()
+        avg_accuracy = statistics.mean(accuracy_history) if accuracy_history else None
+        consistency = 1.0 - statistics.stdev(accuracy_history) * 2.0 if len(accuracy_history) >= 2 else None
         
         return {
             "entity_id": entity_id,
-            "score": record.score,
+            "score": self._current_score(record),
             "last_updated": record.last_updated,
             "creation_time": record.creation_time,
             "age_days": (time.time() - record.creation_time) / (24 * 3600),
-            "history": record.history[-10:],  # Return only the most recent entries
+            "history": record.history.entries(last=10),  # Return only the most recent entries
             "history_length": len(record.history),
             "avg_accuracy": avg_accuracy,
             "consistency": consistency,
@@ -355,8 +932,9 @@ class ReputationSystem:
         
         del self.entities[entity_id]
         logger.info(f"Removed entity {entity_id} from reputation system")
+        self._reindex(entity_id)
         
-        self._save_data()
+        self._mark_dirty(entity_id, removed=True)
         
         return True
     
@@ -364,24 +942,10 @@ class ReputationSystem:
         """
         Apply time decay to all scores.
         
-        This method applies the time decay factor to all scores to
-        gradually reduce reputation scores of inactive entities.
+        Scores are decayed lazily whenever they are read, so there is nothing
+        left to sweep. This method is kept for backward compatibility.
         """
-        current_time = time.time()
-        
-        for entity_id, record in self.entities.items():
-            days_since_update = (current_time - record.last_updated) / (24 * 3600)
-            if days_since_update > 0:
-                old_score = record.score
-                time_decay = self.time_decay_factor ** days_since_update
-                record.score *= time_decay
-                record.score = max(self.min_score, min(self.max_score, record.score))
-                record.last_updated = current_time
-                
-                if abs(old_score - record.score) > 0.1:
-                    logger.debug(f"Decayed score for {entity_id}: {old_score:.2f} -> {record.score:.2f}")
-        
-        self._save_data()
+        logger.debug("Reputation scores decay on read; no sweep needed")
     
     def get_stats(self) -> Dict:
         """
@@ -398,15 +962,37 @@ class ReputationSystem:
                 "max_score": None
             }
         
-        scores = [record.score for record in self.entities.values()]
+        now = time.time()
+        
+        with self._lock:
+            count = len(self._rank_index)
+            ranked_scores = [
+                self._current_score(self.entities[self._rank_index[i][1]], now)
+                for i in (0, (count - 1) // 2, count // 2, count - 1)
+            ]
+            
+            if self.min_score > 0:
+                # Decay can be clamped at a positive floor, which the per-tick sums cannot express
+                scores = [self._current_score(record, now) for record in self.entities.values()]
+                total = math.fsum(scores)
+                total_sq = math.fsum(score * score for score in scores)
+            else:
+                # Every entity anchored in the same tick decays by the same factor
+                current_tick = self._decay_ticks(now)
+                total = total_sq = 0.0
+                for tick, (_, tick_sum, tick_sum_sq) in self._tick_totals.items():
+                    factor = math.exp(max(0, current_tick - tick) * self._log_tick_decay)
+                    total += tick_sum * factor
+                    total_sq += tick_sum_sq * factor * factor
+        
+        mean = total / count
+        variance = max(0.0, (total_sq - total * mean) / (count - 1)) if count > 1 else 0.0
         
         return {
-            "entity_count": len(self.entities),
-            "avg_score": statistics.mean(scores),
-            "min_score": min(scores),
-            "max_score": max(scores),
-            "median_score": statistics.median(scores),
-            "score_stdev": statistics.stdev(scores) if len(scores) > 1 else 0.0
-        } 
- 
- 
\ No newline at end of file
+            "entity_count": count,
+            "avg_score": mean,
+            "min_score": ranked_scores[0],
+            "max_score": ranked_scores[3],
+            "median_score": (ranked_scores[1] + ranked_scores[2]) / 2.0,
+            "score_stdev": math.sqrt(variance)
+        }
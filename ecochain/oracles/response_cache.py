@@ -0,0 +1,239 @@
+"""
+Response Cache for Data Providers
+
+This module implements the TTL/LRU cache data providers use to avoid
+refetching the same upstream data for identical requests. Concurrent
+requests for the same key are coalesced so that only one of them
+reaches the upstream source.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+class _InFlight:
+    """A fetch in progress that other callers can wait on."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class ResponseCache:
+    """
+    Thread-safe cache of fetched data keyed by data type and parameters.
+
+    Entries expire after a per-data-type TTL and the least recently used
+    entry is evicted once the cache is full. Failed fetches are not cached.
+    Cached values are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, default_ttl: float = 60.0, ttls: Optional[Dict[str, float]] = None,
+                 max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            default_ttl: Time to live in seconds for data types without their own TTL.
+            ttls: Optional mapping of data type to TTL in seconds; 0 disables caching for that type.
+            max_entries: Maximum number of cached entries.
+        """
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()  # key -> (expires_at, value)
+        self._in_flight: Dict[CacheKey, _InFlight] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(data_type: str, parameters: Dict[str, Any]) -> CacheKey:
+        """
+        Build the cache key for a request.
+
+        Parameters are normalized by serializing them with sorted keys, so
+        dictionaries that differ only in key order share an entry.
+
+        Args:
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+
+        Returns:
+            The cache key.
+        """
+        return data_type, json.dumps(parameters or {}, sort_keys=True, default=str)
+
+    def ttl_for(self, data_type: str) -> float:
+        """Get the TTL in seconds for a data type."""
+        return self.ttls.get(data_type, self.default_ttl)
+
+    def get_or_fetch(self, data_type: str, parameters: Dict[str, Any],
+                     fetch: Callable[[str, Dict[str, Any]], Any]) -> Any:
+        """
+        Get cached data for a request, fetching it if needed.
+
+        If another thread is already fetching the same key, wait for its
+        result instead of starting a second fetch.
+
+        Args:
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+            fetch: Function called as ``fetch(data_type, parameters)`` on a miss.
+
+        Returns:
+            The cached or freshly fetched data.
+
+        Raises:
+            Exception: Whatever ``fetch`` raised, for the caller that ran it
+                and for every caller coalesced onto it.
+        """
+        ttl = self.ttl_for(data_type)
+        if ttl <= 0:
+            return fetch(data_type, parameters)
+
+        key = self.make_key(data_type, parameters)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                self.coalesced += 1
+                owner = False
+            else:
+                in_flight = self._in_flight[key] = _InFlight()
+                self.misses += 1
+                owner = True
+
+        if not owner:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.result
+
+        try:
+            in_flight.result = fetch(data_type, parameters)
+        except Exception as e:
+            in_flight.error = e
+            raise
+        else:
+            self._store(key, in_flight.result, ttl)
+            return in_flight.result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            in_flight.done.set()
+
+    def lookup(self, data_type: str, parameters: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Get cached data for a request without fetching it.
+
+        For callers that fetch on their own, such as asyncio providers, and
+        store the result with ``store``.
+
+        Args:
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+
+        Returns:
+            Tuple of (found, value); value is None when nothing is cached.
+        """
+        if self.ttl_for(data_type) <= 0:
+            return False, None
+
+        key = self.make_key(data_type, parameters)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[1]
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def store(self, data_type: str, parameters: Dict[str, Any], value: Any) -> None:
+        """
+        Cache fetched data for a request, unless caching is disabled for its type.
+
+        Args:
+            data_type: Type of data being requested.
+            parameters: Parameters for the data request.
+            value: The fetched data.
+        """
+        ttl = self.ttl_for(data_type)
+        if ttl > 0:
+            self._store(self.make_key(data_type, parameters), value, ttl)
+
+    def _store(self, key: CacheKey, value: Any, ttl: float) -> None:
+        """Insert an entry, evicting the least recently used ones if full."""
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, data_type: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            data_type: If set, only drop entries of this data type.
+
+        Returns:
+            Number of entries dropped.
+        """
+        with self._lock:
+            if data_type is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+
+            keys = [k for k in self._entries if k[0] == data_type]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the cache.
+
+        Returns:
+            Dictionary with cache statistics.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0
+            }
@@ -0,0 +1,268 @@
+"""
+Response Signature Verification for Oracle Network
+
+This module implements signing and batched verification of provider
+responses. Responses are queued by ``OracleNetwork.submit_response`` and
+verified off the submission thread in batches, optionally spread over a
+process pool, with provider keys cached between batches.
+
+Signatures use the demo scheme ``sha256(message + key)`` over the message
+``"<request_id>:<canonical JSON of data>"``, so the verification key is
+the provider's signing key.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (request_id, data, signature, key) as shipped to verification workers
+VerificationItem = Tuple[str, Any, Optional[str], Optional[str]]
+
+_MISSING = object()
+
+
+def response_message(request_id: str, data: Any) -> str:
+    """Build the canonical message signed for a response."""
+    return f"{request_id}:{json.dumps(data, sort_keys=True)}"
+
+
+def sign_response(request_id: str, data: Any, key: str) -> str:
+    """
+    Sign a response.
+
+    Args:
+        request_id: ID of the request.
+        data: The response data.
+        key: The provider's signing key.
+
+    Returns:
+        The signature as a hexadecimal string.
+    """
+    return hashlib.sha256((response_message(request_id, data) + key).encode()).hexdigest()
+
+
+def verify_batch(items: List[VerificationItem], require_signatures: bool = False) -> List[bool]:
+    """
+    Verify a batch of response signatures.
+
+    Unsigned responses, and responses from providers without a key, pass
+    only when ``require_signatures`` is False. This is a module-level
+    function so that it can run in a process pool.
+
+    Args:
+        items: List of (request_id, data, signature, key) tuples.
+        require_signatures: Whether unsigned responses fail verification.
+
+    Returns:
+        List of verification results aligned with ``items``.
+    """
+    results = []
+    for request_id, data, signature, key in items:
+        if signature is None or key is None:
+            results.append(not require_signatures and signature is None)
+            continue
+        try:
+            expected = sign_response(request_id, data, key)
+        except (TypeError, ValueError):
+            results.append(False)
+            continue
+        results.append(hmac.compare_digest(expected, signature))
+    return results
+
+
+class SignatureVerifier:
+    """
+    Background stage that verifies queued responses in batches.
+
+    A single dispatcher thread drains the queue into batches of up to
+    ``batch_size`` responses, waiting at most ``max_wait`` seconds to fill
+    one. Each batch is verified in the dispatcher thread, or split across
+    ``workers`` processes when a process pool is configured, and every
+    result is passed to ``on_verified(response, result)``.
+    """
+
+    def __init__(self, key_resolver: Callable[[str], Optional[str]],
+                 on_verified: Callable[[Any, bool], None],
+                 batch_size: int = 256, max_wait: float = 0.01, workers: int = 0,
+                 require_signatures: bool = False):
+        """
+        Initialize the verifier.
+
+        Args:
+            key_resolver: Function returning a provider's verification key, or None.
+            on_verified: Callback invoked with each response and its result.
+            batch_size: Maximum number of responses verified together.
+            max_wait: Maximum time in seconds to wait for a batch to fill.
+            workers: Number of verification processes; 0 verifies in the dispatcher thread.
+            require_signatures: Whether unsigned responses fail verification.
+        """
+        self.key_resolver = key_resolver
+        self.on_verified = on_verified
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max_wait
+        self.workers = workers
+        self.require_signatures = require_signatures
+
+        self._queue = queue.Queue()
+        self._keys: Dict[str, Optional[str]] = {}  # provider_id -> key, None if the provider has none
+        self._keys_lock = threading.Lock()
+        self._pool = None
+        self._thread = None
+        self._stop = threading.Event()
+
+        self.verified_count = 0
+        self.rejected_count = 0
+        self.batch_count = 0
+
+    def get_key(self, provider_id: str) -> Optional[str]:
+        """Get a provider's verification key through the key cache."""
+        with self._keys_lock:
+            key = self._keys.get(provider_id, _MISSING)
+        if key is _MISSING:
+            key = self.key_resolver(provider_id)
+            with self._keys_lock:
+                self._keys[provider_id] = key
+        return key
+
+    def invalidate_key(self, provider_id: Optional[str] = None) -> None:
+        """
+        Drop cached provider keys.
+
+        Args:
+            provider_id: If set, only drop this provider's key.
+        """
+        with self._keys_lock:
+            if provider_id is None:
+                self._keys.clear()
+            else:
+                self._keys.pop(provider_id, None)
+
+    def submit(self, response: Any) -> None:
+        """
+        Queue a response for verification.
+
+        Args:
+            response: A ``DataResponse``.
+        """
+        if self._thread is None:
+            self.start()
+        self._queue.put(response)
+
+    def verify(self, responses: List[Any]) -> List[bool]:
+        """
+        Verify responses synchronously, without invoking ``on_verified``.
+
+        Args:
+            responses: List of ``DataResponse`` objects.
+
+        Returns:
+            List of verification results aligned with ``responses``.
+        """
+        items = [
+            (r.request_id, r.data, r.signature, self.get_key(r.provider_id))
+            for r in responses
+        ]
+
+        if self._pool is None or len(items) < 2 * self.workers:
+            results = verify_batch(items, self.require_signatures)
+        else:
+            chunk = -(-len(items) // self.workers)
+            chunks = [items[i:i + chunk] for i in range(0, len(items), chunk)]
+            results = []
+            for part in self._pool.map(verify_batch, chunks, [self.require_signatures] * len(chunks)):
+                results.extend(part)
+
+        passed = sum(results)
+        self.verified_count += passed
+        self.rejected_count += len(results) - passed
+        return results
+
+    def start(self) -> None:
+        """Start the dispatcher thread and, if configured, the process pool."""
+        if self._thread is not None:
+            return
+
+        if self.workers > 0:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="oracle-verifier", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop the dispatcher thread after draining queued responses.
+
+        Args:
+            wait: Whether to wait for the thread and process pool to finish.
+        """
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        if wait:
+            self._thread.join()
+        self._thread = None
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def _next_batch(self) -> List[Any]:
+        """Collect up to ``batch_size`` queued responses."""
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Verify batches until stopped and the queue is drained."""
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+
+            try:
+                results = self.verify(batch)
+            except Exception as e:
+                logger.error(f"Error verifying batch of {len(batch)} responses: {e}")
+                results = [False] * len(batch)
+
+            self.batch_count += 1
+            for response, result in zip(batch, results):
+                try:
+                    self.on_verified(response, result)
+                except Exception as e:
+                    logger.error(f"Error handling verification of response to {response.request_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the verifier.
+
+        Returns:
+            Dictionary with verifier statistics.
+        """
+        return {
+            "queued": self._queue.qsize(),
+            "verified": self.verified_count,
+            "rejected": self.rejected_count,
+            "batches": self.batch_count,
+            "cached_keys": len(self._keys)
+        }
@@ -0,0 +1,67 @@
+"""
+Ring Buffer
+
+This module implements the fixed-capacity buffer shared by the oracle
+reputation history and the streaming market analytics.
+"""
+
+from array import array
+from typing import Any, Iterable, List, Optional
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer that overwrites its oldest item when full.
+
+    Items are kept in a typed ``array`` when a typecode is given, or in a
+    plain list for arbitrary objects. Storage grows up to the capacity and
+    is then reused in place, so appends never copy the buffer.
+    """
+
+    __slots__ = ('_data', '_capacity', '_start')
+
+    def __init__(self, capacity: int, typecode: Optional[str] = None, values: Iterable = ()):
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of items kept.
+            typecode: ``array`` typecode, or None to store Python objects.
+            values: Initial items, oldest first; only the newest ``capacity`` are kept.
+        """
+        self._capacity = max(1, capacity)
+        self._data = array(typecode) if typecode else []
+        self._start = 0
+
+        values = list(values)
+        self._data.extend(values[-self._capacity:])
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of items kept."""
+        return self._capacity
+
+    def append(self, value: Any) -> None:
+        """Append an item, overwriting the oldest one when full."""
+        if len(self._data) < self._capacity:
+            self._data.append(value)
+        else:
+            self._data[self._start] = value
+            self._start = (self._start + 1) % self._capacity
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int) -> Any:
+        """Get an item by position, oldest first; negative indexes count from the newest."""
+        size = len(self._data)
+        if not -size <= index < size:
+            raise IndexError("ring buffer index out of range")
+        return self._data[(self._start + index) % size]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def to_list(self) -> List[Any]:
+        """Get all items as a list, oldest first."""
+        return list(self._data[self._start:]) + list(self._data[:self._start])
@@ -0,0 +1,88 @@
+"""
+Shared fixtures for the EcoChain Guardian test suite.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from ecochain.analysis_module.sustainability_scorer import SustainabilityScorer
+from ecochain.oracles.data_provider import DataProvider
+from ecochain.oracles.oracle_network import OracleNetwork
+
+
+class ConstantProvider(DataProvider):
+    """Provider that answers every request with the same value"""
+
+    def __init__(self, name, value=100.0, delay=0.0):
+        super().__init__(name, ["carbon_intensity"], {})
+        self.value = value
+        self.delay = delay
+
+    def fetch_data(self, data_type, parameters):
+        if self.delay:
+            time.sleep(self.delay)
+        return self.value
+
+
+class RecordingAdapter:
+    """Chain adapter that records contract calls instead of sending them"""
+
+    def __init__(self):
+        self.calls = []
+
+    def connect(self):
+        return True
+
+    def send_transaction(self, contract_address, abi, function_name, args=None, private_key=None):
+        self.calls.append((function_name, args))
+        return {"success": True, "transaction_hash": f"0x{len(self.calls):064x}"}
+
+
+@pytest.fixture
+def make_network():
+    """Build oracle networks with registered constant providers, shut down after the test"""
+    networks = []
+
+    def make(config=None, values=(100.0, 100.0, 100.0), delays=None):
+        network = OracleNetwork(config or {})
+        for i, value in enumerate(values):
+            provider = ConstantProvider(f"provider-{i}", value, delays[i] if delays else 0.0)
+            provider.set_submit_callback(network.submit_response)
+            network.register_provider(provider)
+        networks.append(network)
+        return network
+
+    yield make
+    for network in networks:
+        network.shutdown()
+
+
+@pytest.fixture
+def adapter():
+    return RecordingAdapter()
+
+
+@pytest.fixture
+def random_operations():
+    """Build operations and aligned carbon data rows with random metrics"""
+    locations = list(SustainabilityScorer().location_factors) + ["Unknown"]
+
+    def make(n, seed=0):
+        rng = np.random.default_rng(seed)
+        operations = [{"id": f"op-{i}", "location": locations[i % len(locations)]} for i in range(n)]
+        carbon_rows = [
+            {
+                "operation_id": f"op-{i}",
+                "renewable_energy_percentage": float(rng.uniform(0, 100)),
+                "energy_efficiency_rating": float(rng.uniform(0, 1)),
+                "carbon_footprint_tons_per_day": float(rng.uniform(0, 200)),
+                "carbon_offset_percentage": float(rng.uniform(0, 100)),
+                "sustainability_initiatives": int(rng.integers(0, 8))
+            }
+            for i in range(n)
+        ]
+        return operations, carbon_rows
+
+    return make
@@ -0,0 +1,71 @@
+"""
+Tests for the oracle aggregation engine.
+"""
+
+import statistics
+
+import numpy as np
+import pytest
+
+from ecochain.oracles import aggregation
+
+
+@pytest.mark.parametrize("legacy", [statistics.median, np.median, max, lambda values: sum(values) / len(values)])
+def test_legacy_one_argument_methods_are_called_with_values_only(legacy):
+    table = aggregation.MethodTable(legacy=legacy)
+    values = np.array([3.0, 1.0, 2.0])
+
+    assert table["legacy"](values, np.array([1.0, 1.0, 5.0])) == legacy([3.0, 1.0, 2.0])
+
+
+def test_methods_taking_weights_are_registered_unchanged():
+    def weighted_max(values, weights):
+        return max(values * weights)
+
+    table = aggregation.MethodTable(aggregation.DEFAULT_METHODS)
+    table["weighted_max"] = weighted_max
+    table.setdefault("by_keyword", lambda values, weights=None: 0.0)
+
+    assert table["weighted_max"] is weighted_max
+    assert table["weighted_mean"] is aggregation.weighted_mean
+    assert table["by_keyword"]([1.0], None) == 0.0
+
+
+def test_network_finalizes_with_a_legacy_method(make_network):
+    network = make_network({"aggregation_method": "legacy_median"}, values=(100.0, 130.0, 110.0))
+    network.aggregation_methods["legacy_median"] = statistics.median
+
+    request_id = network.submit_request("carbon_intensity", {}, "tester", min_providers=3)
+
+    assert network.get_request_status(request_id)["result"] == 110.0
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 30, aggregation.SMALL_INPUT_SIZE + 1, 300])
+@pytest.mark.parametrize("method, reference", [
+    (aggregation.mean, lambda values, weights: np.mean(values)),
+    (aggregation.weighted_mean, lambda values, weights: np.average(values, weights=weights)),
+    (aggregation.median, lambda values, weights: np.median(values)),
+])
+def test_list_and_array_inputs_match_numpy(method, reference, size):
+    rng = np.random.default_rng(size)
+    values = rng.uniform(200.0, 600.0, size)
+    weights = rng.uniform(40.0, 100.0, size)
+    expected = reference(values, weights)
+
+    assert method(values, weights) == pytest.approx(expected)
+    assert method(values.tolist(), weights.tolist()) == pytest.approx(expected)
+    assert type(method(values.tolist(), weights.tolist())) is float
+
+
+@pytest.mark.parametrize("method", aggregation.LIST_METHODS)
+def test_empty_inputs_aggregate_to_zero(method):
+    assert method([], []) == 0.0
+    assert method(np.array([]), np.array([])) == 0.0
+
+
+@pytest.mark.parametrize("weights", [None, [0.0, 0.0, 0.0], [1.0, 2.0]])
+def test_weighted_mean_falls_back_to_the_mean_without_usable_weights(weights):
+    values = [100.0, 200.0, 600.0]
+
+    assert aggregation.weighted_mean(values, weights) == 300.0
+    assert aggregation.weighted_mean(np.array(values), None if weights is None else np.array(weights)) == 300.0
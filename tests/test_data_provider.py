@@ -0,0 +1,175 @@
+"""
+Tests for queued and asyncio request processing in data providers.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ecochain.oracles.data_provider import AsyncDataProvider, DataProvider
+
+
+class BlockingProvider(DataProvider):
+    """Provider whose fetches wait until released"""
+
+    def __init__(self, config):
+        super().__init__("blocking", ["carbon_intensity"], {"cache_ttl": 0, **config})
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.submitted = []
+        self.set_submit_callback(lambda request_id, provider_id, data, signature: self.submitted.append(request_id) or True)
+
+    def fetch_data(self, data_type, parameters):
+        self.started.set()
+        self.release.wait(5.0)
+        if parameters.get("fail"):
+            raise ValueError("upstream error")
+        return 100.0
+
+
+class SlowAsyncProvider(AsyncDataProvider):
+    """Asyncio provider whose fetches wait until released"""
+
+    def __init__(self, config=None):
+        super().__init__("slow-async", ["carbon_intensity"], {"cache_ttl": 0, **(config or {})})
+        self.release = None
+        self.fetches = 0
+        self.submitted = []
+        self.set_submit_callback(lambda request_id, provider_id, data, signature: self.submitted.append(request_id) or True)
+
+    async def fetch_data_async(self, data_type, parameters):
+        self.fetches += 1
+        if self.release is not None:
+            await self.release.wait()
+        if parameters.get("fail"):
+            raise ValueError("upstream error")
+        return parameters.get("value", 100.0)
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.mark.parametrize("policy", ["reject", "defer"])
+def test_queued_provider_rejects_requests_when_the_queue_stays_full(policy):
+    provider = BlockingProvider({"processing_mode": "queued", "worker_count": 1, "queue_size": 1,
+                                 "queue_full_policy": policy, "queue_timeout": 0.05})
+    try:
+        assert provider.notify_request("req-0", "carbon_intensity", {})
+        assert provider.started.wait(5.0)  # the worker holds req-0, so req-1 fills the queue
+        assert provider.notify_request("req-1", "carbon_intensity", {})
+
+        start = time.monotonic()
+        assert not provider.notify_request("req-2", "carbon_intensity", {})
+        waited = time.monotonic() - start
+
+        assert waited >= 0.05 if policy == "defer" else waited < 0.05
+        assert "req-2" not in provider.pending_requests
+        assert provider.rejected_count == 1
+    finally:
+        provider.release.set()
+        provider.shutdown()
+    assert provider.submitted == ["req-0", "req-1"]
+
+
+def test_deferred_request_is_queued_once_room_frees_up():
+    provider = BlockingProvider({"processing_mode": "queued", "worker_count": 1, "queue_size": 1,
+                                 "queue_full_policy": "defer", "queue_timeout": 5.0})
+    try:
+        provider.notify_request("req-0", "carbon_intensity", {})
+        assert provider.started.wait(5.0)
+        provider.notify_request("req-1", "carbon_intensity", {})
+        threading.Timer(0.1, provider.release.set).start()
+
+        assert provider.notify_request("req-2", "carbon_intensity", {})
+    finally:
+        provider.release.set()
+        provider.shutdown()
+    assert provider.submitted == ["req-0", "req-1", "req-2"]
+
+
+def test_queued_provider_prunes_processed_and_failed_requests():
+    provider = BlockingProvider({"processing_mode": "queued", "worker_count": 2})
+    provider.release.set()
+    for i in range(10):
+        provider.notify_request(f"req-{i}", "carbon_intensity", {"fail": i % 5 == 0})
+    provider.shutdown()
+
+    stats = provider.get_stats()
+    assert provider.pending_requests == {}
+    assert (stats["processed_requests"], stats["failed_requests"]) == (8, 2)
+    assert sorted(provider.submitted) == sorted(f"req-{i}" for i in range(10) if i % 5)
+
+
+def test_async_provider_applies_backpressure_and_prunes_requests():
+    async def run():
+        provider = SlowAsyncProvider({"worker_count": 1, "queue_size": 1, "queue_timeout": 0.05})
+        provider.release = asyncio.Event()
+        await provider.start()
+
+        assert await provider.submit("req-0", "carbon_intensity", {})
+        await asyncio.sleep(0.01)  # the worker picks up req-0
+        assert await provider.submit("req-1", "carbon_intensity", {"fail": True})
+        assert not await provider.submit("req-2", "carbon_intensity", {})
+        assert "req-2" not in provider.pending_requests
+
+        provider.queue_full_policy = "defer"
+        asyncio.get_running_loop().call_later(0.1, provider.release.set)
+        provider.queue_timeout = 5.0
+        assert await provider.submit("req-3", "carbon_intensity", {})
+
+        await provider.stop()
+        return provider
+
+    provider = asyncio.run(run())
+
+    stats = provider.get_stats()
+    assert provider.submitted == ["req-0", "req-3"]
+    assert provider.pending_requests == {}
+    assert (stats["processed_requests"], stats["failed_requests"], stats["rejected_requests"]) == (2, 1, 1)
+
+
+def test_async_provider_coalesces_identical_fetches():
+    async def run():
+        provider = SlowAsyncProvider({"cache_ttl": 60.0, "worker_count": 4})
+        provider.release = asyncio.Event()
+        await provider.start()
+        for i in range(4):
+            await provider.submit(f"req-{i}", "carbon_intensity", {"value": 42.0})
+        await asyncio.sleep(0.01)
+        provider.release.set()
+        await provider.stop()
+
+        assert await provider.get_data_async("carbon_intensity", {"value": 42.0}) == 42.0
+        return provider
+
+    provider = asyncio.run(run())
+
+    assert provider.fetches == 1
+    assert sorted(provider.submitted) == [f"req-{i}" for i in range(4)]
+
+
+def test_async_provider_serves_the_oracle_network_from_its_own_loop():
+    from ecochain.oracles.oracle_network import OracleNetwork
+
+    network = OracleNetwork({})
+    providers = [SlowAsyncProvider() for _ in range(3)]
+    for provider in providers:
+        provider.set_submit_callback(network.submit_response)
+        network.register_provider(provider)
+    try:
+        request_id = network.submit_request("carbon_intensity", {"value": 120.0}, "tester", min_providers=3)
+
+        assert wait_until(lambda: network.get_request_status(request_id)["status"] == "FINALIZED")
+        assert network.get_request_status(request_id)["result"] == 120.0
+        assert all(provider.pending_requests == {} for provider in providers)
+        loop_threads = [provider._loop_thread for provider in providers]
+    finally:
+        network.shutdown()
+    assert wait_until(lambda: not any(thread.is_alive() for thread in loop_threads))
@@ -0,0 +1,37 @@
+"""
+Tests for Holt-Winters forecasting and its fit cache.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ecochain.analysis_module.holt_winters import HoltWintersCache
+from ecochain.analysis_module.predictive_analytics import PredictiveAnalytics
+
+
+def integer_id_history(n_series=3, n_days=60, seed=0):
+    """Long-format history keyed by integer operation IDs"""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range("2025-01-01", periods=n_days, freq="D")
+    return pd.DataFrame({
+        "operation_id": np.repeat(np.arange(n_series), n_days),
+        "date": np.tile(days, n_series),
+        "score": np.clip(60 + rng.normal(0, 3, n_series * n_days), 1, 100)
+    })
+
+
+def test_cache_reload_finds_integer_operation_ids(tmp_path):
+    path = str(tmp_path / "fits.json")
+    history = integer_id_history()
+
+    first = PredictiveAnalytics()
+    first.forecast_cache = HoltWintersCache(path)
+    expected = first.forecast_batch(history, 14, method="holt_winters")
+
+    reloaded = PredictiveAnalytics()
+    reloaded.forecast_cache = HoltWintersCache(path)
+    assert reloaded.forecast_cache.get(0) is not None
+    forecasts = reloaded.forecast_batch(history, 14, method="holt_winters")
+
+    assert reloaded.forecast_cache.stats == {"cached": 3, "extended": 0, "fitted": 0}
+    pd.testing.assert_frame_equal(forecasts, expected)
@@ -0,0 +1,103 @@
+"""
+Tests for the ML sustainability scorer.
+"""
+
+import numpy as np
+import pytest
+
+from ecochain.analysis_module.ml_scoring import MLSustainabilityScorer
+
+
+@pytest.fixture(scope="module")
+def trained_scorer():
+    scorer = MLSustainabilityScorer(n_jobs=None)
+    metrics = scorer.train(scorer.generate_training_data(500, seed=0), parallel_stages=False)
+    assert "error" not in metrics
+    return scorer
+
+
+@pytest.mark.parametrize("trained", [False, True])
+def test_batch_scores_match_single_scores(trained_scorer, trained, random_operations):
+    scorer = trained_scorer if trained else MLSustainabilityScorer()
+    operations, carbon_rows = random_operations(100)
+
+    batch = scorer.score_operations_batch(operations, carbon_rows, chunk_size=32)
+    single = [scorer.score_operation(op, carbon) for op, carbon in zip(operations, carbon_rows)]
+
+    assert batch == single
+
+
+def test_fast_inference_scores_single_rows_only(random_operations):
+    scorer = MLSustainabilityScorer(n_jobs=None, fast_inference=True)
+    scorer.train(scorer.generate_training_data(300, seed=1), parallel_stages=False)
+    operations, carbon_rows = random_operations(20)
+
+    batch = scorer.score_operations_batch(operations, carbon_rows)
+    assert scorer._engine is None
+
+    single = [scorer.score_operation(op, carbon) for op, carbon in zip(operations, carbon_rows)]
+    assert scorer._engine is not None
+    assert [r["sustainability_score"] for r in single] == pytest.approx(
+        [r["sustainability_score"] for r in batch])
+    assert [r["is_anomaly"] for r in single] == [r["is_anomaly"] for r in batch]
+
+
+@pytest.mark.parametrize("bad_value", ["high", "12", None, [1.0]])
+def test_row_with_non_numeric_value_falls_back_to_single_scoring(trained_scorer, bad_value, random_operations):
+    operations, carbon_rows = random_operations(3)
+    carbon_rows[1]["renewable_energy_percentage"] = bad_value
+
+    _, valid = trained_scorer.prepare_features_batch(operations, carbon_rows)
+    results = trained_scorer.score_operations_batch(operations, carbon_rows)
+
+    assert valid.tolist() == [True, False, True]
+    assert results[1] == trained_scorer.score_operation(operations[1], carbon_rows[1])
+    assert results[1]["sustainability_tier"] == "ERROR"
+    assert results[0] == trained_scorer.score_operation(operations[0], carbon_rows[0])
+    assert results[2] == trained_scorer.score_operation(operations[2], carbon_rows[2])
+
+
+def test_full_retrain_after_incremental_training_starts_from_default_size():
+    scorer = MLSustainabilityScorer(n_jobs=None)
+    data = scorer.generate_training_data(200, seed=1)
+
+    assert scorer.train(data, parallel_stages=False)["n_estimators"] == 100
+    assert scorer.train(data, incremental=True, additional_estimators=20, parallel_stages=False)["n_estimators"] == 120
+    metrics = scorer.train(data, parallel_stages=False)
+
+    assert not metrics["incremental"] and metrics["n_estimators"] == 100
+    assert scorer.anomaly_detector.n_estimators == 100
+    assert len(scorer.scoring_pipeline.named_steps["model"].estimators_) == 100
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_failed_training_keeps_the_trained_model(incremental):
+    scorer = MLSustainabilityScorer(n_jobs=None)
+    scorer.train(scorer.generate_training_data(200, seed=1), parallel_stages=False)
+    operation, carbon = {"id": "op", "location": "Norway"}, {"renewable_energy_percentage": 80.0}
+    expected = scorer.score_operation(operation, carbon)
+
+    result = scorer.train([{"features": [1, 2, 3, 4, 5, 6], "score": "x"}] * 10, incremental=incremental)
+
+    assert "error" in result
+    assert scorer.score_operation(operation, carbon) == expected
+    assert scorer.scoring_pipeline.named_steps["model"].n_estimators == 100
+    assert scorer.anomaly_detector.n_estimators == 100
+
+
+def test_training_data_is_deterministic_per_seed():
+    scorer = MLSustainabilityScorer(n_jobs=None)
+    data = scorer.generate_training_data(1000, seed=7)
+    again = scorer.generate_training_data(1000, seed=7)
+    other = scorer.generate_training_data(1000, seed=8)
+
+    assert data.features.shape == (1000, 6) and data.scores.shape == (1000,)
+    np.testing.assert_array_equal(data.features, again.features)
+    np.testing.assert_array_equal(data.scores, again.scores)
+    assert not np.array_equal(data.features, other.features)
+    assert data.features.min() >= 0.0 and data.features.max() <= 1.0
+    assert data.scores.min() >= 0.0 and data.scores.max() <= 100.0
+
+    records = scorer.generate_training_data(1000, seed=7, as_records=True)
+    np.testing.assert_array_equal(np.stack([r["features"] for r in records]), data.features)
+    assert [r["score"] for r in records] == data.scores.tolist()
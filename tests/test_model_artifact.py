@@ -0,0 +1,58 @@
+"""
+Tests for saving and loading ML models as artifacts.
+"""
+
+import numpy as np
+import pytest
+
+from ecochain.analysis_module.ml_scoring import MLSustainabilityScorer
+from ecochain.analysis_module.model_artifact import PackedRegressor, is_artifact
+
+
+@pytest.fixture(scope="module")
+def trained_scorer():
+    scorer = MLSustainabilityScorer(n_jobs=None)
+    scorer.train(scorer.generate_training_data(500, seed=0), parallel_stages=False)
+    return scorer
+
+
+@pytest.fixture
+def features():
+    return np.random.default_rng(1).uniform(0, 1, (300, 6))
+
+
+def test_artifact_round_trip_reproduces_sklearn_predictions(trained_scorer, features, tmp_path):
+    path = str(tmp_path / "model.ecomodel")
+    assert trained_scorer.save_model(path)
+    assert is_artifact(path)
+
+    loaded = MLSustainabilityScorer(path, allow_pickle=False)
+
+    assert isinstance(loaded.scoring_pipeline, PackedRegressor)
+    np.testing.assert_allclose(loaded.scoring_pipeline.predict(features),
+                               trained_scorer.scoring_pipeline.predict(features), rtol=1e-12)
+    np.testing.assert_allclose(loaded.anomaly_detector.score_samples(features),
+                               trained_scorer.anomaly_detector.score_samples(features), rtol=1e-12)
+    assert np.array_equal(loaded.anomaly_detector.predict(features), trained_scorer.anomaly_detector.predict(features))
+
+
+def test_incremental_training_of_artifact_model_fails(trained_scorer, tmp_path):
+    path = str(tmp_path / "model.ecomodel")
+    trained_scorer.save_model(path)
+    loaded = MLSustainabilityScorer(path, n_jobs=None)
+
+    result = loaded.train(loaded.generate_training_data(100, seed=2), incremental=True)
+
+    assert "error" in result
+    assert isinstance(loaded.scoring_pipeline, PackedRegressor)
+
+
+def test_pickle_model_can_be_extended(trained_scorer, tmp_path):
+    path = str(tmp_path / "model.pkl")
+    assert trained_scorer.save_model(path, format="pickle")
+    loaded = MLSustainabilityScorer(path, n_jobs=None)
+
+    result = loaded.train(loaded.generate_training_data(100, seed=2), incremental=True,
+                          additional_estimators=10, parallel_stages=False)
+
+    assert result["incremental"] and result["n_estimators"] == 110
@@ -0,0 +1,73 @@
+"""
+Tests for request eviction and the on-disk request archive.
+"""
+
+import json
+import threading
+
+from ecochain.oracles.archive import ArchiveIndex
+
+
+def test_archive_is_written_without_holding_the_network_lock(make_network, tmp_path, monkeypatch):
+    network = make_network({"archive_file": str(tmp_path / "archive.jsonl"), "retention_max_requests": 10})
+    request_ids = [network.submit_request("carbon_intensity", {"region": i}, "tester") for i in range(3)]
+    network.retention_max_requests = 1
+    index_add = network._archive_index.add
+    lock_free = []
+
+    def add(entries, indexed_bytes):
+        # Another thread can take the network lock while the index is written
+        def probe():
+            acquired = network._lock.acquire(timeout=1.0)
+            if acquired:
+                network._lock.release()
+            lock_free.append(acquired)
+
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+        assert all(network.get_request_status(request_id)["status"] == "FINALIZED" for request_id, _ in entries)
+        index_add(entries, indexed_bytes)
+
+    monkeypatch.setattr(network._archive_index, "add", add)
+    swept = network.sweep()
+
+    assert swept["archived"] == 2 and lock_free == [True]
+    assert [network.get_request_status(request_id).get("archived", False) for request_id in request_ids] == [
+        True, True, False]
+
+
+def test_evicted_requests_are_read_back_from_the_archive(make_network, tmp_path):
+    archive_file = tmp_path / "archive.jsonl"
+    network = make_network({"archive_file": str(archive_file), "retention_max_requests": 10})
+    request_ids = [network.submit_request("carbon_intensity", {"region": i}, "tester") for i in range(3)]
+    statuses = [network.get_request_status(request_id) for request_id in request_ids]
+    network.retention_max_requests = 1
+    network.sweep()
+
+    assert len(archive_file.read_text().splitlines()) == 2
+    for request_id, status in zip(request_ids[:2], statuses):
+        archived = network.get_request_status(request_id)
+        assert archived.pop("archived") is True
+        assert archived == status
+    assert network.get_request_status("missing") == {"success": False, "error": "Request not found"}
+
+
+def test_archive_index_survives_reopen_and_catches_up(tmp_path):
+    archive_file = tmp_path / "archive.jsonl"
+    lines = [json.dumps({"request_id": f"r{i}"}).encode() + b"\n" for i in range(4)]
+    offsets = [sum(len(line) for line in lines[:i]) for i in range(4)]
+    archive_file.write_bytes(b"".join(lines[:2]))
+
+    index = ArchiveIndex(str(archive_file))
+    assert index.count == 2 and index.get("r1") == offsets[1]
+    index.close()
+
+    # Lines appended while the index was closed, plus a partially written one
+    with open(archive_file, "ab") as f:
+        f.write(b"".join(lines[2:]) + b'{"request_id": "r4"')
+    index = ArchiveIndex(str(archive_file))
+    assert index.count == 4
+    assert [index.get(f"r{i}") for i in range(4)] == offsets
+    assert index.get("r4") is None and index.get("missing") is None
+    index.close()
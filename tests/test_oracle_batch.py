@@ -0,0 +1,62 @@
+"""
+Tests for batched request submission and finalization.
+"""
+
+import pytest
+
+from ecochain.oracles.data_provider import DataProvider
+
+
+class RegionProvider(DataProvider):
+    """Provider whose value depends on the requested region"""
+
+    def __init__(self, name, offset):
+        super().__init__(name, ["carbon_intensity"], {})
+        self.offset = offset
+        self.batch_calls = 0
+
+    def fetch_data(self, data_type, parameters):
+        return 100.0 + parameters["region"] + self.offset
+
+    def fetch_data_batch(self, data_type, parameters_list):
+        self.batch_calls += 1
+        return super().fetch_data_batch(data_type, parameters_list)
+
+
+def region_network(make_network, monkeypatch, method):
+    """Build a network of region providers with distinct, frozen reputations"""
+    network = make_network({"auto_finalize": False, "aggregation_method": method}, values=())
+    providers = [RegionProvider(f"provider-{i}", offset) for i, offset in enumerate((-4.0, 0.0, 3.0))]
+    for i, provider in enumerate(providers):
+        provider.set_submit_callback(network.submit_response)
+        network.register_provider(provider)
+        network.reputation_system.update_score(provider.provider_id, 10.0 * i)
+    # Keep weights identical between the sequential and the batched pass
+    monkeypatch.setattr(network, "_update_reputations", lambda responses, result: None)
+    return network, providers
+
+
+@pytest.mark.parametrize("method", ["mean", "weighted_mean", "median"])
+def test_batch_finalize_matches_sequential_finalize(make_network, monkeypatch, method):
+    items = [("carbon_intensity", {"region": i}) for i in range(20)]
+    sequential, _ = region_network(make_network, monkeypatch, method)
+    batched, providers = region_network(make_network, monkeypatch, method)
+
+    sequential_ids = [sequential.submit_request(data_type, parameters, "tester") for data_type, parameters in items]
+    expected = [sequential.finalize_request(request_id) for request_id in sequential_ids]
+    batched_ids = batched.submit_requests_batch(items, "tester")
+    results = batched.finalize_requests_batch(batched_ids)
+
+    assert [provider.batch_calls for provider in providers] == [1, 1, 1]
+    assert all(result["success"] for result in expected + results)
+    assert [result["result"] for result in results] == pytest.approx([result["result"] for result in expected])
+    assert [result["request_id"] for result in results] == batched_ids
+
+
+def test_batch_submit_auto_finalizes_every_request(make_network):
+    network = make_network(values=(90.0, 100.0, 110.0))
+    request_ids = network.submit_requests_batch([("carbon_intensity", {"region": i}) for i in range(5)], "tester")
+
+    statuses = [network.get_request_status(request_id) for request_id in request_ids]
+    assert [status["status"] for status in statuses] == ["FINALIZED"] * 5
+    assert all(status["result"] == pytest.approx(100.0) for status in statuses)
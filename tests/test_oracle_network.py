@@ -0,0 +1,138 @@
+"""
+Tests for oracle request dispatch, verification and finalization.
+"""
+
+import time
+
+import pytest
+
+from ecochain.oracles.reputation_system import ReputationSystem
+
+
+def wait_for_status(network, request_id, status, timeout=5.0):
+    """Poll a request until it reaches a status or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if network.get_request_status(request_id)["status"] == status:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.parametrize("verification_mode", ["inline", "background"])
+def test_request_finalizes_once_enough_responses_are_verified(make_network, verification_mode):
+    network = make_network({"verification_mode": verification_mode}, values=(100.0, 110.0, 120.0))
+
+    request_id = network.submit_request("carbon_intensity", {}, "tester", min_providers=3)
+
+    assert wait_for_status(network, request_id, "FINALIZED")
+    status = network.get_request_status(request_id)
+    assert status["response_count"] == 3
+    assert 100.0 <= status["result"] <= 120.0
+
+
+def test_request_stays_pending_without_enough_responses(make_network):
+    network = make_network(values=(100.0, 100.0))
+
+    request_id = network.submit_request("carbon_intensity", {}, "tester", min_providers=3)
+
+    status = network.get_request_status(request_id)
+    assert (status["status"], status["response_count"]) == ("PENDING", 2)
+
+
+def test_duplicate_responses_are_rejected(make_network):
+    network = make_network(values=(100.0, 100.0))
+    request_id = network.submit_request("carbon_intensity", {}, "tester", min_providers=5)
+    provider_id = next(iter(network.data_providers))
+
+    assert not network.submit_response(request_id, provider_id, 50.0)
+    assert network.get_request_status(request_id)["response_count"] == 2
+
+
+def test_responder_count_finalizes_once_enough_distinct_providers_respond(make_network):
+    network = make_network(values=(100.0, 100.0, 100.0))
+    first_provider, *_, late_provider = network.data_providers
+    # Below the request's reputation floor, so it is not notified
+    network.reputation_system.update_score(late_provider, -40.0)
+    request_id = network.submit_request("carbon_intensity", {}, "tester", min_providers=3, min_reputation=50.0)
+
+    # A duplicate neither counts towards min_providers nor finalizes the request
+    assert not network.submit_response(request_id, first_provider, 100.0)
+    status = network.get_request_status(request_id)
+    assert (status["status"], status["response_count"]) == ("PENDING", 2)
+
+    assert network.submit_response(request_id, late_provider, 100.0)
+    status = network.get_request_status(request_id)
+    assert (status["status"], status["response_count"]) == ("FINALIZED", 3)
+    assert not network.submit_response(request_id, late_provider, 100.0)
+
+
+def test_concurrent_dispatch_finalizes_without_waiting_for_slow_providers(make_network):
+    network = make_network(
+        {"dispatch_mode": "concurrent", "provider_timeout": 0.2},
+        values=(100.0, 100.0, 100.0), delays=(0.0, 0.0, 1.0)
+    )
+
+    start = time.monotonic()
+    request_id = network.submit_request("carbon_intensity", {}, "tester", min_providers=2)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.9
+    assert wait_for_status(network, request_id, "FINALIZED")
+    assert network.get_request_status(request_id)["response_count"] == 2
+
+    # The slow provider's answer arrives after its timeout and is not counted
+    time.sleep(1.0)
+    assert network.get_request_status(request_id)["response_count"] == 2
+
+
+@pytest.mark.parametrize("dispatch_mode", ["sequential", "concurrent"])
+def test_dispatch_modes_collect_every_provider_response(make_network, dispatch_mode):
+    network = make_network(
+        {"dispatch_mode": dispatch_mode, "provider_timeout": 5.0},
+        values=(100.0, 110.0, 120.0), delays=(0.3, 0.3, 0.3)
+    )
+
+    start = time.monotonic()
+    request_id = network.submit_request("carbon_intensity", {}, "tester", min_providers=3)
+    elapsed = time.monotonic() - start
+
+    # Sequential dispatch waits for each provider in turn, concurrent for the slowest
+    if dispatch_mode == "sequential":
+        assert elapsed >= 0.9
+    else:
+        assert elapsed < 0.8
+    assert wait_for_status(network, request_id, "FINALIZED")
+    assert network.get_request_status(request_id)["response_count"] == 3
+
+
+
+def listed_names(network, min_reputation=0.0):
+    return [p["name"] for p in network.list_providers(min_reputation)]
+
+
+def test_list_providers_follows_reputation_changes(make_network):
+    network = make_network(values=(100.0, 100.0, 100.0, 100.0))
+    ids = {provider.name: provider_id for provider_id, provider in network.data_providers.items()}
+    reputation = network.reputation_system
+    for name, delta in [("provider-0", -30.0), ("provider-1", 20.0), ("provider-2", -10.0)]:
+        reputation.update_score(ids[name], delta)
+
+    assert listed_names(network) == ["provider-1", "provider-3", "provider-2", "provider-0"]
+    assert listed_names(network, 45.0) == ["provider-1", "provider-3"]
+
+    reputation.update_score(ids["provider-0"], 60.0)
+    network.remove_provider(ids["provider-1"])
+    assert listed_names(network, 40.0) == ["provider-0", "provider-3", "provider-2"]
+    reputations = [p["reputation"] for p in network.list_providers()]
+    assert reputations == sorted(reputations, reverse=True)
+
+
+def test_list_providers_reindexes_a_replaced_reputation_system(make_network):
+    network = make_network(values=(100.0, 100.0))
+    ids = {provider.name: provider_id for provider_id, provider in network.data_providers.items()}
+    network.reputation_system = ReputationSystem({"default_score": 10.0})
+    network.reputation_system.update_score(ids["provider-1"], 5.0)
+
+    assert [(p["name"], p["reputation"]) for p in network.list_providers(12.0)] == [("provider-1", 15.0)]
+    assert listed_names(network) == ["provider-1", "provider-0"]
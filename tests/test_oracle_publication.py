@@ -0,0 +1,65 @@
+"""
+Tests for on-chain publication of oracle results.
+"""
+
+import json
+
+import pytest
+
+from ecochain.oracles.publication import merkle_tree, verify_merkle_proof
+
+
+@pytest.mark.parametrize("count", [1, 3])
+def test_merkle_mode_commits_one_root_per_flush(make_network, adapter, count):
+    network = make_network({"publication_mode": "merkle", "publication_batch_size": 10})
+    network.connect_blockchain("eth", adapter, "0xabc")
+    values = [100.0 + 10 * i for i in range(count)]
+    request_ids = []
+    for i, value in enumerate(values):
+        for provider in network.data_providers.values():
+            provider.value = value
+        request_ids.append(network.submit_request("carbon_intensity", {"region": i}, "tester"))
+
+    for request_id in request_ids:
+        assert network.queue_publication(request_id, "eth")["status"] == "QUEUED"
+    assert adapter.calls == []
+    results = network.flush_publications("eth")
+
+    assert [function_name for function_name, _ in adapter.calls] == ["commitResultsRoot"]
+    root, size, _ = adapter.calls[0][1]
+    assert size == count
+    assert merkle_tree([results[request_id]["encoded"] for request_id in request_ids])[0] == root
+    for request_id, value in zip(request_ids, values):
+        result = results[request_id]
+        assert result["success"] and result["merkle_root"] == root
+        assert json.loads(result["encoded"])["result"] == pytest.approx(value)
+        assert verify_merkle_proof(result["encoded"], result["merkle_proof"], root)
+        assert network.get_publication_status(request_id) == result
+
+    tampered = results[request_ids[0]]["encoded"].replace("request_id", "request-id")
+    assert not verify_merkle_proof(tampered, results[request_ids[0]]["merkle_proof"], root)
+
+
+def test_multi_value_mode_submits_queued_results_together(make_network, adapter):
+    network = make_network({"publication_batch_size": 10})
+    network.connect_blockchain("eth", adapter, "0xabc")
+    request_ids = [network.submit_request("carbon_intensity", {}, "tester") for _ in range(3)]
+
+    for request_id in request_ids:
+        network.queue_publication(request_id, "eth")
+    results = network.flush_publications()
+
+    assert [(function_name, args[0]) for function_name, args in adapter.calls] == [("submitResults", request_ids)]
+    assert all(results[request_id]["success"] for request_id in request_ids)
+    assert [json.loads(encoded)["request_id"] for encoded in adapter.calls[0][1][1]] == request_ids
+
+
+def test_multi_value_mode_submits_single_result(make_network, adapter):
+    network = make_network()
+    network.connect_blockchain("eth", adapter, "0xabc")
+    request_id = network.submit_request("carbon_intensity", {}, "tester")
+
+    result = network.publish_result(request_id, "eth")
+
+    assert result["success"] and "merkle_root" not in result
+    assert [(function_name, args[0]) for function_name, args in adapter.calls] == [("submitResult", request_id)]
@@ -0,0 +1,141 @@
+"""
+Tests for sustainability score forecasting.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from ecochain.analysis_module.predictive_analytics import PredictiveAnalytics, _lagged_correlations
+
+HORIZON_DAYS = 30
+
+
+def synthetic_history(n_series=12, n_days=90, seed=0):
+    """Long-format score history with trends, weekly seasonality, noise and missing days"""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range("2025-01-01", periods=n_days, freq="D")
+    rows = []
+    for k in range(n_series):
+        level, slope = rng.uniform(30, 80), rng.uniform(-0.2, 0.2)
+        for i, day in enumerate(days):
+            if rng.random() < 0.1:
+                continue
+            score = level + slope * i + 3 * np.sin(2 * np.pi * i / 7) + rng.normal(0, 2)
+            rows.append({"operation_id": f"op-{k}", "date": day.strftime("%Y-%m-%d"), "score": float(np.clip(score, 1, 100))})
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("method", ["simple", "holt_winters"])
+def test_batch_forecasts_match_single_forecasts(method):
+    history = synthetic_history()
+
+    batch = PredictiveAnalytics().forecast_batch(history, HORIZON_DAYS, method=method)
+
+    predictor = PredictiveAnalytics()
+    for operation_id, group in history.groupby("operation_id"):
+        single = predictor.forecast_sustainability(
+            group[["date", "score"]].to_dict("records"), HORIZON_DAYS, method=method, operation_id=operation_id
+        )
+        rows = batch[batch["operation_id"] == operation_id]
+        assert rows["date"].dt.strftime("%Y-%m-%d").tolist() == [point["date"] for point in single["forecast"]]
+        for column in ("forecasted_score", "lower_bound", "upper_bound"):
+            np.testing.assert_allclose(rows[column].to_numpy(), [point[column] for point in single["forecast"]],
+                                       rtol=0, atol=1e-9)
+
+
+def test_batch_forecasts_do_not_depend_on_workers():
+    history = synthetic_history()
+
+    serial = PredictiveAnalytics().forecast_batch(history, HORIZON_DAYS)
+    parallel = PredictiveAnalytics().forecast_batch(history, HORIZON_DAYS, workers=2, chunk_size=5)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def looped_forecast(entries, horizon_days, params):
+    """Reference of the simple forecast as a per-day loop with a DataFrame filter per step"""
+    rows = []
+    for entry in entries:
+        date = entry.get("date")
+        if isinstance(date, str):
+            try:
+                date = datetime.fromisoformat(date)
+            except ValueError:
+                continue
+        elif not isinstance(date, datetime):
+            continue
+        score = entry.get("score") or entry.get("sustainability_score")
+        if score is not None:
+            rows.append({"date": date, "score": float(score)})
+
+    df = pd.DataFrame(rows).sort_values("date")
+    avg_trend = df["score"].diff().fillna(0).mean() * params["trend_damping"]
+    last_score = df["score"].ewm(alpha=0.3).mean().iloc[-1]
+    last_date = df["date"].iloc[-1]
+    values = []
+    for i in range(horizon_days):
+        next_score = last_score + avg_trend
+        if len(df) >= params["seasonality_period"]:
+            day = last_date + timedelta(days=i + 1)
+            seasonal = df[df["date"].dt.weekday == day.weekday()]["score"]
+            if len(seasonal) > 0:
+                next_score *= seasonal.mean() / df["score"].mean()
+        last_score = max(0, min(100, next_score))
+        values.append(last_score)
+    return [(last_date + timedelta(days=i + 1)).strftime("%Y-%m-%d") for i in range(horizon_days)], values
+
+
+def test_simple_forecast_matches_the_per_day_loop():
+    history = synthetic_history(n_series=1, n_days=60, seed=3)
+    entries = history[["date", "score"]].to_dict("records")
+    # Mixed date forms, plus entries without a usable date or score
+    for entry in entries[::5]:
+        entry["date"] = datetime.fromisoformat(entry["date"])
+    for entry in entries[1::9]:
+        entry["sustainability_score"] = entry.pop("score")
+    entries += [{"date": "not a date", "score": 10.0}, {"date": None, "score": 10.0},
+                {"date": 20250301, "score": 10.0}, {"date": "2025-03-02", "score": None}]
+    predictor = PredictiveAnalytics()
+
+    forecast = predictor.forecast_sustainability(entries, 365, method="simple")["forecast"]
+    dates, values = looped_forecast(entries, 365, predictor.forecast_params)
+
+    assert [point["date"] for point in forecast] == dates
+    assert [point["forecasted_score"] for point in forecast] == pytest.approx(values, abs=0.005)
+
+
+def test_lagged_correlations_match_pearsonr_per_lag():
+    rng = np.random.default_rng(4)
+    n = 200
+    x = np.cumsum(rng.normal(0, 1, n)) + 50
+    y = np.roll(x, 7) * 0.5 + rng.normal(0, 1, n)
+    x[rng.random(n) < 0.15] = np.nan
+    y[rng.random(n) < 0.15] = np.nan
+    lags = np.arange(-30, 91)
+
+    correlation, p_value, count = _lagged_correlations(x, y, lags)
+
+    for i, lag in enumerate(lags):
+        leading = x[:n - lag] if lag >= 0 else x[-lag:]
+        lagging = y[lag:] if lag >= 0 else y[:n + lag]
+        both = ~np.isnan(leading) & ~np.isnan(lagging)
+        expected = stats.pearsonr(leading[both], lagging[both])
+        assert count[i] == both.sum()
+        assert correlation[i] == pytest.approx(expected[0], abs=1e-9)
+        assert p_value[i] == pytest.approx(expected[1], rel=1e-6, abs=1e-12)
+    assert lags[np.nanargmax(correlation)] == 7
+
+
+def test_lagged_correlations_are_nan_without_enough_varying_pairs():
+    x = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    y = np.array([5.0, 5.0, 5.0, 1.0, 2.0, 3.0])
+
+    correlation, p_value, count = _lagged_correlations(x, y, np.array([-3, 0, 3, 4, 6]))
+
+    assert count.tolist() == [3, 6, 3, 2, 0]
+    assert np.isnan(correlation[[0, 3, 4]]).all() and np.isnan(p_value[[0, 3, 4]]).all()
+    assert correlation[2] == pytest.approx(1.0)
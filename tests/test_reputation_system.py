@@ -0,0 +1,182 @@
+"""
+Tests for the oracle reputation system.
+"""
+
+import json
+import statistics
+import time
+
+import numpy as np
+import pytest
+
+from ecochain.oracles import reputation_system
+from ecochain.oracles.reputation_system import EntityRecord, HistoryLog, ReputationSystem
+
+
+@pytest.fixture
+def make_system(tmp_path):
+    """Build reputation systems persisting under a temporary directory, closed after the test"""
+    systems = []
+
+    def make(**config):
+        config.setdefault("data_file", str(tmp_path / "reputation.json"))
+        system = ReputationSystem(config)
+        systems.append(system)
+        return system
+
+    yield make
+    for system in systems:
+        system.close()
+
+
+def test_thresholds_at_or_below_zero_with_negative_minimum_score(make_system):
+    system = make_system(min_score=-10.0)
+    for entity_id, score in [("a", 5.0), ("b", -3.0), ("c", 0.0), ("d", -8.0), ("e", 20.0)]:
+        system.add_entity(entity_id, score)
+
+    assert system.get_entities_above_threshold(0.0) == ["e", "a", "c"]
+    assert system.get_entities_above_threshold(-5.0) == ["e", "a", "c", "b"]
+    assert system.get_entities_above_threshold(-10.0) == ["e", "a", "c", "b", "d"]
+    assert system.get_entities_above_threshold(6.0) == ["e"]
+
+
+@pytest.mark.parametrize("storage", ["json", "sqlite"])
+def test_updates_are_written_behind_until_flushed(make_system, tmp_path, storage):
+    data_file = tmp_path / "reputation.json"
+    system = make_system(storage=storage, flush_interval=0, flush_threshold=1000)
+    system.add_entity("a", 40.0)
+    system.add_entity("b", 60.0)
+    system.update_score("a", 5.0)
+    system.flush()
+    system.update_score("b", -10.0)
+
+    assert make_system(storage=storage).get_score("b") == pytest.approx(60.0)
+    system.flush()
+    reloaded = make_system(storage=storage)
+    assert reloaded.get_score("a") == pytest.approx(45.0)
+    assert reloaded.get_score("b") == pytest.approx(50.0)
+    assert data_file.exists() and not (tmp_path / "reputation.json.tmp").exists()
+
+
+def test_flush_threshold_wakes_the_background_flusher(make_system, tmp_path):
+    data_file = tmp_path / "reputation.json"
+    system = make_system(flush_interval=0, flush_threshold=3)
+    for entity_id in "abc":
+        system.add_entity(entity_id)
+
+    deadline = time.monotonic() + 5.0
+    while not data_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sorted(json.loads(data_file.read_text())) == ["a", "b", "c"]
+
+
+def test_failed_flush_keeps_the_previous_file_and_retries(make_system, tmp_path, monkeypatch):
+    data_file = tmp_path / "reputation.json"
+    system = make_system(flush_interval=0, flush_threshold=1000)
+    system.add_entity("a", 40.0)
+    system.flush()
+    previous = data_file.read_text()
+
+    def fail(fd):
+        raise OSError("disk full")
+
+    system.update_score("a", 5.0)
+    monkeypatch.setattr(reputation_system.os, "fsync", fail)
+    system.flush()
+    assert data_file.read_text() == previous
+
+    monkeypatch.undo()
+    system.flush()
+    assert json.loads(data_file.read_text())["a"]["score"] == pytest.approx(45.0)
+
+
+def test_close_flushes_pending_changes(make_system):
+    system = make_system(flush_interval=0, flush_threshold=1000)
+    system.add_entity("a", 70.0)
+    system.close()
+
+    assert make_system().get_score("a") == pytest.approx(70.0)
+
+
+def test_lazy_decay_matches_eager_decay(monkeypatch):
+    day = 24 * 3600
+    clock = [1000 * day]
+    monkeypatch.setattr(reputation_system.time, "time", lambda: clock[0])
+    system = ReputationSystem({"time_decay_factor": 0.9})
+    rng = np.random.default_rng(0)
+
+    # Reference model: decay every score on each day that passes, as decay_scores() used to
+    expected = {f"e{i}": float(rng.uniform(1, 100)) for i in range(10)}
+    for entity_id, score in expected.items():
+        system.add_entity(entity_id, score)
+
+    for _ in range(30):
+        days = int(rng.integers(0, 4))
+        clock[0] += days * day
+        expected = {entity_id: score * 0.9 ** days for entity_id, score in expected.items()}
+        entity_id = f"e{rng.integers(0, 10)}"
+        delta = float(rng.uniform(-10, 10))
+        expected[entity_id] = max(0.0, min(100.0, expected[entity_id] + delta))
+        system.update_score(entity_id, delta)
+
+        ranked = sorted(expected, key=expected.get, reverse=True)
+        assert {e: system.get_score(e) for e in expected} == pytest.approx(expected)
+        assert system.get_entities_above_threshold(20.0) == [e for e in ranked if expected[e] >= 20.0]
+        assert [entity["entity_id"] for entity in system.get_top_entities(3)] == ranked[:3]
+
+
+@pytest.mark.parametrize("min_score", [0.0, 5.0])
+def test_running_stats_match_a_full_recompute(monkeypatch, min_score):
+    day = 24 * 3600
+    clock = [1000 * day]
+    monkeypatch.setattr(reputation_system.time, "time", lambda: clock[0])
+    system = ReputationSystem({"time_decay_factor": 0.9, "min_score": min_score})
+    rng = np.random.default_rng(1)
+    for i in range(50):
+        system.add_entity(f"e{i}", float(rng.uniform(0, 100)))
+
+    for step in range(200):
+        clock[0] += int(rng.integers(0, 2)) * day
+        entity_id = f"e{rng.integers(0, 60)}"
+        if step % 7 == 0:
+            system.remove_entity(entity_id)
+        else:
+            system.update_score(entity_id, float(rng.uniform(-20, 20)))
+
+        scores = [system.get_score(entity_id) for entity_id in system.entities]
+        stats = system.get_stats()
+        assert stats["entity_count"] == len(scores)
+        assert stats["avg_score"] == pytest.approx(statistics.mean(scores))
+        assert stats["median_score"] == pytest.approx(statistics.median(scores))
+        assert stats["score_stdev"] == pytest.approx(statistics.stdev(scores), abs=1e-6)
+        assert (stats["min_score"], stats["max_score"]) == pytest.approx((min(scores), max(scores)))
+
+
+def test_history_log_wraps_around_keeping_the_newest_entries():
+    log = HistoryLog(4)
+    appended = []
+    for i in range(11):
+        details = [None, {"accuracy": 0.5 + i / 100, "consistency": None},
+                   {"accuracy": 0.9, "consistency": 0.8}, {"note": i}][i % 4]
+        entry = {"timestamp": float(i), "old_score": 50.0 + i, "delta": 1.0, "new_score": 51.0 + i,
+                 "reason": ["accuracy", None, f"reason-{i % 2}"][i % 3], "details": details}
+        log.append(**entry)
+        appended.append(entry)
+
+        assert log.entries() == appended[-4:]
+        assert log.entries(last=2) == appended[-2:]
+        assert len(log.other_details) <= 1
+
+    assert HistoryLog(4, appended).entries() == appended[-4:]
+
+
+def test_rolling_consistency_matches_stdev_of_the_window():
+    record = EntityRecord("a", accuracy_history=[0.1, 0.9, 0.4], accuracy_history_size=6)
+    samples = [0.1, 0.9, 0.4]
+    for accuracy in np.random.default_rng(2).uniform(0, 1, 40):
+        samples.append(float(accuracy))
+        window = samples[-EntityRecord.CONSISTENCY_WINDOW:]
+        expected = statistics.stdev(window) if len(window) == EntityRecord.CONSISTENCY_WINDOW else None
+        assert record.add_accuracy(float(accuracy)) == pytest.approx(expected, abs=1e-9)
+
+    assert record.accuracy_history.to_list() == samples[-6:]
@@ -0,0 +1,92 @@
+"""
+Tests for the data provider response cache.
+"""
+
+import threading
+import time
+
+import pytest
+
+from ecochain.oracles import response_cache
+from ecochain.oracles.response_cache import ResponseCache
+
+
+class CountingFetch:
+    """Fetch function that counts calls and can block until released"""
+
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, data_type, parameters):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5.0)
+        if self.error is not None:
+            raise self.error
+        return {"data_type": data_type, "call": self.calls}
+
+
+def test_entries_expire_after_their_data_type_ttl(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(response_cache.time, "time", lambda: clock[0])
+    cache = ResponseCache(default_ttl=60.0, ttls={"energy_mix": 10.0, "live": 0})
+    fetch = CountingFetch()
+
+    first = cache.get_or_fetch("carbon_intensity", {"region": "EU", "hour": 1}, fetch)
+    mix = cache.get_or_fetch("energy_mix", {"region": "EU"}, fetch)
+    clock[0] += 30.0
+    assert cache.get_or_fetch("carbon_intensity", {"hour": 1, "region": "EU"}, fetch) is first
+    assert cache.get_or_fetch("energy_mix", {"region": "EU"}, fetch) is not mix
+    clock[0] += 31.0
+    assert cache.get_or_fetch("carbon_intensity", {"region": "EU", "hour": 1}, fetch) is not first
+    cache.get_or_fetch("live", {}, fetch)
+    cache.get_or_fetch("live", {}, fetch)
+
+    assert fetch.calls == 6
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 4
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    fetch = CountingFetch()
+    for region in ("a", "b", "a", "c"):
+        cache.get_or_fetch("carbon_intensity", {"region": region}, fetch)
+
+    assert cache.lookup("carbon_intensity", {"region": "a"})[0]
+    assert not cache.lookup("carbon_intensity", {"region": "b"})[0]
+    assert cache.get_stats()["evictions"] == 1 and fetch.calls == 3
+
+
+@pytest.mark.parametrize("error", [None, ValueError("upstream error")])
+def test_concurrent_identical_requests_share_one_fetch(error):
+    cache = ResponseCache()
+    fetch = CountingFetch(error)
+    fetch.release.clear()
+    results = []
+
+    def get():
+        try:
+            results.append(cache.get_or_fetch("carbon_intensity", {"region": "EU"}, fetch))
+        except ValueError as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    threads[0].start()
+    assert fetch.started.wait(5.0)
+    for thread in threads[1:]:
+        thread.start()
+    deadline = time.monotonic() + 5.0
+    while cache.get_stats()["coalesced"] < 7 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    fetch.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert fetch.calls == 1 and len(results) == 8
+    assert all(result is results[0] for result in results)
+    # Failed fetches are not cached
+    assert cache.lookup("carbon_intensity", {"region": "EU"})[0] is (error is None)
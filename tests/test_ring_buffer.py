@@ -0,0 +1,20 @@
+"""
+Tests for the shared ring buffer.
+"""
+
+import pytest
+
+from ecochain.ring_buffer import RingBuffer
+
+
+@pytest.mark.parametrize("typecode", [None, "d"])
+def test_ring_buffer_keeps_newest_items_in_order(typecode):
+    buffer = RingBuffer(3, typecode, [1.0, 2.0])
+    for value in (3.0, 4.0, 5.0):
+        buffer.append(value)
+
+    assert buffer.to_list() == [3.0, 4.0, 5.0]
+    assert list(buffer) == [3.0, 4.0, 5.0]
+    assert (buffer[0], buffer[-1], len(buffer), buffer.capacity) == (3.0, 5.0, 3, 3)
+    with pytest.raises(IndexError):
+        buffer[3]
@@ -0,0 +1,48 @@
+"""
+Tests for batch sustainability scoring.
+"""
+
+import numpy as np
+import pytest
+
+from ecochain.analysis_module.sustainability_scorer import SustainabilityScorer
+
+
+def test_batch_scores_match_single_scores(random_operations):
+    scorer = SustainabilityScorer()
+    operations, carbon_rows = random_operations(200)
+
+    batch = scorer.score_multiple_operations(operations, carbon_rows)
+    single = [scorer.score_operation(op, carbon) for op, carbon in zip(operations, carbon_rows)]
+
+    assert batch == single
+
+
+def test_only_rows_with_invalid_values_fall_back_to_single_scoring(monkeypatch, random_operations):
+    scorer = SustainabilityScorer()
+    operations, carbon_rows = random_operations(6)
+    carbon_rows[2]["carbon_footprint_tons_per_day"] = "unknown"
+    carbon_rows[4]["renewable_energy_percentage"] = None
+    expected = [scorer.score_operation(op, carbon) for op, carbon in zip(operations, carbon_rows)]
+
+    single_scored = []
+    score_operation = scorer.score_operation
+
+    def record_single(mining_data, carbon_data):
+        single_scored.append(mining_data["id"])
+        return score_operation(mining_data, carbon_data)
+
+    monkeypatch.setattr(scorer, "score_operation", record_single)
+    results = scorer.score_multiple_operations(operations, carbon_rows)
+
+    assert single_scored == ["op-2", "op-4"]
+    assert results[2]["sustainability_tier"] == "ERROR"
+    assert results == expected
+
+
+@pytest.mark.parametrize("operation_ids", [np.array(["a", "b", "c"]), ["a", "b", "c"]])
+def test_score_batch_sizes_empty_inputs_from_operation_ids(operation_ids):
+    scores = SustainabilityScorer().score_batch({}, operation_ids)
+
+    assert len(scores) == 3
+    assert scores.operation_ids.tolist() == ["a", "b", "c"]
@@ -0,0 +1,77 @@
+"""
+Tests for response signing and batched signature verification.
+"""
+
+import time
+from types import SimpleNamespace
+
+from ecochain.oracles.verification import SignatureVerifier, sign_response, verify_batch
+
+
+def test_verify_batch_checks_signatures_against_keys():
+    signature = sign_response("req-1", {"value": 1.5}, "secret")
+    items = [
+        ("req-1", {"value": 1.5}, signature, "secret"),
+        ("req-1", {"value": 2.5}, signature, "secret"),
+        ("req-1", {"value": 1.5}, signature, "other"),
+        ("req-1", {"value": 1.5}, None, None),
+    ]
+
+    assert verify_batch(items) == [True, False, False, True]
+    assert verify_batch(items, require_signatures=True) == [True, False, False, False]
+
+
+def test_verifier_caches_keys_until_invalidated():
+    lookups = []
+
+    def resolve(provider_id):
+        lookups.append(provider_id)
+        return "secret"
+
+    verifier = SignatureVerifier(resolve, lambda response, result: None)
+    responses = [
+        SimpleNamespace(request_id=f"req-{i}", provider_id="p", data=i, signature=sign_response(f"req-{i}", i, "secret"))
+        for i in range(5)
+    ]
+
+    assert verifier.verify(responses) == [True] * 5
+    assert verifier.verify(responses[:1]) == [True]
+    assert lookups == ["p"]
+
+    verifier.invalidate_key("p")
+    verifier.verify(responses[:1])
+    assert lookups == ["p", "p"]
+
+
+def test_background_verifier_reports_every_response_in_batches():
+    results = {}
+    verifier = SignatureVerifier(lambda provider_id: "secret",
+                                 lambda response, result: results.__setitem__(response.request_id, result),
+                                 batch_size=64, max_wait=0.05)
+    for i in range(100):
+        signature = sign_response(f"req-{i}", i, "secret" if i % 10 else "forged")
+        verifier.submit(SimpleNamespace(request_id=f"req-{i}", provider_id="p", data=i, signature=signature))
+
+    deadline = time.monotonic() + 5.0
+    while len(results) < 100 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    verifier.stop()
+
+    assert [request_id for request_id, ok in results.items() if not ok] == [f"req-{i}" for i in range(0, 100, 10)]
+    assert verifier.get_stats()["batches"] < 100
+
+
+def test_network_rejects_forged_responses_without_counting_them(make_network):
+    network = make_network({"require_signatures": True}, values=(100.0, 100.0, 100.0))
+    for provider in network.data_providers.values():
+        provider.private_key = f"key-{provider.name}"
+    *_, late_provider = network.data_providers
+    # Below the request's reputation floor, so it is not notified
+    network.reputation_system.update_score(late_provider, -40.0)
+    request_id = network.submit_request("carbon_intensity", {}, "tester", min_providers=3, min_reputation=50.0)
+
+    forged = sign_response(request_id, 100.0, "wrong-key")
+    assert network.submit_response(request_id, late_provider, 100.0, signature=forged)
+
+    assert network.get_request_status(request_id)["status"] == "PENDING"
+    assert [r.status for r in network.responses[request_id]] == ["VERIFIED", "VERIFIED", "REJECTED"]